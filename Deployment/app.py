@@ -1,10 +1,8 @@
 from pathlib import Path
-import pandas as pd
-from PIL import Image
 import streamlit as st
 
-from ml_app import run_ml_app
-from eda_app import run_eda_app
+# Page modules, pandas, image assets and the model are imported inside the page renderers so
+# each visitor only pays for the page they open.
 
 st.set_page_config(page_title="Real Estate Price Lab", page_icon="🏙️", layout="wide")
 
@@ -407,12 +405,16 @@ def inject_custom_css() -> None:
 	""", unsafe_allow_html=True)
 
 
-@st.cache_data(show_spinner=False)
-def load_dataset() -> pd.DataFrame:
-	return pd.read_csv(DATA_PATH)
+def load_stats():
+	import region_stats
 
+	return region_stats.load_stats(DATA_PATH)
 
-def render_home(df: pd.DataFrame) -> None:
+
+def render_home() -> None:
+	import assets
+
+	stats = load_stats()
 	st.markdown("<h1 class='page-title'>Real Estate Price Lab</h1>", unsafe_allow_html=True)
 	st.markdown(
 		"<p class='page-subtitle'>A neo-brutalist command center fusing exploratory insights with predictive intelligence for Mumbai's property market.</p>",
@@ -436,13 +438,13 @@ def render_home(df: pd.DataFrame) -> None:
 			unsafe_allow_html=True,
 		)
 	with hero_cols[1]:
-		hero_image = Image.open(IMG_DIR / "Realty_Growth.jpg")
+		hero_image = assets.image_bytes("Realty_Growth.jpg", assets.HERO_WIDTH)
 		st.image(hero_image, caption="Mumbai skyline momentum", use_container_width=True)
 
 	metric_cols = st.columns(3, gap="large")
-	metric_cols[0].metric("Listings analyzed", f"{df.shape[0]:,}")
-	metric_cols[1].metric("Median price (Lakh)", f"{df['Price_Lakh'].median():,.0f}")
-	metric_cols[2].metric("Median area (SqFt)", f"{df['Area_SqFt'].median():,.0f}")
+	metric_cols[0].metric("Listings analyzed", f"{stats.overall['listings']:,}")
+	metric_cols[1].metric("Median price (Lakh)", f"{stats.overall['median_price']:,.0f}")
+	metric_cols[2].metric("Median area (SqFt)", f"{stats.overall['median_area']:,.0f}")
 
 	info_cols = st.columns([2, 1], gap="large")
 	with info_cols[0]:
@@ -494,16 +496,16 @@ def render_about() -> None:
 
 	path_to_html = IMG_DIR / "mumbai_property.html"
 	if path_to_html.exists():
+		import map_embed
+
 		st.markdown("<div class='neobrutalist-card map-card'>", unsafe_allow_html=True)
-		with open(path_to_html, "r", encoding="utf-8") as html_file:
-			html_data = html_file.read()
+		html_data = map_embed.map_html(path_to_html)
 		st.components.v1.html(html_data, height=520, scrolling=True)
 		st.markdown("</div>", unsafe_allow_html=True)
 
 
 def main() -> None:
 	inject_custom_css()
-	df = load_dataset()
 
 	menu = ["Home", "Data Analysis", "Prediction", "About"]
 	if 'page' not in st.session_state:
@@ -521,10 +523,14 @@ def main() -> None:
 		st.markdown("<div class='sidebar-caption'>Sadham Mydeen • Mumbai Lifespaces</div>", unsafe_allow_html=True)
 
 	if choice == "Home":
-		render_home(df)
+		render_home()
 	elif choice == "Data Analysis":
+		from eda_app import run_eda_app
+
 		run_eda_app()
 	elif choice == "Prediction":
+		from ml_app import run_ml_app
+
 		run_ml_app()
 	else:
 		render_about()
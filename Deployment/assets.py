@@ -0,0 +1,96 @@
+"""Display-sized, web-optimised variants of the images in ``IMG/``.
+
+The source charts are up to 6000x6000 px. Each page only needs them at its column width,
+so variants are resized once under ``.cache/img/``, named by the source file's content hash
+and target width, and served as bytes from a process-wide memo.
+
+``st.image`` only forwards JPEG and PNG bytes untouched (anything else is re-encoded to PNG
+on every render), so opaque images become progressive JPEGs and images with transparency
+become 256-colour PNGs, which for these charts are smaller than WebP anyway.
+
+    python assets.py    # pre-generate the gallery and hero variants of every image
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+from PIL import Image
+
+BASE_DIR = Path(__file__).resolve().parent
+IMG_DIR = BASE_DIR / "IMG"
+VARIANT_DIR = BASE_DIR / ".cache" / "img"
+
+# Rendered CSS widths in the wide layout, doubled for high-density screens.
+GALLERY_WIDTH = 760  # one of three gallery columns
+HERO_WIDTH = 960  # 2/5 hero column on the home page
+
+JPEG_QUALITY = 82
+PNG_COLOURS = 256
+
+_lock = threading.Lock()
+_memo: dict[tuple[Path, int, int, int], bytes] = {}
+
+
+def _content_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    return image.mode in ("RGBA", "LA", "P") or "transparency" in image.info
+
+
+def variant_path(source: Path, width: int) -> Path:
+    with Image.open(source) as image:
+        suffix = ".png" if _has_alpha(image) else ".jpg"
+    return VARIANT_DIR / f"{source.stem}-{_content_hash(source)}-{width}w{suffix}"
+
+
+def build_variant(source: Path, width: int) -> Path:
+    """Write the display variant of ``source`` at ``width`` px unless it already exists."""
+    target = variant_path(source, width)
+    if target.exists():
+        return target
+    with Image.open(source) as image:
+        image.draft("RGB", (width, width * image.height // image.width))
+        image = image.convert("RGBA" if _has_alpha(image) else "RGB")
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        if target.suffix == ".png":
+            image = image.quantize(PNG_COLOURS, method=Image.Quantize.FASTOCTREE)
+            image.save(tmp_path, format="PNG", optimize=True)
+        else:
+            image.save(tmp_path, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    os.replace(tmp_path, target)
+    return target
+
+
+def image_bytes(filename: str, width: int) -> bytes:
+    """Return the display-ready bytes for ``IMG/filename`` at ``width`` px."""
+    source = IMG_DIR / filename
+    stat = source.stat()
+    key = (source, stat.st_mtime_ns, stat.st_size, width)
+    with _lock:
+        cached = _memo.get(key)
+    if cached is None:
+        cached = build_variant(source, width).read_bytes()
+        with _lock:
+            _memo[key] = cached
+    return cached
+
+
+def main() -> None:
+    sources = sorted(path for path in IMG_DIR.iterdir() if path.suffix.lower() in (".png", ".jpg", ".jpeg"))
+    for source in sources:
+        for width in (GALLERY_WIDTH, HERO_WIDTH):
+            target = build_variant(source, width)
+            print(f"{source.name} -> {target.name} ({target.stat().st_size / 1024:,.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""Performance benchmarks for the deployment modules.
+
+Run from the ``Deployment`` directory, e.g. ``python -m benchmarks.batch_predict``.
+"""
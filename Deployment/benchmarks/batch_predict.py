@@ -0,0 +1,60 @@
+"""Throughput of ``predictor.predict_batch`` against the per-row ``predict_price`` loop.
+
+The loop assembles and prices one scenario per call, as the prediction lab does per submit.
+It is timed on at most ``LOOP_SAMPLE`` rows and extrapolated for larger portfolios, since
+looping a million single-row ``predict`` calls takes minutes.
+"""
+
+from __future__ import annotations
+
+import time
+import warnings
+
+import numpy as np
+
+import predictor
+
+SIZES = (1_000, 100_000, 1_000_000)
+LOOP_SAMPLE = 2_000
+
+
+def _random_scenarios(rows: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.column_stack([
+        rng.integers(500, 5_000, rows),
+        rng.integers(0, 40, rows),
+        rng.integers(1, 6, rows),
+    ]).astype(float)
+
+
+def _per_row(model, scenarios: np.ndarray) -> np.ndarray:
+    out = np.empty(len(scenarios))
+    for index in range(len(scenarios)):
+        out[index] = predictor.predict_batch(model, scenarios[index:index + 1])[0]
+    return out
+
+
+def main() -> None:
+    # Version and feature-name warnings would otherwise fire once per looped row.
+    warnings.simplefilter("ignore")
+    model = predictor.load_model()
+
+    print(f"{'rows':>10} {'loop rows/s':>14} {'batch rows/s':>14} {'speedup':>9}")
+    for rows in SIZES:
+        scenarios = _random_scenarios(rows)
+
+        sample = scenarios[:LOOP_SAMPLE]
+        start = time.perf_counter()
+        looped = _per_row(model, sample)
+        loop_rate = len(sample) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        batched = predictor.predict_batch(model, scenarios)
+        batch_rate = rows / (time.perf_counter() - start)
+
+        np.testing.assert_allclose(batched[:len(sample)], looped, rtol=1e-9)
+        print(f"{rows:>10,} {loop_rate:>14,.0f} {batch_rate:>14,.0f} {batch_rate / loop_rate:>8,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Per-submit latency of the uncached prediction path versus ``prediction_cache``.
+
+Replays a skewed stream of single-scenario submits drawn from the form's grid (area in
+100 sqft steps, floors 0-30, 1-5 bedrooms; a few popular combinations dominate), then small
+batches against a warm cache (where ``MAX_BATCH_ROWS`` comes from), then a repeated
+10,000-row portfolio through the default cache (which bypasses it) and through a cache that
+keys every row.
+
+    python -m benchmarks.cached_predict
+"""
+
+from __future__ import annotations
+
+import time
+import warnings
+
+import numpy as np
+
+import prediction_cache
+import predictor
+
+SUBMITS = 20_000
+PORTFOLIO_ROWS = 10_000
+SMALL_BATCHES = (1, 2, 4, 8, 16, 32, 64, 256)
+
+
+def _submit_stream(count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    grid = np.array([(area, floor, bedroom) for area in range(500, 5_001, 100)
+                     for floor in range(0, 31) for bedroom in range(1, 6)], dtype=float)
+    weights = 1.0 / np.arange(1, len(grid) + 1) ** 1.1
+    rng.shuffle(grid)
+    return grid[rng.choice(len(grid), count, p=weights / weights.sum())]
+
+
+def _per_call_us(func, rows: np.ndarray, repeats: int, rounds: int = 5) -> float:
+    """Best of ``rounds`` mean call times, so a noisy round does not decide the comparison."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            func(rows)
+        best = min(best, (time.perf_counter() - start) / repeats)
+    return best * 1e6
+
+
+def _timed(func, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    warnings.simplefilter("ignore")
+    loaded = predictor.current_model()
+    cache = prediction_cache.PredictionCache()
+    submits = _submit_stream(SUBMITS)[:, None, :]
+
+    uncached_s = _timed(lambda row: predictor.predict_batch(loaded.model, row), submits)
+    cached_s = _timed(lambda row: prediction_cache.predict(row, loaded, cache), submits)
+    stats = cache.stats()
+    print(f"single submits  uncached {uncached_s / SUBMITS * 1e6:7.1f} us  cached {cached_s / SUBMITS * 1e6:7.1f} us  "
+          f"hit rate {stats.hit_rate:.1%}  ({stats.size:,} entries, {stats.evictions:,} evictions)")
+
+    print(f"\n{'batch rows':>10} {'uncached us':>12} {'warm cache us':>14}   (every row keyed and hit)")
+    for rows in SMALL_BATCHES:
+        batch = _submit_stream(rows, seed=2)
+        cache = prediction_cache.PredictionCache(max_batch_rows=rows)
+        prediction_cache.predict(batch, loaded, cache)
+        repeats = max(20, 2_000 // rows)
+        uncached_us = _per_call_us(lambda batch: predictor.predict_batch(loaded.model, batch), batch, repeats)
+        cached_us = _per_call_us(lambda batch: prediction_cache.predict(batch, loaded, cache), batch, repeats)
+        print(f"{rows:>10,} {uncached_us:>12.1f} {cached_us:>14.1f}")
+
+    portfolio = _submit_stream(PORTFOLIO_ROWS, seed=1)
+    uncached_s = _timed(lambda rows: predictor.predict_batch(loaded.model, rows), [portfolio] * 5)
+    print(f"\n{PORTFOLIO_ROWS:,}-row batch  uncached {uncached_s / 5 * 1e3:6.2f} ms")
+    for label, max_batch_rows in (("default cache", prediction_cache.MAX_BATCH_ROWS), ("keyed cache", PORTFOLIO_ROWS)):
+        cache = prediction_cache.PredictionCache(max_batch_rows=max_batch_rows)
+        cold_s = _timed(lambda rows: prediction_cache.predict(rows, loaded, cache), [portfolio])
+        warm_s = _timed(lambda rows: prediction_cache.predict(rows, loaded, cache), [portfolio] * 5)
+        stats = cache.stats()
+        print(f"  {label:<14} cold {cold_s * 1e3:6.2f} ms  warm {warm_s / 5 * 1e3:6.2f} ms  "
+              f"hit rate {stats.hit_rate:.1%}  bypassed {stats.bypassed:,} rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Rows per second of the notebook's cleaning loops versus ``cleaning.clean_raw``.
+
+``Raw_Property.csv`` is resampled up to each target size, with the price, rate and area
+numbers redrawn per row so those columns stay nearly all-distinct as in a real scrape
+(locality, floor and age labels keep their natural repetition). The notebook version below is a
+straight copy of ``99acres Data Cleaning.ipynb`` with ``range(2581)`` generalised to the
+frame length; at every size both outputs are compared byte for byte.
+
+    python -m benchmarks.cleaning_throughput [--sizes 10000 100000 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import cleaning
+
+RAW_PATH = Path(__file__).resolve().parents[2] / "Datasets" / "Raw_Property.csv"
+
+
+def notebook_clean(raw_data: pd.DataFrame) -> pd.DataFrame:
+    raw_data = raw_data.copy()
+    n = len(raw_data)
+    raw_data["Property_Age"] = raw_data["Property_Age"].str.replace(" Old", "")
+    raw_data["Rate_SqFt"] = raw_data["Rate_SqFt"].str.replace(",", "")
+    raw_data["Availability"] = raw_data["Availability"].str.title()
+    raw_data["Availability"] = raw_data["Availability"].str.replace(" Property", "")
+    raw_data["Availability"] = [i.lstrip() for i in raw_data["Availability"]]
+    area = []
+    for i in range(n):
+        clean_sqft = re.sub("[^0-9.]", " ", raw_data["Area_Tpye"][i])
+        area.append(clean_sqft.split()[0])
+    raw_data["Area_SqFt"] = area
+    carpet = []
+    for i in range(n):
+        clean_carpet = re.sub("[^a-zA-Z]", " ", raw_data["Area_Tpye"][i])
+        carpet.append(clean_carpet.split()[0] + " " + clean_carpet.split()[1])
+    raw_data["Area_Tpye"] = carpet
+    raw_data["Area_Tpye"] = raw_data.Area_Tpye.str.title()
+    raw_data["Area_Tpye"] = raw_data.Area_Tpye.str.replace("Super Built", "Super Built Up")
+    raw_data["Area_Tpye"] = raw_data.Area_Tpye.str.replace("Built Up", "Built Up Area")
+    raw_data["Area_Tpye"] = raw_data.Area_Tpye.str.replace("Carpet Area ", "Carpet Area")
+    raw_data["Floor_No"] = raw_data.Floor_No.str.replace("Ground", "0")
+    raw_data["Floor_No"] = raw_data.Floor_No.str.replace("Basement", "-1")
+    floor = []
+    for i in range(n):
+        floor.append(re.sub("[^0-9-]", "", raw_data["Floor_No"][i]))
+    raw_data["Floor_No"] = floor
+    raw_data["Location"] = [i.lstrip() for i in raw_data["Location"]]
+    location = []
+    for i in range(n):
+        location.append(re.sub("[^a-zA-Z-]", " ", raw_data["Location"][i]))
+    raw_data["Region"] = location
+    raw_data["Region"] = raw_data.Region.str.title()
+    words = ["[0-9]", "East", "West", "South", "Suburbs", "Sector", "Beyond", "And Beyond", "Scheme"]
+    raw_data["Region"] = raw_data["Region"].str.replace("|".join(words), "", regex=True).str.strip()
+    location = []
+    for i in range(n):
+        try:
+            location.append(raw_data["Region"][i].split()[-3] + " " + raw_data["Region"][i].split()[-2])
+        except IndexError:
+            location.append(raw_data["Region"][i].split()[-2] + " " + raw_data["Region"][i].split()[-1])
+    raw_data["Region"] = location
+    add = []
+    for i in range(n):
+        add.append(re.sub("[^a-zA-Z0-9]", " ", raw_data["Location"][i]))
+    raw_data["Location"] = add
+    raw_data["Location"] = raw_data["Location"].str.replace("   ", " ")
+    raw_data["Location"] = raw_data["Location"].str.replace("  ", " ")
+
+    def converter(x):
+        if "Lac" in x:
+            return f"{(float(x.strip('Lac')) * 1):,.1f}"
+        elif "Crore" in x:
+            return f"{(float(x.strip('Crore')) * 100):,.1f}"
+
+    raw_data["Price_Lakh"] = raw_data["Price"].apply(converter)
+    raw_data["Price_Lakh"] = raw_data["Price_Lakh"].str.replace(",", "")
+    raw_data.dropna(inplace=True)
+    raw_data.reset_index(drop=True, inplace=True)
+    return raw_data
+
+
+def synthetic_raw(source: pd.DataFrame, size: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    raw = source.sample(size, replace=True, random_state=seed).reset_index(drop=True)
+    lakh = rng.integers(150, 9_950, size) / 10
+    raw["Price"] = [f"{value:g} Lac" if value < 100 else f"{value / 100:.2f} Crore" for value in lakh]
+    raw["Rate_SqFt"] = [f"{value:,}" for value in rng.integers(3_000, 80_000, size)]
+    raw["Area_Tpye"] = [
+        re.sub(r"\d+", str(area), text, count=1)
+        for text, area in zip(raw["Area_Tpye"], rng.integers(250, 6_000, size))
+    ]
+    return raw
+
+
+def _timed(func, raw: pd.DataFrame):
+    start = time.perf_counter()
+    result = func(raw)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    source = pd.read_csv(RAW_PATH)
+    for size in args.sizes:
+        raw = synthetic_raw(source, size)
+        before, before_s = _timed(notebook_clean, raw)
+        after, after_s = _timed(cleaning.clean_raw, raw)
+        identical = before.to_csv(index=False) == after.to_csv(index=False)
+        print(f"{size:>9,} rows  notebook {size / before_s:>10,.0f} rows/s  "
+              f"vectorized {size / after_s:>10,.0f} rows/s  x{before_s / after_s:4.1f}  identical={identical}")
+
+
+if __name__ == "__main__":
+    main()
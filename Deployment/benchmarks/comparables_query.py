@@ -0,0 +1,79 @@
+"""k-nearest comparable lookups: brute-force pandas haversine scan versus ``ComparableIndex``.
+
+``Map_Location.csv`` is resampled to each size with coordinates jittered by up to ~2 km, and
+the same random query points (inside the data's bounding box) are answered both ways. The
+neighbour distances returned by the two methods are compared for every brute-force query.
+
+    python -m benchmarks.comparables_query [--sizes 1013 100000 1000000] [--k 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import comparables
+
+BRUTE_QUERIES = 20
+INDEX_QUERIES = 2_000
+
+
+def synthetic_listings(source: pd.DataFrame, size: int, seed: int = 0) -> pd.DataFrame:
+    if size == len(source):
+        return source
+    rng = np.random.default_rng(seed)
+    listings = source.sample(size, replace=True, random_state=seed).reset_index(drop=True)
+    listings["Latitude"] += rng.uniform(-0.02, 0.02, size)
+    listings["Longitude"] += rng.uniform(-0.02, 0.02, size)
+    return listings
+
+
+def brute_force(listings: pd.DataFrame, latitude: float, longitude: float, k: int) -> pd.DataFrame:
+    lat, lon = np.radians(latitude), np.radians(longitude)
+    lat2, lon2 = np.radians(listings["Latitude"]), np.radians(listings["Longitude"])
+    a = np.sin((lat2 - lat) / 2) ** 2 + np.cos(lat) * np.cos(lat2) * np.sin((lon2 - lon) / 2) ** 2
+    distances = 2 * comparables.EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+    nearest = distances.nsmallest(k)
+    return listings.loc[nearest.index].assign(Distance_km=nearest.to_numpy())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1013, 100_000, 1_000_000])
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    source = pd.read_csv(comparables.MAP_LOCATION_PATH)
+    rng = np.random.default_rng(1)
+    points = np.column_stack([
+        rng.uniform(source["Latitude"].min(), source["Latitude"].max(), INDEX_QUERIES),
+        rng.uniform(source["Longitude"].min(), source["Longitude"].max(), INDEX_QUERIES),
+    ])
+    for size in args.sizes:
+        listings = synthetic_listings(source, size)
+
+        start = time.perf_counter()
+        index = comparables.ComparableIndex(listings)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [index.nearest(lat, lon, args.k) for lat, lon in points]
+        index_ms = (time.perf_counter() - start) * 1e3 / INDEX_QUERIES
+
+        start = time.perf_counter()
+        brute = [brute_force(listings, lat, lon, args.k) for lat, lon in points[:BRUTE_QUERIES]]
+        brute_ms = (time.perf_counter() - start) * 1e3 / BRUTE_QUERIES
+
+        matches = all(
+            np.allclose(found.distances_km, expected["Distance_km"].to_numpy())
+            for found, expected in zip(results, brute)
+        )
+        print(f"{size:>9,} listings  build {build_s * 1e3:8.1f} ms  brute force {brute_ms:8.3f} ms/query  "
+              f"index {index_ms:6.3f} ms/query  x{brute_ms / index_ms:6.0f}  same neighbours={matches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Cold and warm dataset load times and memory, CSV-per-page versus the shared Parquet cache.
+
+"Before" parses ``Final_Project.csv`` once per page (home, EDA, prediction) and keeps three
+object-dtype copies. "After" builds the typed Parquet cache (cold), reloads it as a fresh
+process would (warm) and then serves the shared in-process copy (memo).
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import data_store
+
+PAGES = 3
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def _mib(frames) -> float:
+    return sum(frame.memory_usage(deep=True).sum() for frame in frames) / 2**20
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as scratch:
+        csv_path = Path(scratch) / data_store.DATA_PATH.name
+        shutil.copyfile(data_store.DATA_PATH, csv_path)
+        data_store.CACHE_DIR = Path(scratch) / ".cache"
+
+        frames, before_ms = _timed(lambda: [pd.read_csv(csv_path) for _ in range(PAGES)])
+        print(f"before: {PAGES} x read_csv      {before_ms:8.2f} ms  {_mib(frames):7.2f} MiB held")
+
+        _, cold_ms = _timed(lambda: data_store.ensure_cache(csv_path))
+        print(f"after:  cold cache build     {cold_ms:8.2f} ms")
+
+        cache_path = data_store.cache_path_for(csv_path)
+        _, warm_ms = _timed(lambda: pd.read_parquet(cache_path))
+        print(f"after:  warm parquet read    {warm_ms:8.2f} ms")
+
+        shared, first_ms = _timed(lambda: data_store.load_listings(csv_path))
+        _, memo_ms = _timed(lambda: [data_store.load_listings(csv_path) for _ in range(PAGES)])
+        print(f"after:  first load_listings  {first_ms:8.2f} ms  {_mib([shared]):7.2f} MiB held")
+        print(f"after:  {PAGES} x memoised page  {memo_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Per-rerun cost of the prediction form's option lists and slider bounds.
+
+"Before" is what ``ml_app.run_ml_app`` and ``render_sweep`` evaluated on every rerun: five
+``sorted(df[...].unique())`` / ``sort_values().unique()`` dropdown scans plus the area
+``max()`` and ``median()``. "Build" is ``form_metadata.build_metadata``, paid once per dataset
+version. "After" is the warm ``form_metadata.load_metadata`` a rerun now calls. The listing
+table is tiled to larger row counts; the lists must come out the same either way.
+
+    python -m benchmarks.form_options
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+import numpy as np
+
+import data_store
+import form_metadata
+
+SCALES = (1, 40, 400)
+REPEATS = 10
+
+
+def _median_ms(call, repeats: int = REPEATS) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e3
+
+
+def _rerun_scans(df) -> tuple:
+    return (
+        sorted(df['Region'].unique()),
+        int(df['Area_SqFt'].max()),
+        int(df['Area_SqFt'].median()),
+        sorted(df['Floor_No'].unique()),
+        sorted(df['Bathroom'].unique()),
+        sorted(df['Bedroom'].unique()),
+        df['Property_Age'].sort_values().unique(),
+        df['Area_Tpye'].sort_values().unique(),
+    )
+
+
+def main() -> None:
+    base = data_store.load_listings()
+    dictionary = data_store.load_dictionary()
+    form_metadata.load_metadata()
+    warm_ms = _median_ms(form_metadata.load_metadata, 1_000)
+
+    print(f"{'rows':>10} {'before ms':>10} {'build ms':>9} {'after ms':>9}")
+    for scale in SCALES:
+        df = base.iloc[np.tile(np.arange(len(base)), scale)].reset_index(drop=True)
+        scans = _rerun_scans(df)
+        metadata = form_metadata.build_metadata(df, dictionary)
+        assert list(metadata.regions) == scans[0] and list(metadata.property_ages) == list(scans[6])
+        assert (metadata.area_max, metadata.area_median, list(metadata.floors)) == (scans[1], scans[2], scans[3])
+
+        before_ms = _median_ms(lambda: _rerun_scans(df))
+        build_ms = _median_ms(lambda: form_metadata.build_metadata(df, dictionary), 3)
+        print(f"{len(df):>10,} {before_ms:>10.3f} {build_ms:>9.2f} {warm_ms:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Backend calls made by the notebook's per-row geocoding loop versus ``geocoding.geocode_frame``.
+
+Runs against a local stub (a ``TableBackend`` over ``Map_Location.csv`` that counts calls),
+so no network is used. The notebook issues one call per row; the module issues one per
+distinct address on a cold cache and none on a rerun. Times for Nominatim are projected at
+its 1 request/s policy.
+
+    python -m benchmarks.geocode_cache
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import geocoding
+
+LISTINGS_PATH = geocoding.BASE_DIR.parent / "Datasets" / "Property_Location.csv"
+
+
+class CountingBackend:
+    def __init__(self, backend: geocoding.Backend) -> None:
+        self.backend = backend
+        self.calls = 0
+
+    def __call__(self, address: str):
+        self.calls += 1
+        return self.backend(address)
+
+
+def main() -> None:
+    listings = pd.read_csv(LISTINGS_PATH)
+    reference = pd.read_csv(geocoding.MAP_LOCATION_PATH)
+    centroids = geocoding.region_centroids(reference)
+    print(f"notebook loop:  {len(listings):>5,} backend calls  (~{len(listings) / 60:5.1f} min at 1 req/s)")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        for run in ("cold cache", "rerun"):
+            backend = CountingBackend(geocoding.TableBackend(reference))
+            cache = geocoding.GeocodeCache(Path(scratch) / "geocode.sqlite")
+            start = time.perf_counter()
+            located, report = geocoding.geocode_frame(listings, backend, cache, centroids)
+            elapsed = time.perf_counter() - start
+            cache.close()
+            print(f"{run + ':':<15} {backend.calls:>5,} backend calls  (~{backend.calls / 60:5.1f} min at 1 req/s)  "
+                  f"{elapsed * 1e3:7.1f} ms local  {report.cache_hits:,} cache hits, "
+                  f"{report.region_fallbacks:,} region fallbacks, {report.unresolved:,} unresolved")
+
+
+if __name__ == "__main__":
+    main()
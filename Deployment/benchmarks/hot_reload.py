@@ -0,0 +1,122 @@
+"""Serve predictions from several threads while the model artifact is replaced underneath.
+
+A copy of ``regression_model.json``/``.bin`` in a scratch directory is rewritten in turn with
+a retagged copy of the same model (accepted), a file whose ``.bin`` does not match its
+checksum (rejected at load), a model with every coefficient tripled (rejected on holdout
+MAE) and the original again, followed by a rollback. Before the registry, picking up any of
+these meant restarting Streamlit; here every request must still succeed and no request waits
+on a load.
+
+    python -m benchmarks.hot_reload [--threads 4] [--seconds 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+import model_artifact
+import model_registry
+import predictor
+
+
+def _publish(manifest: dict, data: bytes, manifest_path: Path) -> None:
+    for path, payload in ((model_artifact.data_path_for(manifest_path), data),
+                          (manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))):
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+
+
+def candidates(source: Path) -> list[tuple[str, dict, bytes]]:
+    manifest = json.loads(source.read_text(encoding="utf-8"))
+    data = model_artifact.data_path_for(source).read_bytes()
+    coef = manifest["arrays"]["linear.coef"]
+    tripled = bytearray(data)
+    start = coef["offset"]
+    end = start + int(np.prod(coef["shape"])) * np.dtype(coef["dtype"]).itemsize
+    tripled[start:end] = (np.frombuffer(data[start:end], dtype=coef["dtype"]) * 3).tobytes()
+    corrupt = bytearray(data)
+    corrupt[-1] ^= 0xFF
+    tripled_sha = hashlib.sha256(tripled).hexdigest()
+    return [
+        ("retagged", {**manifest, "source": "retagged"}, data),
+        ("corrupt .bin", {**manifest, "source": "corrupt"}, bytes(corrupt)),
+        ("3x coefficients", {**manifest, "source": "tripled", "sha256": tripled_sha}, bytes(tripled)),
+        ("original", manifest, data),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=1.0, help="Traffic between swaps")
+    args = parser.parse_args()
+
+    scenarios = np.array([[1200.0, 5.0, 2.0], [850.0, 2.0, 1.0], [2400.0, 18.0, 4.0]])
+    with tempfile.TemporaryDirectory() as scratch:
+        manifest_path = Path(scratch) / predictor.MODEL_PATH.name
+        shutil.copy(predictor.MODEL_PATH, manifest_path)
+        shutil.copy(model_artifact.data_path_for(predictor.MODEL_PATH), model_artifact.data_path_for(manifest_path))
+        registry = model_registry.ModelRegistry(manifest_path, poll_seconds=0.05)
+        registry.current()
+        registry.start()
+
+        stop = threading.Event()
+        phases = ["steady"]
+        samples: list[list[tuple[int, float]]] = [[] for _ in range(args.threads)]
+        errors: list[str] = []
+
+        def serve(out: list[tuple[int, float]]) -> None:
+            while not stop.is_set():
+                phase = len(phases) - 1
+                start = time.perf_counter()
+                try:
+                    predictor.predict_batch(registry.current().model, scenarios)
+                except Exception as exc:
+                    errors.append(repr(exc))
+                out.append((phase, time.perf_counter() - start))
+
+        workers = [threading.Thread(target=serve, args=(out,)) for out in samples]
+        for worker in workers:
+            worker.start()
+        try:
+            for label, manifest, data in candidates(manifest_path):
+                time.sleep(args.seconds)
+                phases.append(f"publish {label}")
+                _publish(manifest, data, manifest_path)
+            time.sleep(args.seconds)
+            phases.append("rollback")
+            registry.rollback()
+            time.sleep(args.seconds)
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+            registry.stop()
+
+        print(f"{'version':>16}  {'result':8}  {'load ms':>8}  {'check ms':>8}  {'swap us':>8}  detail")
+        for event in registry.status()["history"]:
+            print(f"{event['version'] or '-':>16}  {'accepted' if event['accepted'] else 'rejected':8}  "
+                  f"{event['load_ms']:8.2f}  {event['validate_ms']:8.2f}  {event['swap_us']:8.2f}  {event['detail'][:60]}")
+
+        merged = np.array([sample for out in samples for sample in out])
+        print(f"\n{len(merged):,} requests on {args.threads} threads, {len(errors)} failed")
+        print(f"{'phase':<26} {'requests':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for index, label in enumerate(phases):
+            latency = merged[merged[:, 0] == index, 1] * 1e3
+            print(f"{label:<26} {len(latency):>9,} {statistics.median(latency):>8.3f} "
+                  f"{np.percentile(latency, 99):>8.3f} {latency.max():>8.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Cost of adding one batch of listings: full refit versus ``IncrementalTrainer``.
+
+History is ``Final_Project.csv`` repeated with numeric columns jittered by up to ±2%, grown
+to each size in turn. At every size a new batch (one copy of the table, 2,531 rows) arrives.
+"Full refit" re-expands and re-accumulates the whole history plus the batch, then solves.
+It works on the already-encoded matrix in memory, so it is a lower bound on what
+``train.py`` pays, which also reads the history back from disk. "Incremental" loads the
+saved accumulators, folds in the batch, saves them and solves. Both coefficient vectors are
+compared at each size.
+
+    python -m benchmarks.incremental_update [--sizes 10000 100000 1000000 2500000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import data_store
+import incremental
+import model_artifact
+import train
+
+
+def jittered(table: pd.DataFrame, copies: int, rng: np.random.Generator) -> pd.DataFrame:
+    parts = []
+    for _ in range(copies):
+        part = table.copy()
+        for column in ("Area_SqFt", "Rate_SqFt", "Price_Lakh"):
+            part[column] = part[column] * rng.uniform(0.98, 1.02, len(part))
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True)
+
+
+def full_refit(trainer: incremental.IncrementalTrainer, features: np.ndarray, target: np.ndarray,
+               chunk_rows: int = train.BATCH_ROWS) -> np.ndarray:
+    expand = model_artifact.PolynomialStep(trainer.powers).transform
+    gram = np.zeros_like(trainer.gram)
+    moment = np.zeros_like(trainer.moment)
+    for start in range(0, len(target), chunk_rows):
+        expanded = expand(features[start:start + chunk_rows] / trainer.scales)
+        gram += expanded.T @ expanded
+        moment += expanded.T @ target[start:start + chunk_rows]
+    return train.solve(gram, moment, trainer.scales, trainer.powers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 2_500_000])
+    args = parser.parse_args()
+
+    table = data_store.read_csv_typed(train.DATA_PATH)
+    rng = np.random.default_rng(0)
+    trainer = incremental.IncrementalTrainer.from_frame(table)
+    features = [train.encode(table, trainer.encoders)]
+    targets = [table[train.TARGET_COLUMN].to_numpy(dtype=float)]
+    rows = len(table)
+
+    print(f"{'history':>10}  {'full refit ms':>14}  {'incremental ms':>15}  {'speed-up':>9}  {'max |Δcoef|':>12}")
+    with tempfile.TemporaryDirectory() as scratch:
+        state_path = Path(scratch) / "incremental.npz"
+        trainer.save(state_path)
+        for size in sorted(args.sizes):
+            # Grow the history to ``size`` rows through the trainer, then time one more batch.
+            while rows < size:
+                grown = jittered(table, min(-(-(size - rows) // len(table)), 100), rng)
+                trainer.fold_in(grown)
+                features.append(train.encode(grown, trainer.encoders))
+                targets.append(grown[train.TARGET_COLUMN].to_numpy(dtype=float))
+                rows += len(grown)
+            trainer.save(state_path)
+            batch = jittered(table, 1, rng)
+
+            start = time.perf_counter()
+            updated = incremental.IncrementalTrainer.load(state_path)
+            updated.fold_in(batch)
+            updated.save(state_path)
+            incremental_coef = updated.solve()
+            incremental_ms = (time.perf_counter() - start) * 1e3
+
+            history = np.concatenate([*features, train.encode(batch, trainer.encoders)])
+            target = np.concatenate([*targets, batch[train.TARGET_COLUMN].to_numpy(dtype=float)])
+            start = time.perf_counter()
+            refit_coef = full_refit(trainer, history, target)
+            refit_ms = (time.perf_counter() - start) * 1e3
+
+            # Keep the timed batch out of the running history so the next size starts clean.
+            trainer.save(state_path)
+            difference = np.abs(refit_coef - incremental_coef).max()
+            print(f"{len(target):>10,}  {refit_ms:>14.1f}  {incremental_ms:>15.1f}  "
+                  f"{refit_ms / incremental_ms:>8.0f}x  {difference:>12.3g}")
+
+
+if __name__ == "__main__":
+    main()
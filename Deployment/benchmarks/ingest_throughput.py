@@ -0,0 +1,94 @@
+"""Pages per second of ``ingest.ingest`` against a local fixture site at several concurrency levels.
+
+The fixture mirrors the 99acres markup the parser relies on: search pages linking to
+``LISTINGS_PER_PAGE`` listing pages. The server adds ``LATENCY`` per response to stand in
+for network round trips. Each run also checks that an interrupted ingest resumes cleanly.
+"""
+
+from __future__ import annotations
+
+import csv
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import ingest
+
+PAGES = 12
+LISTINGS_PER_PAGE = 25
+LATENCY = 0.02
+CONCURRENCY = (1, 4, 8, 16)
+
+_LISTING_HTML = """<html><body>
+<h1><span class="undefined">Fixture Heights {page}-{item} </span></h1>
+<i id="address">Sector {item}, Kharghar, Navi Mumbai</i>
+<span id="pdPrice2">1.{item} Crore</span>
+<div id="pricePerUnitArea">₹ 1{item:04d} per sqft</div>
+<div id="factArea">Super Built up area 1{item:03d}(92.9 sq.m.)</div>
+<span id="bedRoomNum">{beds} Bedrooms</span><span id="bathroomNum">2 Bathrooms</span>
+<span id="floorNumLabel">{item}th  of 30 Floors</span>
+<span id="agePossessionLbl">1 to 5 Year Old</span><span id="Availability_Lbl"> Ready to move</span>
+</body></html>"""
+
+
+def write_fixture_site(root: Path, pages: int = PAGES, listings: int = LISTINGS_PER_PAGE) -> None:
+    for page in range(1, pages + 1):
+        links = "".join(
+            f'<a class="body_med srpTuple__propertyName" href="/listing-{page}-{item}">Listing</a>'
+            for item in range(listings)
+        )
+        (root / ingest.LISTING_PATH.format(page=page).lstrip("/")).write_text(f"<html><body>{links}</body></html>")
+        for item in range(listings):
+            markup = _LISTING_HTML.format(page=page, item=item, beds=item % 4 + 1)
+            (root / f"listing-{page}-{item}").write_text(markup, encoding="utf-8")
+
+
+class _SlowHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        time.sleep(LATENCY)
+        super().do_GET()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as scratch:
+        site = Path(scratch) / "site"
+        site.mkdir()
+        write_fixture_site(site)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_SlowHandler, directory=str(site)))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+        try:
+            print(f"{'concurrency':>11} {'pages/s':>8} {'rows':>6}")
+            for concurrency in CONCURRENCY:
+                store = Path(scratch) / f"raw_{concurrency}.csv"
+                report = ingest.ingest(1, PAGES + 1, store, base_url=base_url, concurrency=concurrency)
+                print(f"{concurrency:>11} {report.pages_per_second:>8.2f} {report.rows_written:>6}")
+
+            store = Path(scratch) / "resume.csv"
+            ingest.ingest(1, PAGES // 2 + 1, store, base_url=base_url)
+            with store.open("a", encoding="utf-8") as handle:
+                handle.write("half-written row from a crashed run")
+            resumed = ingest.ingest(1, PAGES + 1, store, base_url=base_url)
+            with store.open(newline="", encoding="utf-8") as handle:
+                rows = list(csv.DictReader(handle))
+            assert len(resumed.pages_skipped) == PAGES // 2
+            assert len(rows) == PAGES * LISTINGS_PER_PAGE, len(rows)
+            print(f"resume: skipped {len(resumed.pages_skipped)} finished pages, store holds {len(rows)} rows")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
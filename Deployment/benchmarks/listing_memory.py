@@ -0,0 +1,76 @@
+"""Per-row memory of the listing table and dropdown option cost, before and after dictionary coding.
+
+"Notebook" is a plain ``read_csv`` (every text column a Python string). "Before" is the
+previous ``data_store`` layout: ``Region``, ``Property_Age``, ``Availability`` and ``Area_Tpye``
+as categoricals with per-file codes, ``Location`` as strings. "After" is ``load_listings`` with
+all five columns coded through the persistent ``category_dictionary``. Memory is
+``memory_usage(deep=True)``, which counts the label strings of a categorical once, so at the
+CSV's ~2.5k rows the 1,294 distinct locations are a large share of it; the table is also
+tiled to larger row counts to show the per-row cost it converges to. The option timings
+compare the form's old ``sorted(df['Region'].unique())`` with ``CategoryDictionary.options``.
+
+    python -m benchmarks.listing_memory
+"""
+
+from __future__ import annotations
+
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import data_store
+
+SCALES = (1, 40, 400)
+TEXT_COLUMNS = ("Location", "Region", "Property_Age", "Availability", "Area_Tpye")
+REPEATS = 20
+
+
+def _bytes_per_row(df: pd.DataFrame, columns=None) -> float:
+    usage = df.memory_usage(deep=True, index=False)
+    return float((usage if columns is None else usage[list(columns)]).sum()) / len(df)
+
+
+def _median_ms(call) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e3
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as scratch:
+        csv_path = Path(scratch) / data_store.DATA_PATH.name
+        shutil.copyfile(data_store.DATA_PATH, csv_path)
+        data_store.CACHE_DIR = Path(scratch) / ".cache"
+
+        layouts = {
+            "notebook": pd.read_csv(csv_path),
+            "before": pd.read_csv(csv_path, dtype={column: "category" for column in TEXT_COLUMNS[1:]}),
+            "after": data_store.load_listings(csv_path),
+        }
+        dictionary = data_store.load_dictionary()
+
+        print(f"{'rows':>10} {'layout':>9} {'bytes/row':>10} {'text cols':>10} {'options ms':>11}")
+        for scale in SCALES:
+            rows = np.tile(np.arange(len(layouts["after"])), scale)
+            for name, base in layouts.items():
+                df = base.iloc[rows].reset_index(drop=True) if scale > 1 else base
+                if name == "after":
+                    codes = df["Region"].cat.codes.to_numpy()
+                    options_ms = _median_ms(lambda: dictionary.options("Region", codes))
+                    assert dictionary.options("Region", codes) == sorted(layouts["notebook"]["Region"].unique())
+                else:
+                    options_ms = _median_ms(lambda: sorted(df["Region"].unique()))
+                print(f"{len(df):>10,} {name:>9} {_bytes_per_row(df):>10.1f} "
+                      f"{_bytes_per_row(df, TEXT_COLUMNS):>10.1f} {options_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Cold load time of ``regression_model.pkl`` versus the pickle-free artifact.
+
+Each load runs in a fresh interpreter that has already imported numpy, so the timing covers
+what the app pays on first prediction: unpickling (which pulls in scikit-learn) versus
+reading the manifest and memory-mapping ``regression_model.bin``. Both models then predict
+the same random probe and the outputs are compared.
+
+    python -m benchmarks.model_load [--repeats 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+import model_artifact
+import predictor
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+
+def _child(mode: str) -> None:
+    warnings.simplefilter("ignore")
+    start = time.perf_counter()
+    model = predictor.load_model(predictor.PICKLE_PATH if mode == "pickle" else model_artifact.ARTIFACT_PATH)
+    seconds = time.perf_counter() - start
+    probe = np.random.default_rng(0).uniform(0, 5_000, (1_000, model.n_features_in_))
+    print(json.dumps({
+        "ms": seconds * 1e3,
+        "sklearn_imported": "sklearn" in sys.modules,
+        "predictions": model.predict(probe).tolist(),
+    }))
+
+
+def _measure(mode: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.model_load", "--child", mode],
+        cwd=BASE_DIR, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--child", choices=("pickle", "artifact"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child(args.child)
+        return
+
+    results = {}
+    for mode in ("pickle", "artifact"):
+        runs = [_measure(mode) for _ in range(args.repeats)]
+        results[mode] = runs[0]
+        print(f"{mode:>8}: {statistics.median(run['ms'] for run in runs):8.1f} ms median load  "
+              f"sklearn imported={runs[0]['sklearn_imported']}")
+    pickle_out = np.array(results["pickle"]["predictions"])
+    artifact_out = np.array(results["artifact"]["predictions"])
+    print(f"max |pickle - artifact| over {len(pickle_out):,} rows: {np.abs(pickle_out - artifact_out).max():.3g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Image bytes shipped and render time per page, measured inside Streamlit's own image path.
+
+Each page is rendered in a fresh interpreter with ``streamlit.testing``; the byte count is
+what ``st.image`` hands to the media file manager after its own resizing and re-encoding.
+The first render includes building any missing variants; the rerun shows the warm path.
+Point ``--app-dir`` at another checkout for a "before" report.
+
+    python -m benchmarks.page_payload --app-dir /tmp/before/Deployment
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PAGES = {"Home": None, "Data Analysis": ("eda-lens", "Visual gallery")}
+
+_RUNNER = """
+import json, time, warnings
+warnings.simplefilter("ignore")
+import streamlit.elements.lib.image_utils as image_utils
+from streamlit.testing.v1 import AppTest
+
+shipped = []
+_ensure = image_utils._ensure_image_size_and_format
+def _recording(*args, **kwargs):
+    data = _ensure(*args, **kwargs)
+    shipped.append(len(data))
+    return data
+image_utils._ensure_image_size_and_format = _recording
+
+at = AppTest.from_file({app!r}, default_timeout=300)
+at.session_state["page"] = {page!r}
+lens = {lens!r}
+if lens:
+    at.session_state[lens[0]] = lens[1]
+timings = []
+for _ in range(2):
+    shipped.clear()
+    start = time.perf_counter()
+    at.run()
+    timings.append((time.perf_counter() - start) * 1e3)
+print(json.dumps({{"images": len(shipped), "bytes": sum(shipped), "first_ms": timings[0], "rerun_ms": timings[1]}}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report image payload per page")
+    parser.add_argument("--app-dir", type=Path, default=Path(__file__).resolve().parent.parent)
+    args = parser.parse_args()
+    app_path = args.app_dir.resolve() / "app.py"
+
+    print(f"{'page':<15} {'images':>7} {'KiB shipped':>12} {'first ms':>9} {'rerun ms':>9}")
+    for page, lens in PAGES.items():
+        code = _RUNNER.format(app=str(app_path), page=page, lens=lens)
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=app_path.parent, check=True)
+        stats = json.loads(result.stdout.strip().splitlines()[-1])
+        print(f"{page:<15} {stats['images']:>7} {stats['bytes'] / 1024:>12,.0f} "
+              f"{stats['first_ms']:>9.0f} {stats['rerun_ms']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Peak RSS and wall time of the notebook-style in-memory pipeline versus ``pipeline.run``.
+
+The three ``Prop_*.csv`` parts are written out 1x, 10x and 100x, with each extra copy's
+property names suffixed so copies are distinct listings (duplicates inside a copy remain).
+"Before" mirrors the notebooks: read every part, concat, write ``Raw_Property.csv``, read it
+back, clean, write ``Property_Location.csv``, read it back, project and write the result.
+Each run happens in a fresh interpreter so peak RSS is not shared between runs.
+
+    python -m benchmarks.pipeline_memory [--scales 1 10 100] [--chunk-rows 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import cleaning
+import pipeline
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+
+def write_copies(directory: Path, scale: int) -> list[Path]:
+    paths = []
+    for source in pipeline.RAW_PARTS:
+        part = pd.read_csv(source, dtype=str)
+        target = directory / source.name
+        with target.open("w", newline="", encoding="utf-8") as handle:
+            for copy in range(scale):
+                renamed = part.assign(Property_Name=part["Property_Name"] + (f" #{copy}" if copy else ""))
+                renamed.to_csv(handle, header=copy == 0, index=False)
+        paths.append(target)
+    return paths
+
+
+def in_memory(paths: list[Path], directory: Path) -> int:
+    df = pd.concat([pd.read_csv(path) for path in paths])
+    df["Property_Name"] = df["Property_Name"].str.replace(pipeline.PLACEHOLDER_NAME, "Unnamed Property", regex=False)
+    df = df.dropna().astype({column: "int64" for column in pipeline.COUNT_COLUMNS}).drop_duplicates(ignore_index=True)
+    df.to_csv(directory / "Raw_Property.csv", index=False)
+    located = cleaning.clean_raw(pd.read_csv(directory / "Raw_Property.csv"))
+    located.to_csv(directory / "Property_Location.csv", index=False)
+    final = cleaning.project(pd.read_csv(directory / "Property_Location.csv"))
+    final.to_csv(directory / "before.csv", index=False)
+    return len(final)
+
+
+def _child(mode: str, directory: Path, chunk_rows: int) -> None:
+    paths = [directory / source.name for source in pipeline.RAW_PARTS]
+    start = time.perf_counter()
+    if mode == "before":
+        rows = in_memory(paths, directory)
+    else:
+        rows = pipeline.run(paths, directory / "after.csv", chunk_rows).rows_written
+    print(json.dumps({
+        "seconds": time.perf_counter() - start,
+        "peak_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "rows": rows,
+    }))
+
+
+def _measure(mode: str, directory: Path, chunk_rows: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.pipeline_memory", "--chunk-rows", str(chunk_rows),
+         "--child", mode, str(directory)],
+        cwd=BASE_DIR, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--chunk-rows", type=int, default=pipeline.CHUNK_ROWS)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child(args.child[0], Path(args.child[1]), args.chunk_rows)
+        return
+
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as scratch:
+            directory = Path(scratch)
+            paths = write_copies(directory, scale)
+            input_mib = sum(path.stat().st_size for path in paths) / 2**20
+            before = _measure("before", directory, args.chunk_rows)
+            after = _measure("after", directory, args.chunk_rows)
+            identical = (directory / "before.csv").read_bytes() == (directory / "after.csv").read_bytes()
+            print(f"{scale:>4}x ({input_mib:7.1f} MiB in, {after['rows']:>9,} rows out)  "
+                  f"before {before['seconds']:7.2f} s {before['peak_mib']:8.1f} MiB peak  "
+                  f"after {after['seconds']:7.2f} s {after['peak_mib']:8.1f} MiB peak  identical={identical}")
+
+
+if __name__ == "__main__":
+    main()
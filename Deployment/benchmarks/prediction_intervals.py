@@ -0,0 +1,84 @@
+"""Latency of point predictions versus point plus prediction interval.
+
+The interval is ``estimate ± t * s * sqrt(1 + zᵀ(XᵀX)⁻¹z)`` with the covariance loaded from
+the model artifact, so per row it costs one extra 36x36 matrix product on the same
+polynomial expansion. Timed for a single row (the point estimate through the warm prediction
+cache, the interval through ``predictor.predict_interval_batch`` as the prediction lab calls
+it) and for batches (uncached, 1k to 1M rows, best of three). Each
+interval is checked against a direct ``np.linalg.pinv`` evaluation of the formula on a
+sample.
+
+    python -m benchmarks.prediction_intervals
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+import numpy as np
+
+import model_artifact
+import prediction_cache
+import predictor
+from benchmarks.batch_predict import _random_scenarios
+
+SIZES = (1_000, 100_000, 1_000_000)
+SINGLE_REPEATS = 2_000
+BATCH_REPEATS = 3
+
+
+def _median_us(call, repeats: int = SINGLE_REPEATS) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+def _best_ms(call, repeats: int = BATCH_REPEATS):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3, result
+
+
+def _reference_half_width(model: model_artifact.ArtifactModel, scenarios: np.ndarray, level: float) -> np.ndarray:
+    estimator = model._estimator
+    expanded = model._expand(predictor.build_feature_matrix(model.schema, scenarios)) / estimator.term_scales
+    inverse = np.linalg.pinv(np.linalg.pinv(estimator.covariance, hermitian=True), hermitian=True)
+    leverage = np.array([row @ inverse @ row for row in expanded])
+    return model_artifact.t_quantile(level, estimator.residual_dof) * np.sqrt(
+        estimator.residual_variance * (1 + leverage))
+
+
+def main() -> None:
+    loaded = predictor.current_model()
+    if not predictor.supports_intervals(loaded.model):
+        raise SystemExit("The model artifact has no residual covariance; run `python train.py` first")
+    level = predictor.INTERVAL_LEVEL
+
+    scenario = [[1200.0, 5.0, 2.0]]
+    cache = prediction_cache.PredictionCache()
+    point_us = _median_us(lambda: prediction_cache.predict(scenario, loaded, cache))
+    interval_us = _median_us(lambda: predictor.predict_interval_batch(loaded.model, scenario, level))
+    print(f"single row: cached point {point_us:6.1f} us   point+interval {interval_us:6.1f} us   "
+          f"(+{interval_us - point_us:.1f} us)")
+
+    print(f"\n{'rows':>10} {'point ms':>10} {'interval ms':>12} {'overhead':>9} {'max err vs pinv':>16}")
+    for rows in SIZES:
+        scenarios = _random_scenarios(rows)
+        point_ms, _ = _best_ms(lambda: predictor.predict_batch(loaded.model, scenarios))
+        interval_ms, intervals = _best_ms(lambda: predictor.predict_interval_batch(loaded.model, scenarios, level))
+
+        sample = scenarios[:500]
+        reference = _reference_half_width(loaded.model, sample, level)
+        error = np.abs((intervals[:500, 2] - intervals[:500, 0]) / reference - 1).max()
+        print(f"{rows:>10,} {point_ms:>10.2f} {interval_ms:>12.2f} {interval_ms / point_ms - 1:>8.0%} {error:>16.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Per-call latency and peak memory of ``QuadraticForm.predict`` versus the sklearn pipeline.
+
+Peak memory is the largest traced allocation during one call (NumPy reports its buffers
+to ``tracemalloc``), which is dominated by the expanded feature matrix on the sklearn path.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+
+import predictor
+from quadratic import export_quadratic
+
+SIZES = (1, 1_000, 100_000, 1_000_000)
+
+
+def _measure(predict, X: np.ndarray, repeats: int) -> tuple[float, float]:
+    predict(X)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        predict(X)
+    latency = (time.perf_counter() - start) / repeats
+
+    tracemalloc.start()
+    predict(X)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return latency, peak
+
+
+def main() -> None:
+    warnings.simplefilter("ignore")
+    pipeline = predictor.load_model(predictor.PICKLE_PATH)
+    form = export_quadratic(pipeline)
+    rng = np.random.default_rng(0)
+
+    print(f"{'rows':>10} {'sklearn ms':>11} {'quad ms':>9} {'speedup':>8} {'sklearn MiB':>12} {'quad MiB':>9}")
+    for rows in SIZES:
+        X = rng.uniform(0, 50, size=(rows, form.n_features_in_))
+        np.testing.assert_allclose(form.predict(X), pipeline.predict(X), rtol=1e-9, atol=1e-6)
+        repeats = max(1, 2_000 // max(1, rows // 100))
+        sk_latency, sk_peak = _measure(pipeline.predict, X, repeats)
+        q_latency, q_peak = _measure(form.predict, X, repeats)
+        print(f"{rows:>10,} {sk_latency * 1e3:>11.3f} {q_latency * 1e3:>9.3f} {sk_latency / q_latency:>7.1f}x "
+              f"{sk_peak / 2**20:>12.2f} {q_peak / 2**20:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
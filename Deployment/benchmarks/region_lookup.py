@@ -0,0 +1,47 @@
+"""Regional median lookups: boolean frame scan versus the precomputed ``region_stats`` index.
+
+The listing table is resampled to larger sizes to show how the per-submit scan grows with
+the data while index lookups stay constant; index build time is reported once per size.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+import data_store
+import region_stats
+
+SIZES = (2_531, 500_000, 5_000_000)
+QUERIES = 200
+
+
+def main() -> None:
+    base = data_store.load_listings()
+    regions = base["Region"].cat.categories.to_numpy()
+    rng = np.random.default_rng(0)
+    queries = rng.choice(regions, QUERIES)
+
+    print(f"{'rows':>10} {'scan ms/query':>14} {'build s':>8} {'index us/query':>15}")
+    for rows in SIZES:
+        df = base.sample(rows, replace=rows > len(base), random_state=0).reset_index(drop=True)
+
+        start = time.perf_counter()
+        scanned = [df.loc[df["Region"] == region, "Price_Lakh"].median() for region in queries[:20]]
+        scan_ms = (time.perf_counter() - start) / 20 * 1e3
+
+        start = time.perf_counter()
+        index = region_stats.build_stats(df)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        looked_up = [index.region(region).median_price for region in queries]
+        index_us = (time.perf_counter() - start) / QUERIES * 1e6
+
+        np.testing.assert_allclose(looked_up[:20], scanned)
+        print(f"{rows:>10,} {scan_ms:>14.3f} {build_s:>8.2f} {index_us:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Local load test for ``service.py`` reporting p50/p99 latency and requests per second.
+
+Starts an in-process server on an ephemeral port unless ``--url`` points at a running one.
+Each worker keeps one persistent HTTP/1.1 connection, as a pooled CRM client would.
+
+    python -m benchmarks.service_load --requests 5000 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import numpy as np
+
+import service
+
+
+def _worker(host: str, port: int, path: str, body: bytes, count: int) -> list[float]:
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    latencies = []
+    headers = {"Content-Type": "application/json"}
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            connection.request("POST", path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError(f"{path} returned HTTP {response.status}")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        connection.close()
+    return latencies
+
+
+def run_load(host: str, port: int, path: str, payload: dict, requests: int, concurrency: int) -> dict:
+    body = json.dumps(payload).encode("utf-8")
+    per_worker = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = pool.map(lambda count: _worker(host, port, path, body, count), per_worker)
+        latencies = np.array([value for chunk in results for value in chunk])
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": float(np.percentile(latencies, 50) * 1e3),
+        "p99_ms": float(np.percentile(latencies, 99) * 1e3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the prediction service")
+    parser.add_argument("--url", help="Base URL of a running service; defaults to an in-process server")
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        server = service.create_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = "127.0.0.1", server.server_port
+
+    scenario = {"Area_SqFt": 1200, "Floor_No": 5, "Bedroom": 2}
+    workloads = [
+        ("/predict", scenario, args.requests),
+        ("/predict/batch", {"scenarios": [scenario] * args.batch_size}, max(args.requests // 10, 1)),
+    ]
+    try:
+        print(f"{'endpoint':<16} {'requests':>9} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+        for path, payload, requests in workloads:
+            stats = run_load(host, port, path, payload, requests, args.concurrency)
+            print(f"{path:<16} {stats['requests']:>9,} {stats['rps']:>9,.0f} "
+                  f"{stats['p50_ms']:>8.2f} {stats['p99_ms']:>8.2f}")
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
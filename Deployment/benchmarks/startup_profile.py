@@ -0,0 +1,71 @@
+"""Per-page cold-start profile of the Streamlit app using ``-X importtime``.
+
+Each page is rendered once with ``streamlit.testing`` in a fresh interpreter. The script run
+time approximates time-to-first-paint, and the importtime log is filtered to the modules
+imported during that run. Point ``--app-dir`` at another checkout to capture a "before"
+profile, e.g. ``git worktree add /tmp/before <rev>``.
+
+    python -m benchmarks.startup_profile --app-dir /tmp/before/Deployment
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+PAGES = ("Home", "Data Analysis", "Prediction", "About")
+HEAVY_MODULES = ("pandas", "pyarrow", "sklearn", "PIL", "numpy")
+MARKER = "--- page run starts ---"
+
+_RUNNER = """
+import sys, time, warnings
+warnings.simplefilter("ignore")
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.session_state["page"] = {page!r}
+print({marker!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+at.run()
+print(f"RUN_MS {{(time.perf_counter() - start) * 1e3:.1f}}")
+"""
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def profile_page(app_path: Path, page: str) -> tuple[float, float, list[str]]:
+    code = _RUNNER.format(app=str(app_path), page=page, marker=MARKER)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=app_path.parent, check=True,
+    )
+    run_ms = float(re.search(r"RUN_MS ([\d.]+)", result.stdout).group(1))
+    _, _, during_run = result.stderr.partition(MARKER)
+    import_us = 0
+    heavy = set()
+    for match in _IMPORT_LINE.finditer(during_run):
+        _, cumulative, indent, module = match.groups()
+        if not indent:
+            import_us += int(cumulative)
+        root = module.split(".")[0]
+        if root in HEAVY_MODULES:
+            heavy.add(root)
+    return run_ms, import_us / 1e3, sorted(heavy)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile per-page Streamlit cold starts")
+    parser.add_argument("--app-dir", type=Path, default=Path(__file__).resolve().parent.parent)
+    args = parser.parse_args()
+    app_path = args.app_dir.resolve() / "app.py"
+
+    print(f"{'page':<15} {'first paint ms':>15} {'import ms':>10}  heavy modules loaded")
+    for page in PAGES:
+        run_ms, import_ms, heavy = profile_page(app_path, page)
+        print(f"{page:<15} {run_ms:>15.1f} {import_ms:>10.1f}  {', '.join(heavy) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Fit time and peak RSS of the notebook's in-memory training versus ``train.train``.
+
+``Final_Project.csv`` is repeated 1x, 100x and 1000x (numeric columns jittered by up to ±2%
+so copies are not identical). "Before" is the notebook cell sequence: read the CSV, one
+reused ``LabelEncoder`` over the object columns, ``train_test_split`` and a sklearn
+``PolynomialFeatures`` + ``LinearRegression`` pipeline. "After" is ``train.train`` on the
+Parquet cache; the one-off CSV-to-Parquet conversion is done beforehand and not timed, as it
+is shared with the app. Each run happens in a fresh interpreter.
+
+    python -m benchmarks.train_scaling [--scales 1 100 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import data_store
+import train
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+
+
+def write_scaled(path: Path, scale: int) -> None:
+    table = pd.read_csv(data_store.DATA_PATH)
+    rng = np.random.default_rng(0)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        for copy in range(scale):
+            part = table.copy()
+            if copy:
+                for column in ("Area_SqFt", "Rate_SqFt", "Price_Lakh"):
+                    part[column] = (part[column] * rng.uniform(0.98, 1.02, len(part))).round(1)
+            part.to_csv(handle, header=copy == 0, index=False)
+
+
+def notebook_fit(csv_path: Path) -> dict:
+    from sklearn.linear_model import LinearRegression
+    from sklearn.model_selection import train_test_split
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import LabelEncoder, PolynomialFeatures
+
+    mum_prop = pd.read_csv(csv_path)
+    mum_prop.drop(columns=["Property_Name", "Location", "Availability", "Bathroom"], inplace=True)
+    le = LabelEncoder()
+    for column in mum_prop.describe(include="object").columns:
+        mum_prop[column] = le.fit_transform(mum_prop[column])
+    X = mum_prop.drop("Price_Lakh", axis=1)
+    y = mum_prop["Price_Lakh"]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.20, random_state=12)
+    poly_model = Pipeline([("poly", PolynomialFeatures(degree=2)), ("linear", LinearRegression(fit_intercept=False))])
+    poly_model.fit(X_train, y_train)
+    return {"r2": poly_model.score(X_test, y_test), "mae": float(np.abs(poly_model.predict(X_test) - y_test).mean())}
+
+
+def _child(mode: str, csv_path: Path, output: Path) -> None:
+    warnings.simplefilter("ignore")
+    start = time.perf_counter()
+    if mode == "before":
+        metrics = notebook_fit(csv_path)
+    else:
+        report = train.train(csv_path, output)
+        metrics = {"r2": report.r2, "mae": report.mae}
+    print(json.dumps({
+        "seconds": time.perf_counter() - start,
+        "peak_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        **metrics,
+    }))
+
+
+def _measure(mode: str, csv_path: Path, output: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.train_scaling", "--child", mode, str(csv_path), str(output)],
+        cwd=BASE_DIR, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(result.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "CSV", "OUTPUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child(args.child[0], Path(args.child[1]), Path(args.child[2]))
+        return
+
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as scratch:
+            csv_path = Path(scratch) / f"train_scaling_x{scale}.csv"
+            write_scaled(csv_path, scale)
+            cache_path = data_store.cache_path_for(csv_path)
+            try:
+                data_store.ensure_cache(csv_path)
+                output = Path(scratch) / "model.json"
+                before = _measure("before", csv_path, output)
+                after = _measure("after", csv_path, output)
+            finally:
+                cache_path.unlink(missing_ok=True)
+            rows = scale * 2531
+            print(f"{scale:>5}x ({rows:>9,} rows)  "
+                  f"before {before['seconds']:7.2f} s {before['peak_mib']:7.0f} MiB R² {before['r2']:.4f}  "
+                  f"after {after['seconds']:7.2f} s {after['peak_mib']:7.0f} MiB R² {after['r2']:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""What-if grid pricing: one ``what_if.sweep`` call versus one prediction per grid point.
+
+"Repeated" prices each point the way a resubmitted scenario form does, through
+``prediction_cache.predict`` with one row per call and an empty cache. It leaves out the
+Streamlit rerun each submit also pays, so it is a lower bound. It is timed on at most
+``LOOP_SAMPLE`` points and extrapolated for larger grids. "Sweep" builds and prices the
+whole grid in one batched call and reshapes it into the (areas, floors, bedrooms) cube
+the surface and curves are sliced from. Both agree on the sampled points.
+
+    python -m benchmarks.what_if_sweep
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+import prediction_cache
+import predictor
+import what_if
+
+# (area steps, floors, bedrooms): 1k, 10k and 100k-point grids over the lab's ranges.
+GRIDS = ((50, 20, 1), (100, 20, 5), (300, 57, 6))
+LOOP_SAMPLE = 2_000
+
+
+def main() -> None:
+    loaded = predictor.current_model()
+    print(f"{'grid points':>12} {'repeated s':>11} {'sweep ms':>9} {'speedup':>9}")
+    for area_steps, floor_count, bedroom_count in GRIDS:
+        areas = what_if.area_axis(500, 5000, area_steps)
+        floors = np.arange(-1, floor_count - 1)
+        bedrooms = np.arange(1, bedroom_count + 1)
+        points = area_steps * floor_count * bedroom_count
+
+        sample = what_if.grid_scenarios(areas, floors, bedrooms)[:LOOP_SAMPLE]
+        cache = prediction_cache.PredictionCache()
+        start = time.perf_counter()
+        looped = np.array([prediction_cache.predict(row[None, :], loaded, cache)[0] for row in sample])
+        repeated_seconds = (time.perf_counter() - start) * points / len(sample)
+
+        start = time.perf_counter()
+        result = what_if.sweep(loaded.model, areas, floors, bedrooms)
+        sweep_seconds = time.perf_counter() - start
+
+        # The cache keys rows rounded to 6 decimals, which shifts off-grid areas by up to 5e-7 sqft.
+        np.testing.assert_allclose(result.prices.ravel()[:len(sample)], looped, rtol=1e-6)
+        print(f"{points:>12,} {repeated_seconds:>11.2f} {sweep_seconds * 1e3:>9.1f} "
+              f"{repeated_seconds / sweep_seconds:>8,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Persistent category dictionary: stable integer codes for the listing table's text columns.
+
+The training notebook re-fits a ``LabelEncoder`` per object column, so a code means "position
+in this file's sorted values" and shifts whenever a new value appears, and the app kept
+``Location`` as Python strings. The dictionary gives every value of ``CODED_COLUMNS`` a code
+once, appends values it has not seen at the end and never renumbers. ``data_store`` keeps it
+as ``categories.json`` next to ``Final_Project.csv`` and the model artifact, and the file is
+committed with them, so every checkout and deployment starts from the same codes; commit it
+again when new data adds values. Columns are held as pandas categoricals over the dictionary
+labels, so a row costs a small integer code instead of a string object. Code arrays produced
+here are int16, or int32 once a column passes 32,767 values.
+
+``decode`` turns codes back into labels for display and ``options`` gives the sorted labels a
+dropdown shows from a precomputed rank table, without sorting strings per rerun. Training
+reads the coded columns from the same cache and the model's ``feature_schema`` remaps a
+column's (small) label list onto its own codes, never every row's string.
+
+    python category_dictionary.py [--data Final_Project.csv]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+CODED_COLUMNS = ("Region", "Property_Age", "Availability", "Area_Tpye", "Location")
+MISSING = -1
+
+_lock = threading.Lock()
+_memo: dict[Path, tuple[tuple[int, int], "CategoryDictionary"]] = {}
+
+
+@dataclass(frozen=True)
+class CategoryDictionary:
+    columns: Mapping[str, tuple[str, ...]]
+    _index: dict[str, pd.Index] = field(init=False, repr=False, compare=False)
+    _rank: dict[str, np.ndarray] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        index = {column: pd.Index(labels, dtype=object) for column, labels in self.columns.items()}
+        # rank[code] = position of the label in sorted order, so sorting codes never compares strings.
+        rank = {column: np.argsort(np.argsort(np.asarray(labels, dtype=object), kind="stable"))
+                for column, labels in self.columns.items()}
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_rank", rank)
+
+    def labels(self, column: str) -> tuple[str, ...]:
+        return self.columns.get(column, ())
+
+    def code_dtype(self, column: str) -> np.dtype:
+        return np.dtype(np.int16 if len(self.labels(column)) <= np.iinfo(np.int16).max else np.int32)
+
+    def encode(self, column: str, values) -> np.ndarray:
+        """Dictionary code of every value, ``MISSING`` where it is null or not in the dictionary."""
+        values = pd.Series(values, copy=False)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Remap the column's own categories, not every row's string.
+            lookup = self._lookup(column).get_indexer(values.cat.categories.astype(str))
+            codes = values.cat.codes.to_numpy()
+            encoded = np.where(codes >= 0, lookup[codes] if len(lookup) else MISSING, MISSING)
+        else:
+            encoded = self._lookup(column).get_indexer(values.astype(object).where(values.notna(), None))
+        return encoded.astype(self.code_dtype(column))
+
+    def decode(self, column: str, codes) -> np.ndarray:
+        """Labels for ``codes`` as an object array, ``None`` for ``MISSING``."""
+        codes = np.asarray(codes, dtype=np.int64)
+        labels = np.asarray(self.labels(column) + (None,), dtype=object)
+        return labels[np.where((codes >= 0) & (codes < len(labels) - 1), codes, len(labels) - 1)]
+
+    def categorical(self, column: str, values) -> pd.Series:
+        """``values`` as a categorical whose codes are the dictionary codes."""
+        values = pd.Series(values, copy=False)
+        if isinstance(values.dtype, pd.CategoricalDtype) and values.cat.categories.equals(self._lookup(column)):
+            return values
+        codes = self.encode(column, values)
+        return pd.Series(pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(self._lookup(column))),
+                         index=values.index, name=values.name)
+
+    def rank(self, column: str) -> np.ndarray:
+        """``rank[code]`` = position of the code's label in alphabetical order."""
+        return self._rank.get(column, np.zeros(0, dtype=np.intp))
+
+    def options(self, column: str, codes=None) -> list[str]:
+        """Sorted labels of ``column``, limited to those occurring in ``codes`` when given."""
+        size = len(self.labels(column))
+        present = np.arange(size)
+        if codes is not None:
+            codes = np.asarray(codes)
+            present = np.flatnonzero(np.bincount(codes[codes >= 0], minlength=size))
+        present = present[np.argsort(self.rank(column)[present], kind="stable")]
+        return [self.columns[column][code] for code in present]
+
+    def extend(self, columns: Mapping[str, object]) -> "CategoryDictionary":
+        """Dictionary with the unseen values of each column appended (sorted); ``self`` if none are new."""
+        merged = dict(self.columns)
+        for column, values in columns.items():
+            values = pd.Series(values, copy=False)
+            distinct = values.cat.categories if isinstance(values.dtype, pd.CategoricalDtype) else values.dropna().unique()
+            distinct = pd.Index(distinct, dtype=object).astype(str)
+            unseen = distinct[self._lookup(column).get_indexer(distinct) < 0]
+            if len(unseen):
+                merged[column] = self.labels(column) + tuple(sorted(set(unseen)))
+        return self if merged == dict(self.columns) else CategoryDictionary(merged)
+
+    def to_dict(self) -> dict:
+        return {"columns": {column: list(labels) for column, labels in self.columns.items()}}
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "CategoryDictionary":
+        return cls({column: tuple(map(str, labels)) for column, labels in payload.get("columns", {}).items()})
+
+    def _lookup(self, column: str) -> pd.Index:
+        return self._index.get(column, pd.Index([], dtype=object))
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read(path: Path) -> CategoryDictionary:
+    stamp = _stamp(path)
+    cached = _memo.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    dictionary = CategoryDictionary({})
+    if stamp is not None:
+        dictionary = CategoryDictionary.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    _memo[path] = (stamp, dictionary)
+    return dictionary
+
+
+def load(path: Path) -> CategoryDictionary:
+    """The dictionary stored at ``path`` (empty if there is none), re-read only when the file changes."""
+    path = Path(path).resolve()
+    with _lock:
+        return _read(path)
+
+
+def save(dictionary: CategoryDictionary, path: Path) -> None:
+    """Atomically write ``dictionary`` to ``path``."""
+    path = Path(path).resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    # One label per line, so a committed dictionary diffs as appended labels.
+    tmp_path.write_text(json.dumps(dictionary.to_dict(), ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def update(path: Path, columns: Mapping[str, object]) -> CategoryDictionary:
+    """Append the unseen values in ``columns`` to the dictionary at ``path`` and return it."""
+    path = Path(path).resolve()
+    with _lock:
+        current = _read(path)
+        extended = current.extend(columns)
+        if extended is not current:
+            save(extended, path)
+            _memo[path] = (_stamp(path), extended)
+        return extended
+
+
+def main() -> None:
+    import data_store
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", type=Path, default=data_store.DATA_PATH, help="Listing CSV to encode")
+    args = parser.parse_args()
+
+    df = data_store.load_listings(args.data)
+    dictionary = data_store.load_dictionary()
+    print(f"{'column':<14} {'labels':>7} {'present':>8} {'codes':>6}")
+    for column in CODED_COLUMNS:
+        present = dictionary.options(column, df[column].cat.codes.to_numpy())
+        print(f"{column:<14} {len(dictionary.labels(column)):>7,} {len(present):>8,} {dictionary.code_dtype(column).name:>6}")
+
+
+if __name__ == "__main__":
+    main()
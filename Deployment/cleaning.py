@@ -0,0 +1,155 @@
+"""Vectorized cleaning of scraped 99acres listings.
+
+Packages the steps of ``99acres Data Cleaning.ipynb`` as column-wise ``str`` operations with
+precompiled patterns, so it works for any number of rows. Scraped text repeats heavily (one
+locality, floor label or price string is shared by many listings), so every transform runs
+once per distinct value and is broadcast back through the factorized codes. The output is
+byte-identical to the
+notebook's own code: ``clean_raw`` reproduces ``Property_Location.csv`` and ``project`` the
+column selection written to ``Mumbai_Property.csv``. The checked-in ``Mumbai_Property.csv``
+also carries later manual edits (curated regions, possession dates folded into
+``Under Construction``) that no notebook step produces.
+
+    python cleaning.py ../Datasets/Raw_Property.csv ../Datasets/Mumbai_Property_Clean.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FINAL_COLUMNS = ["Property_Name", "Location", "Region", "Property_Age", "Availability", "Area_Tpye",
+                 "Area_SqFt", "Rate_SqFt", "Floor_No", "Bedroom", "Bathroom", "Price_Lakh"]
+
+_NON_AREA = re.compile(r"[^0-9.]")
+_AREA_NUMBER = re.compile(r"([0-9.]+)")
+_AREA_WORDS = re.compile(r"([a-zA-Z]+)[^a-zA-Z]+([a-zA-Z]+)")
+_NON_FLOOR = re.compile(r"[^0-9-]")
+_NON_REGION = re.compile(r"[^a-zA-Z-]")
+_REGION_NOISE = re.compile("|".join(
+    ["[0-9]", "East", "West", "South", "Suburbs", "Sector", "Beyond", "And Beyond", "Scheme"]
+))
+_LAST_THREE = re.compile(r"(\S+)\s+(\S+)\s+\S+$")
+_LAST_TWO = re.compile(r"(\S+)\s+(\S+)$")
+_NON_ADDRESS = re.compile(r"[^a-zA-Z0-9]")
+
+
+def _distinct(column: pd.Series, transform) -> pd.Series:
+    """Apply ``transform`` to the distinct values of ``column`` and map the results back."""
+    codes, uniques = pd.factorize(column)
+    mapped = transform(pd.Series(uniques, dtype=object)).to_numpy(dtype=object)
+    # Code -1 marks a missing value and picks the appended NaN.
+    return pd.Series(np.append(mapped, np.nan)[codes], index=column.index)
+
+
+def _area_sqft(area: pd.Series) -> pd.Series:
+    return area.str.replace(_NON_AREA, " ", regex=True).str.extract(_AREA_NUMBER, expand=False)
+
+
+def _area_type(area: pd.Series) -> pd.Series:
+    words = area.str.extract(_AREA_WORDS)
+    return (
+        (words[0] + " " + words[1]).str.title()
+        .str.replace("Super Built", "Super Built Up", regex=False)
+        .str.replace("Built Up", "Built Up Area", regex=False)
+        .str.replace("Carpet Area ", "Carpet Area", regex=False)
+    )
+
+
+def _availability(availability: pd.Series) -> pd.Series:
+    return availability.str.title().str.replace(" Property", "", regex=False).str.lstrip()
+
+
+def _floor(floor: pd.Series) -> pd.Series:
+    return (
+        floor.str.replace("Ground", "0", regex=False).str.replace("Basement", "-1", regex=False)
+        .str.replace(_NON_FLOOR, "", regex=True)
+    )
+
+
+def _region(location: pd.Series) -> pd.Series:
+    words = (
+        location.str.replace(_NON_REGION, " ", regex=True).str.title()
+        .str.replace(_REGION_NOISE, "", regex=True).str.strip()
+    )
+    # Third- and second-last words, or the last two when only two remain.
+    three = words.str.extract(_LAST_THREE)
+    two = words.str.extract(_LAST_TWO)
+    return (three[0] + " " + three[1]).fillna(two[0] + " " + two[1])
+
+
+def _address(location: pd.Series) -> pd.Series:
+    return (
+        location.str.replace(_NON_ADDRESS, " ", regex=True)
+        .str.replace("   ", " ", regex=False).str.replace("  ", " ", regex=False)
+    )
+
+
+def _price_lakh(price: pd.Series) -> pd.Series:
+    lakh = price.str.contains("Lac", regex=False)
+    crore = ~lakh & price.str.contains("Crore", regex=False)
+    values = pd.Series(np.nan, index=price.index)
+    values[lakh] = pd.to_numeric(price[lakh].str.strip("Lac"))
+    values[crore] = pd.to_numeric(price[crore].str.strip("Crore")) * 100
+    formatted = pd.Series(None, index=price.index, dtype=object)
+    priced = lakh | crore
+    formatted[priced] = np.char.mod("%.1f", values[priced].to_numpy())
+    return formatted
+
+
+def clean_raw(raw: pd.DataFrame) -> pd.DataFrame:
+    """Apply the notebook's cleaning steps; the result matches ``Property_Location.csv``."""
+    df = raw.copy()
+    df["Property_Age"] = _distinct(df["Property_Age"], lambda age: age.str.replace(" Old", "", regex=False))
+    df["Rate_SqFt"] = _distinct(df["Rate_SqFt"], lambda rate: rate.str.replace(",", "", regex=False))
+    df["Availability"] = _distinct(df["Availability"], _availability)
+    df["Area_SqFt"] = _distinct(df["Area_Tpye"], _area_sqft)
+    df["Area_Tpye"] = _distinct(df["Area_Tpye"], _area_type)
+    df["Floor_No"] = _distinct(df["Floor_No"], _floor)
+    location = _distinct(df["Location"], lambda text: text.str.lstrip())
+    df["Region"] = _distinct(location, _region)
+    df["Location"] = _distinct(location, _address)
+    df["Price_Lakh"] = _distinct(df["Price"], _price_lakh)
+    return df.dropna().reset_index(drop=True)
+
+
+def _infer_numeric(column: pd.Series) -> pd.Series:
+    """Type a text column the way ``read_csv`` would on reading it back."""
+    if column.dtype != object:
+        return column
+    try:
+        return pd.to_numeric(column.replace("", np.nan))
+    except (ValueError, TypeError):
+        return column
+
+
+def project(located: pd.DataFrame) -> pd.DataFrame:
+    """Type and order the cleaned columns as in ``Mumbai_Property.csv``."""
+    return located[FINAL_COLUMNS].apply(_infer_numeric)
+
+
+def clean_file(raw_path: Path, out_path: Path, located_path: Path | None = None) -> pd.DataFrame:
+    located = clean_raw(pd.read_csv(raw_path))
+    if located_path is not None:
+        located.to_csv(located_path, index=False)
+    final = project(located)
+    final.to_csv(out_path, index=False)
+    return final
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Clean a raw 99acres listing CSV")
+    parser.add_argument("raw", type=Path)
+    parser.add_argument("out", type=Path)
+    parser.add_argument("--located", type=Path, help="Also write the intermediate Property_Location table")
+    args = parser.parse_args()
+    final = clean_file(args.raw, args.out, args.located)
+    print(f"Wrote {len(final):,} cleaned listings to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
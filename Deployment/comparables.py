@@ -0,0 +1,121 @@
+"""Nearest comparable listings over the geocoded table, via a haversine ball tree.
+
+``Map_Location.csv`` carries coordinates for the listings Nominatim could place. The tree is
+built once per file version (mtime and size) and kept in memory; a query returns the ``k``
+nearest listings with their distances and price statistics. Statistics are computed from
+plain arrays so a lookup stays well under a millisecond even at a million listings; the
+listing rows themselves are only materialised when asked for. The app reads the copy shipped
+in ``Deployment/``; without it ``load_index`` returns ``None`` and callers skip comparables.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import geocoding
+
+BASE_DIR = Path(__file__).resolve().parent
+# Shipped alongside Final_Project.csv; refresh it from ``geocoding.MAP_LOCATION_PATH`` after geocoding.
+MAP_LOCATION_PATH = BASE_DIR / geocoding.MAP_LOCATION_PATH.name
+EARTH_RADIUS_KM = 6371.0088
+LISTING_COLUMNS = ["Property_Name", "Location", "Region", "Price_Lakh", "Area_SqFt", "Rate_SqFt", "Bedroom"]
+
+_lock = threading.Lock()
+_memo: dict[Path, tuple[tuple[int, int], "ComparableIndex"]] = {}
+
+
+@dataclass(frozen=True)
+class Comparables:
+    table: pd.DataFrame
+    positions: np.ndarray
+    distances_km: np.ndarray
+    median_price: float
+    price_q25: float
+    price_q75: float
+    median_rate_sqft: float
+
+    @property
+    def count(self) -> int:
+        return len(self.positions)
+
+    @property
+    def radius_km(self) -> float:
+        return float(self.distances_km[-1])
+
+    @cached_property
+    def listings(self) -> pd.DataFrame:
+        rows = self.table.iloc[self.positions][LISTING_COLUMNS].reset_index(drop=True)
+        return rows.assign(Distance_km=self.distances_km)
+
+
+class ComparableIndex:
+    """Ball tree over the listing coordinates plus the arrays the statistics are drawn from."""
+
+    def __init__(self, table: pd.DataFrame) -> None:
+        # Imported here so pages that never query comparables do not load scikit-learn's neighbours code.
+        from sklearn.neighbors import BallTree
+
+        self.table = table.dropna(subset=["Latitude", "Longitude"]).reset_index(drop=True)
+        self._tree = BallTree(np.radians(self.table[["Latitude", "Longitude"]].to_numpy()), metric="haversine")
+        self._price = self.table["Price_Lakh"].to_numpy(dtype=float)
+        self._rate = self.table["Rate_SqFt"].to_numpy(dtype=float)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def nearest(self, latitude: float, longitude: float, k: int = 10) -> Comparables:
+        k = min(k, len(self.table))
+        distances, positions = self._tree.query(np.radians([[latitude, longitude]]), k=k)
+        positions = positions[0]
+        price = self._price[positions]
+        q25, median, q75 = np.percentile(price, [25, 50, 75])
+        return Comparables(
+            table=self.table,
+            positions=positions,
+            distances_km=distances[0] * EARTH_RADIUS_KM,
+            median_price=float(median),
+            price_q25=float(q25),
+            price_q75=float(q75),
+            median_rate_sqft=float(np.median(self._rate[positions])),
+        )
+
+    @cached_property
+    def _names(self) -> dict[str, tuple[float, float]]:
+        # Address and region keys are only needed by name lookups, so they are built on first use.
+        centroids = geocoding.region_centroids(self.table)
+        names = dict(zip(centroids.index, zip(centroids["Latitude"], centroids["Longitude"])))
+        keys = geocoding.normalize_addresses(self.table["Location"])
+        first = ~keys.duplicated()
+        coordinates = zip(self.table["Latitude"][first].astype(float), self.table["Longitude"][first].astype(float))
+        names.update(zip(keys[first], coordinates))
+        return names
+
+    def locate(self, location: str) -> tuple[float, float] | None:
+        """Coordinates for a listing address, else for a region centroid, else ``None``."""
+        return self._names.get(geocoding.normalize_address(location))
+
+    def nearest_to(self, location: str, k: int = 10) -> Comparables | None:
+        point = self.locate(location)
+        return None if point is None else self.nearest(*point, k=k)
+
+
+def load_index(path: Path = MAP_LOCATION_PATH) -> ComparableIndex | None:
+    """Return the index for ``path``, rebuilding it only when the file changes; ``None`` if it is missing."""
+    path = Path(path).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _memo.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, ComparableIndex(pd.read_csv(path)))
+            _memo[path] = cached
+        return cached[1]
@@ -0,0 +1,147 @@
+"""Shared, typed access to the ``Final_Project.csv`` listing table.
+
+The CSV is parsed once into a Parquet file under ``.cache/``. The text columns in
+``category_dictionary.CODED_COLUMNS`` are stored as categoricals whose codes come from the
+category dictionary committed next to the CSV (``categories.json``), so they stay stable
+across dataset versions and machines and cost a small integer per row. The Parquet footer
+records the source CSV's mtime, size and SHA-256, so the cache is rebuilt automatically when
+the CSV changes. Within a process every page shares a single in-memory copy; callers must
+treat it as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import category_dictionary
+
+BASE_DIR = Path(__file__).resolve().parent
+DATA_PATH = BASE_DIR / "Final_Project.csv"
+CACHE_DIR = BASE_DIR / ".cache"
+# Versioned with the data and the model, unlike the rebuildable files under CACHE_DIR.
+DICTIONARY_PATH = BASE_DIR / "categories.json"
+
+CATEGORICAL_COLUMNS = category_dictionary.CODED_COLUMNS
+# Bumped when the cached table's column encoding changes, so older caches are re-parsed.
+CACHE_LAYOUT = "2"
+
+_META_MTIME = b"source_mtime_ns"
+_META_SIZE = b"source_size"
+_META_SHA256 = b"source_sha256"
+_META_LAYOUT = b"layout"
+
+_lock = threading.Lock()
+_memo: dict[Path, tuple[tuple[int, int], str, pd.DataFrame]] = {}
+
+
+def cache_path_for(csv_path: Path = DATA_PATH) -> Path:
+    return CACHE_DIR / f"{Path(csv_path).stem}.parquet"
+
+
+def dictionary_path() -> Path:
+    return DICTIONARY_PATH
+
+
+def load_dictionary() -> category_dictionary.CategoryDictionary:
+    """The persistent dictionary behind the codes of ``CATEGORICAL_COLUMNS``."""
+    return category_dictionary.load(dictionary_path())
+
+
+def encode_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """Recode ``CATEGORICAL_COLUMNS`` of ``df`` in place onto the dictionary, adding unseen values to it."""
+    columns = [column for column in CATEGORICAL_COLUMNS if column in df.columns]
+    dictionary = category_dictionary.update(dictionary_path(), {column: df[column] for column in columns})
+    for column in columns:
+        df[column] = dictionary.categorical(column, df[column])
+    return df
+
+
+def _fingerprint(csv_path: Path) -> tuple[int, int]:
+    stat = os.stat(csv_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_parquet(table: pa.Table, path: Path, metadata: dict[bytes, bytes]) -> None:
+    """Atomically write ``table`` to ``path`` with extra key/value footer metadata."""
+    merged = dict(table.schema.metadata or {})
+    merged.update(metadata)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    pq.write_table(table.replace_schema_metadata(merged), tmp_path)
+    os.replace(tmp_path, path)
+
+
+def read_metadata(path: Path) -> dict[bytes, bytes]:
+    try:
+        return pq.read_schema(path).metadata or {}
+    except (FileNotFoundError, pa.ArrowInvalid, OSError):
+        return {}
+
+
+def read_csv_typed(csv_path: Path = DATA_PATH) -> pd.DataFrame:
+    """Parse the listing CSV with the dictionary-coded categoricals used throughout the app."""
+    return encode_categories(pd.read_csv(csv_path, dtype={column: "category" for column in CATEGORICAL_COLUMNS}))
+
+
+def ensure_cache(csv_path: Path = DATA_PATH) -> tuple[Path, str]:
+    """Make sure the Parquet cache reflects ``csv_path`` and return it with the dataset version.
+
+    A changed mtime alone only triggers a re-hash; the CSV is re-parsed only when its
+    content hash differs from the one recorded in the cache.
+    """
+    csv_path = Path(csv_path)
+    cache_path = cache_path_for(csv_path)
+    fingerprint = _fingerprint(csv_path)
+    metadata = read_metadata(cache_path)
+    recorded = (int(metadata.get(_META_MTIME, -1)), int(metadata.get(_META_SIZE, -1)))
+    current_layout = metadata.get(_META_LAYOUT, b"").decode() == CACHE_LAYOUT
+    if recorded == fingerprint and current_layout:
+        return cache_path, metadata[_META_SHA256].decode()
+
+    digest = _sha256(csv_path)
+    if metadata.get(_META_SHA256, b"").decode() == digest and current_layout:
+        table = pq.read_table(cache_path)
+    else:
+        table = pa.Table.from_pandas(read_csv_typed(csv_path))
+    write_parquet(table, cache_path, {
+        _META_MTIME: str(fingerprint[0]).encode(),
+        _META_SIZE: str(fingerprint[1]).encode(),
+        _META_SHA256: digest.encode(),
+        _META_LAYOUT: CACHE_LAYOUT.encode(),
+    })
+    return cache_path, digest
+
+
+def load_listings(csv_path: Path = DATA_PATH) -> pd.DataFrame:
+    """Return the process-wide copy of the listing table, refreshing it if the CSV changed."""
+    csv_path = Path(csv_path).resolve()
+    fingerprint = _fingerprint(csv_path)
+    with _lock:
+        cached = _memo.get(csv_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[2]
+        cache_path, version = ensure_cache(csv_path)
+        df = encode_categories(pq.read_table(cache_path).to_pandas())
+        df.attrs["dataset_version"] = version
+        _memo[csv_path] = (fingerprint, version, df)
+        return df
+
+
+def dataset_version(csv_path: Path = DATA_PATH) -> str:
+    """Content hash of the CSV currently backing ``load_listings``."""
+    return load_listings(csv_path).attrs["dataset_version"]
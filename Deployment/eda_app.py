@@ -1,16 +1,55 @@
 from pathlib import Path
-import pandas as pd
-from PIL import Image
 import streamlit as st
 
+import assets
+import data_store
+import form_metadata
+import listing_browser
+import region_stats
+
 BASE_DIR = Path(__file__).resolve().parent
 IMG_DIR = BASE_DIR / "IMG"
-DATA_PATH = BASE_DIR / "Final_Project.csv"
+DATA_PATH = data_store.DATA_PATH
+
+PLOT_CATALOG = [
+	("Real_Estate.jpg", "Market pulse overview", "A wide-angle look at the aggregated inventory landscape."),
+	("Price_Range_Distribution.png", "Price range distribution", "Price density reveals asymmetric premium clusters."),
+	("Property_Floor_Numbers_Bar.png", "Floor level vs price", "Higher floors command a notable premium in vertical micro-markets."),
+	("BednBath_Price_Bar.png", "Bedrooms & bathrooms", "Bedroom-bathroom pairings that bend the price curve."),
+	("Price_Age_Distribution.png", "Age vs price", "Legacy developments still dominate the luxury segment."),
+	("SqFt_Area_Price_Scatter.png", "Area vs price scatter", "Non-linear pockets of value across square-footage bands."),
+	("Central Mumbai.png", "Central Mumbai spotlight", "Premium cores with steep appreciation trajectories."),
+	("South Mumbai.png", "South Mumbai spotlight", "Historic enclaves balancing heritage and demand."),
+	("Thane.png", "Thane spotlight", "Satellite expansions pulling in mid-market budgets."),
+]
 
 
-@st.cache_data(show_spinner=False)
-def _load_dataset() -> pd.DataFrame:
-	return pd.read_csv(DATA_PATH)
+def _browse_query(stats: region_stats.StatsIndex) -> tuple[listing_browser.ListingQuery, int, int]:
+	meta = form_metadata.load_metadata(DATA_PATH)
+	price_low = float(stats.describe.loc["Price_Lakh", "min"])
+	price_high = float(stats.describe.loc["Price_Lakh", "max"])
+	filters = st.columns(4, gap="large")
+	regions = filters[0].multiselect("Regions", meta.regions, key="browse-regions")
+	price = filters[1].slider("Price (Lakh)", price_low, price_high, (price_low, price_high), key="browse-price")
+	bedrooms = filters[2].multiselect("Bedrooms", meta.bedrooms, key="browse-bedrooms")
+	availability = filters[3].multiselect("Availability", meta.availabilities, key="browse-availability")
+	controls = st.columns(4, gap="large")
+	sort_by = controls[0].selectbox("Sort by", ("Row order", *listing_browser.SORT_COLUMNS), key="browse-sort")
+	descending = controls[1].toggle("Descending", key="browse-descending")
+	page_size = controls[2].selectbox("Rows per page", listing_browser.PAGE_SIZES,
+		index=listing_browser.PAGE_SIZES.index(listing_browser.PAGE_SIZE), key="browse-page-size")
+	number = controls[3].number_input("Page", min_value=1, value=1, step=1, key="browse-page")
+	query = listing_browser.ListingQuery(
+		regions=tuple(regions),
+		# The full slider range means "no price filter", so rows without a price stay visible.
+		price_min=price[0] if price[0] > price_low else None,
+		price_max=price[1] if price[1] < price_high else None,
+		bedrooms=tuple(bedrooms),
+		availability=tuple(availability),
+		sort_by=None if sort_by == "Row order" else sort_by,
+		descending=descending,
+	)
+	return query, int(number), int(page_size)
 
 
 def _chunk(items, size):
@@ -25,7 +64,7 @@ def run_eda_app() -> None:
 		unsafe_allow_html=True,
 	)
 
-	df = _load_dataset()
+	stats = region_stats.load_stats(DATA_PATH)
 	submenu = st.sidebar.radio(
 		"Analysis lens",
 		["Descriptive overview", "Visual gallery"],
@@ -34,16 +73,25 @@ def run_eda_app() -> None:
 	)
 
 	metrics = st.columns(4, gap="large")
-	metrics[0].metric("Median price", f"{df['Price_Lakh'].median():,.0f} Lakh")
-	metrics[1].metric("Median area", f"{df['Area_SqFt'].median():,.0f} SqFt")
-	metrics[2].metric("Ready-to-move", f"{(df['Availability'] == 'Ready To Move').mean() * 100:,.0f}%")
-	metrics[3].metric("Median rate / SqFt", f"₹{df['Rate_SqFt'].median():,.0f}")
+	metrics[0].metric("Median price", f"{stats.overall['median_price']:,.0f} Lakh")
+	metrics[1].metric("Median area", f"{stats.overall['median_area']:,.0f} SqFt")
+	metrics[2].metric("Ready-to-move", f"{stats.overall['ready_to_move_share'] * 100:,.0f}%")
+	metrics[3].metric("Median rate / SqFt", f"₹{stats.overall['median_rate_sqft']:,.0f}")
 
 	if submenu == "Descriptive overview":
+		st.markdown("#### Dataset browser")
+		query, number, page_size = _browse_query(stats)
 		preview_cols = st.columns([2, 1], gap="large")
 		with preview_cols[0]:
-			st.markdown("#### Dataset snapshot")
-			st.dataframe(df.head(30), use_container_width=True)
+			# Filtering, sorting and paging run server-side; only the visible page is sent.
+			page = listing_browser.load_browser(DATA_PATH).page(query, number, page_size)
+			st.dataframe(page.rows, use_container_width=True)
+			st.markdown(
+				f"<span class='stat-note'>Rows {page.first_row:,}–{page.first_row + len(page.rows) - 1:,} "
+				f"of {page.total_rows:,} (page {page.number:,} of {page.pages:,}) · fetched in {page.seconds * 1e3:,.1f} ms</span>"
+				if page.total_rows else "<span class='stat-note'>No listings match these filters.</span>",
+				unsafe_allow_html=True,
+			)
 		with preview_cols[1]:
 			st.markdown("#### Feature glossary")
 			st.markdown(
@@ -57,30 +105,16 @@ def run_eda_app() -> None:
 			)
 
 		st.markdown("#### Summary statistics")
-		st.dataframe(df.describe().T, use_container_width=True)
+		st.dataframe(stats.describe, use_container_width=True)
 
 		st.markdown("#### Dominant regions")
-		top_regions = df["Region"].value_counts().head(12)
-		st.bar_chart(top_regions)
+		st.bar_chart(stats.top_regions(12))
 
 	else:
 		st.markdown("#### Visual gallery")
-		plot_catalog = [
-			("Real_Estate.jpg", "Market pulse overview", "A wide-angle look at the aggregated inventory landscape."),
-			("Price_Range_Distribution.png", "Price range distribution", "Price density reveals asymmetric premium clusters."),
-			("Property_Floor_Numbers_Bar.png", "Floor level vs price", "Higher floors command a notable premium in vertical micro-markets."),
-			("BednBath_Price_Bar.png", "Bedrooms & bathrooms", "Bedroom-bathroom pairings that bend the price curve."),
-			("Price_Age_Distribution.png", "Age vs price", "Legacy developments still dominate the luxury segment."),
-			("SqFt_Area_Price_Scatter.png", "Area vs price scatter", "Non-linear pockets of value across square-footage bands."),
-			("Central Mumbai.png", "Central Mumbai spotlight", "Premium cores with steep appreciation trajectories."),
-			("South Mumbai.png", "South Mumbai spotlight", "Historic enclaves balancing heritage and demand."),
-			("Thane.png", "Thane spotlight", "Satellite expansions pulling in mid-market budgets."),
-		]
-
-		for row in _chunk(plot_catalog, 3):
+		for row in _chunk(PLOT_CATALOG, 3):
 			cols = st.columns(len(row), gap="large")
 			for col, (filename, title, caption) in zip(cols, row):
 				with col:
-					image = Image.open(IMG_DIR / filename)
-					st.image(image, caption=title, use_container_width=True)
+					st.image(assets.image_bytes(filename, assets.GALLERY_WIDTH), caption=title, use_container_width=True)
 					st.markdown(f"<span class='stat-note'>{caption}</span>", unsafe_allow_html=True)
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""Typed description of the model's input columns, shipped inside the model artifact.
+
+The training notebook label-encodes ``Region``, ``Property_Age`` and ``Area_Tpye`` and fits on
+``Region, Property_Age, Area_Tpye, Area_SqFt, Rate_SqFt, Floor_No, Bedroom`` in that order.
+Callers used to rebuild that vector by hand, and got the slots wrong. A ``FeatureSchema``
+records the column order, each column's dtype, the category list of every encoded column
+(code = position) and a default for columns a caller leaves out. ``matrix`` turns raw values
+into the model input one column at a time, so a million rows cost a handful of numpy
+operations. ``check`` runs when an artifact is loaded, so a schema that does not match the
+model's inputs is rejected up front rather than mispredicting.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+CATEGORY = "category"
+NUMERIC = "float64"
+
+
+@dataclass(frozen=True)
+class Feature:
+    name: str
+    dtype: str
+    categories: tuple[str, ...] = ()
+    default: float | str | None = None
+    _codes: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_codes", {category: code for code, category in enumerate(self.categories)})
+
+    @property
+    def is_categorical(self) -> bool:
+        return self.dtype == CATEGORY
+
+    def code(self, value) -> float:
+        """Code of a single category; ValueError if the model does not know it."""
+        try:
+            return float(self._codes[str(value)])
+        except KeyError:
+            raise ValueError(
+                f"Unknown {self.name} {value!r}; the model knows {len(self.categories)} categories"
+            ) from None
+
+
+@dataclass(frozen=True)
+class FeatureSchema:
+    features: tuple[Feature, ...]
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(feature.name for feature in self.features)
+
+    def feature(self, name: str) -> Feature:
+        for feature in self.features:
+            if feature.name == name:
+                return feature
+        raise KeyError(name)
+
+    @property
+    def encoders(self) -> dict[str, list[str]]:
+        return {feature.name: list(feature.categories) for feature in self.features if feature.is_categorical}
+
+    @classmethod
+    def from_encoders(cls, names, encoders: Mapping[str, list[str]],
+                      defaults: Mapping[str, float | str] | None = None) -> "FeatureSchema":
+        """Schema for columns ``names``; those in ``encoders`` are categorical, the rest numeric."""
+        defaults = defaults or {}
+        return cls(tuple(
+            Feature(name, CATEGORY, tuple(map(str, encoders[name])), defaults.get(name)) if name in encoders
+            else Feature(name, NUMERIC, (), None if defaults.get(name) is None else float(defaults[name]))
+            for name in names
+        ))
+
+    def to_dict(self) -> dict:
+        return {"features": [
+            {"name": feature.name, "dtype": feature.dtype, "categories": list(feature.categories),
+             "default": feature.default}
+            for feature in self.features
+        ]}
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "FeatureSchema":
+        return cls(tuple(
+            Feature(entry["name"], entry["dtype"], tuple(entry.get("categories") or ()), entry.get("default"))
+            for entry in payload["features"]
+        ))
+
+    def check(self, feature_names, n_inputs: int) -> None:
+        """Raise ValueError unless this schema describes a model taking ``feature_names``."""
+        if list(self.names) != [str(name) for name in feature_names]:
+            raise ValueError(
+                f"Feature schema columns {list(self.names)} do not match the model's {list(feature_names)}"
+            )
+        if len(self.features) != n_inputs:
+            raise ValueError(f"Feature schema has {len(self.features)} columns but the model takes {n_inputs}")
+        for feature in self.features:
+            if feature.dtype not in (CATEGORY, NUMERIC):
+                raise ValueError(f"Unsupported dtype {feature.dtype!r} for {feature.name}")
+            if feature.is_categorical and not feature.categories:
+                raise ValueError(f"Categorical column {feature.name} has no categories")
+            if feature.is_categorical and feature.default is not None and str(feature.default) not in feature._codes:
+                raise ValueError(f"Default {feature.default!r} is not a {feature.name} category")
+
+    def matrix(self, columns: pd.DataFrame | Mapping[str, np.ndarray], fixed: Mapping[str, object] | None = None,
+               rows: int | None = None) -> np.ndarray:
+        """(rows, features) model input from raw values, one vectorized pass per column.
+
+        Each column comes from ``columns`` (a DataFrame or a mapping of equal-length arrays),
+        else from the scalar in ``fixed``, else from the schema default; missing values in a
+        supplied column also take the default. Categories outside the schema, and numbers that
+        are infinite or missing without a default, raise ValueError.
+        """
+        fixed = fixed or {}
+        if rows is None:
+            rows = len(columns) if isinstance(columns, pd.DataFrame) else len(next(iter(columns.values()), ()))
+        out = np.empty((rows, len(self.features)))
+        for position, feature in enumerate(self.features):
+            if feature.name in columns:
+                values = columns[feature.name]
+            elif fixed.get(feature.name) is not None:
+                values = fixed[feature.name]
+            elif feature.default is not None:
+                values = feature.default
+            else:
+                raise ValueError(f"No value for {feature.name} and the schema has no default for it")
+            out[:, position] = self._column(feature, values)
+        return out
+
+    def _column(self, feature: Feature, values) -> np.ndarray | float:
+        if isinstance(values, (str, int, float, np.generic)):
+            # A constant column: one lookup, broadcast by the caller.
+            if values != values:
+                values = feature.default
+            if feature.is_categorical:
+                return feature.code(values)
+            return float(self._finite(feature, np.array([np.nan if values is None else values], dtype=float))[0])
+
+        if not feature.is_categorical:
+            if isinstance(values, np.ndarray) and values.dtype.kind in "fiub":
+                numbers = values.astype(float, copy=False)
+            else:
+                numbers = pd.to_numeric(pd.Series(values, copy=False), errors="raise").to_numpy(dtype=float)
+            return self._finite(feature, numbers)
+        series = pd.Series(values, copy=False)
+        if feature.default is not None:
+            series = series.where(series.notna(), feature.default)
+        codes = category_codes(series, feature.categories)
+        unknown = np.isnan(codes)
+        if unknown.any():
+            sample = sorted(set(map(str, series[unknown].unique())))[:5]
+            raise ValueError(
+                f"Unknown {feature.name} value(s) {sample}; the model knows {len(feature.categories)} categories"
+            )
+        return codes
+
+    @staticmethod
+    def _finite(feature: Feature, numbers: np.ndarray) -> np.ndarray:
+        """``numbers`` with NaN replaced by the default; ValueError if any value is still not finite."""
+        finite = np.isfinite(numbers)
+        if finite.all():
+            return numbers
+        if feature.default is not None:
+            numbers = np.where(np.isnan(numbers), float(feature.default), numbers)
+            finite = np.isfinite(numbers)
+            if finite.all():
+                return numbers
+        bad = numbers[~finite]
+        sample = sorted(set(map(str, bad)))[:5]
+        raise ValueError(
+            f"{feature.name} needs finite numbers; got {sample} in {len(bad):,} row(s)"
+            + ("" if feature.default is not None else " and the schema has no default for missing values")
+        )
+
+
+def category_codes(values, categories) -> np.ndarray:
+    """Position of every value in ``categories`` as float, NaN where it is missing or unknown."""
+    # Remap the (small) category dictionary, not every row's string.
+    values = pd.Series(values, copy=False).astype("category")
+    lookup = pd.Index(list(categories)).get_indexer(values.cat.categories.astype(str)).astype(float)
+    lookup[lookup < 0] = np.nan
+    codes = values.cat.codes.to_numpy()
+    return np.where(codes >= 0, lookup[codes] if len(lookup) else np.nan, np.nan)
@@ -0,0 +1,129 @@
+"""Precomputed option lists and slider bounds for the prediction form, one per dataset version.
+
+The scenario builder and the sweep form used to rescan the listing table on every rerun:
+``sorted(df[...].unique())`` for five dropdowns plus ``max()`` and ``median()`` of the area.
+``FormMetadata`` holds those values (and the availability options of the data analysis
+page's listing browser). It is built once per dataset version (the CSV content hash
+from ``data_store``), persisted as JSON next to the listing cache and memoised in the process,
+so a widget interaction reads a handful of tuples instead of scanning whole columns. The
+categorical option lists come from the persistent ``category_dictionary``.
+
+    python form_metadata.py [--data Final_Project.csv]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import category_dictionary
+import data_store
+
+_lock = threading.Lock()
+_memo: dict[str, "FormMetadata"] = {}
+
+
+@dataclass(frozen=True)
+class FormMetadata:
+    version: str
+    regions: tuple[str, ...]
+    property_ages: tuple[str, ...]
+    area_types: tuple[str, ...]
+    availabilities: tuple[str, ...]
+    floors: tuple[int, ...]
+    bathrooms: tuple[int, ...]
+    bedrooms: tuple[int, ...]
+    area_max: int
+    area_median: int
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "FormMetadata":
+        return cls(**{key: tuple(value) if isinstance(value, list) else value for key, value in payload.items()})
+
+
+def _levels(values: pd.Series) -> tuple[int, ...]:
+    return tuple(int(value) for value in np.unique(values.dropna().to_numpy()))
+
+
+def build_metadata(df: pd.DataFrame, dictionary: category_dictionary.CategoryDictionary,
+                   version: str = "") -> FormMetadata:
+    def options(column: str) -> tuple[str, ...]:
+        return tuple(dictionary.options(column, dictionary.encode(column, df[column])))
+
+    return FormMetadata(
+        version=version,
+        regions=options("Region"),
+        property_ages=options("Property_Age"),
+        area_types=options("Area_Tpye"),
+        availabilities=options("Availability"),
+        floors=_levels(df["Floor_No"]),
+        bathrooms=_levels(df["Bathroom"]),
+        bedrooms=_levels(df["Bedroom"]),
+        area_max=int(df["Area_SqFt"].max()),
+        area_median=int(df["Area_SqFt"].median()),
+    )
+
+
+def _path(csv_path: Path) -> Path:
+    return data_store.CACHE_DIR / f"{Path(csv_path).stem}.form.json"
+
+
+def _save(metadata: FormMetadata, csv_path: Path) -> None:
+    path = _path(csv_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(asdict(metadata), ensure_ascii=False))
+    os.replace(tmp_path, path)
+
+
+def _load_persisted(csv_path: Path, version: str) -> FormMetadata | None:
+    try:
+        payload = json.loads(_path(csv_path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if payload.get("version") != version:
+        return None
+    try:
+        return FormMetadata.from_dict(payload)
+    except TypeError:
+        return None
+
+
+def load_metadata(csv_path: Path = data_store.DATA_PATH) -> FormMetadata:
+    """Return the form metadata for the current dataset version, building it if needed."""
+    _, version = data_store.ensure_cache(csv_path)
+    with _lock:
+        metadata = _memo.get(version)
+        if metadata is None:
+            metadata = _load_persisted(csv_path, version)
+            if metadata is None:
+                metadata = build_metadata(data_store.load_listings(csv_path), data_store.load_dictionary(), version)
+                _save(metadata, csv_path)
+            _memo[version] = metadata
+        return metadata
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", type=Path, default=data_store.DATA_PATH, help="Listing CSV to describe")
+    args = parser.parse_args()
+
+    metadata = load_metadata(args.data)
+    print(f"dataset {metadata.version[:12]}")
+    for key, value in asdict(metadata).items():
+        if isinstance(value, (list, tuple)):
+            shown = ", ".join(map(str, value[:5])) + (", ..." if len(value) > 5 else "")
+            print(f"  {key:<14} {len(value):>4} options: {shown}")
+        elif key != "version":
+            print(f"  {key:<14} {value}")
+
+
+if __name__ == "__main__":
+    main()
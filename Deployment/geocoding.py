@@ -0,0 +1,207 @@
+"""Cached, deduplicated geocoding of listing addresses for the map workflow.
+
+Replaces the per-row loop in ``Geocoders Maps.ipynb``, which built a new ``Nominatim`` client
+for every row and geocoded all ~2,580 ``Location`` strings (duplicates included) on every run.
+Addresses are normalised and deduplicated first, each distinct address is resolved once and
+stored in an SQLite cache under ``.cache/`` (misses included), and rows the backend cannot
+place fall back to the centroid of their ``Region`` in ``Map_Location.csv``. A rerun over
+unchanged data makes no backend calls.
+
+The backend is any callable ``address -> (latitude, longitude) | None``. ``NominatimBackend``
+needs ``geopy`` (not part of the app requirements); ``TableBackend`` answers from an existing
+geocoded table and works offline.
+
+    python geocoding.py ../Datasets/Property_Location.csv --out ../Datasets/Map_Location.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_PATH = BASE_DIR / ".cache" / "geocode.sqlite"
+MAP_LOCATION_PATH = BASE_DIR.parent / "Datasets" / "Map_Location.csv"
+
+Coordinates = Tuple[float, float]
+Backend = Callable[[str], Optional[Coordinates]]
+
+_WHITESPACE = re.compile(r"\s+")
+
+_SCHEMA = """CREATE TABLE IF NOT EXISTS geocode (
+    address TEXT PRIMARY KEY,
+    latitude REAL,
+    longitude REAL,
+    resolved_at REAL NOT NULL
+)"""
+
+
+def normalize_address(address: str) -> str:
+    """Cache key: lower case, ``+`` as space, whitespace runs collapsed, ends trimmed."""
+    return _WHITESPACE.sub(" ", address.replace("+", " ").lower()).strip()
+
+
+def normalize_addresses(addresses: pd.Series) -> pd.Series:
+    """Column-wise ``normalize_address``."""
+    return (
+        addresses.astype(str).str.replace("+", " ", regex=False).str.lower()
+        .str.replace(_WHITESPACE, " ", regex=True).str.strip()
+    )
+
+
+class GeocodeCache:
+    """Persistent ``address -> coordinates`` store; a stored ``None`` records a miss."""
+
+    def __init__(self, path: Path = CACHE_PATH) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute(_SCHEMA)
+
+    def get_many(self, addresses: Iterable[str]) -> dict[str, Coordinates | None]:
+        found: dict[str, Coordinates | None] = {}
+        addresses = list(addresses)
+        for start in range(0, len(addresses), 500):
+            batch = addresses[start:start + 500]
+            rows = self._db.execute(
+                f"SELECT address, latitude, longitude FROM geocode WHERE address IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for address, latitude, longitude in rows:
+                found[address] = None if latitude is None else (latitude, longitude)
+        return found
+
+    def put(self, address: str, coordinates: Coordinates | None) -> None:
+        latitude, longitude = coordinates if coordinates is not None else (None, None)
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?)", (address, latitude, longitude, time.time())
+            )
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class NominatimBackend:
+    """One rate-limited OpenStreetMap client shared by every lookup."""
+
+    def __init__(self, user_agent: str = "streamlitdemo", min_delay_seconds: float = 1.0) -> None:
+        from geopy.extra.rate_limiter import RateLimiter
+        from geopy.geocoders import Nominatim
+
+        self._geocode = RateLimiter(Nominatim(user_agent=user_agent).geocode, min_delay_seconds=min_delay_seconds)
+
+    def __call__(self, address: str) -> Coordinates | None:
+        location = self._geocode(address)
+        return None if location is None else (location.latitude, location.longitude)
+
+
+class TableBackend:
+    """Resolves addresses from an already geocoded table such as ``Map_Location.csv``."""
+
+    def __init__(self, table: pd.DataFrame) -> None:
+        table = table.dropna(subset=["Latitude", "Longitude"])
+        keys = normalize_addresses(table["Location"])
+        first = ~keys.duplicated()
+        self._lookup = dict(zip(keys[first], zip(table["Latitude"][first], table["Longitude"][first])))
+
+    def __call__(self, address: str) -> Coordinates | None:
+        return self._lookup.get(address)
+
+
+def region_centroids(table: pd.DataFrame) -> pd.DataFrame:
+    """Mean coordinates of the geocoded listings in each region, keyed by normalised ``Region``."""
+    table = table.dropna(subset=["Latitude", "Longitude"])
+    return table.groupby(normalize_addresses(table["Region"]))[["Latitude", "Longitude"]].mean()
+
+
+@dataclass
+class GeocodeReport:
+    rows: int = 0
+    distinct_addresses: int = 0
+    cache_hits: int = 0
+    backend_calls: int = 0
+    backend_errors: int = 0
+    region_fallbacks: int = 0
+    unresolved: int = 0
+
+
+def geocode_frame(df: pd.DataFrame, backend: Backend, cache: GeocodeCache,
+                  centroids: pd.DataFrame | None = None) -> tuple[pd.DataFrame, GeocodeReport]:
+    """Return ``df`` with ``Latitude`` and ``Longitude`` added, resolving each distinct address once."""
+    report = GeocodeReport(rows=len(df))
+    keys = normalize_addresses(df["Location"])
+    distinct = keys.unique()
+    report.distinct_addresses = len(distinct)
+
+    resolved = cache.get_many(distinct)
+    report.cache_hits = len(resolved)
+    for address in distinct:
+        if address in resolved:
+            continue
+        report.backend_calls += 1
+        try:
+            coordinates = backend(address)
+        except Exception:
+            # Timeouts and service errors are not cached, so the next run retries them.
+            report.backend_errors += 1
+            continue
+        cache.put(address, coordinates)
+        resolved[address] = coordinates
+
+    coordinates = pd.DataFrame(
+        [coordinates or (np.nan, np.nan) for coordinates in resolved.values()],
+        index=list(resolved), columns=["Latitude", "Longitude"], dtype=float,
+    )
+    located = coordinates.reindex(keys.to_numpy())
+    out = df.copy()
+    out["Latitude"] = located["Latitude"].to_numpy()
+    out["Longitude"] = located["Longitude"].to_numpy()
+
+    missing = out["Latitude"].isna()
+    if centroids is not None and missing.any():
+        regions = normalize_addresses(out.loc[missing, "Region"])
+        fallback = centroids.reindex(regions.to_numpy())
+        out.loc[missing, "Latitude"] = fallback["Latitude"].to_numpy()
+        out.loc[missing, "Longitude"] = fallback["Longitude"].to_numpy()
+        report.region_fallbacks = int(fallback["Latitude"].notna().sum())
+    report.unresolved = int(out["Latitude"].isna().sum())
+    return out, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Geocode listing addresses through a persistent cache")
+    parser.add_argument("listings", type=Path)
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--backend", choices=("nominatim", "table"), default="nominatim",
+                        help="'table' answers from --reference only, without network access")
+    parser.add_argument("--reference", type=Path, default=MAP_LOCATION_PATH,
+                        help="Geocoded table used for region centroids (and by the table backend)")
+    parser.add_argument("--cache", type=Path, default=CACHE_PATH)
+    args = parser.parse_args()
+
+    reference = pd.read_csv(args.reference)
+    backend = TableBackend(reference) if args.backend == "table" else NominatimBackend()
+    cache = GeocodeCache(args.cache)
+    try:
+        located, report = geocode_frame(pd.read_csv(args.listings), backend, cache, region_centroids(reference))
+    finally:
+        cache.close()
+    located.dropna(subset=["Latitude", "Longitude"]).reset_index(drop=True).to_csv(args.out, index=False)
+    print(f"{report.rows:,} rows, {report.distinct_addresses:,} distinct addresses: {report.cache_hits:,} cached, "
+          f"{report.backend_calls:,} backend calls ({report.backend_errors:,} failed), "
+          f"{report.region_fallbacks:,} region fallbacks, {report.unresolved:,} unresolved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Incremental model updates from sufficient statistics, without revisiting old listings.
+
+The deployed model is least squares over a fixed polynomial expansion, so everything a refit
+needs is ``XᵀX``, ``Xᵀy``, ``yᵀy`` and the row weight: for degree 2 that is a 36x36 matrix,
+whatever the history length. ``IncrementalTrainer`` keeps those accumulators (plus the
+encoders and feature scales) in ``.cache/incremental.npz``. Folding in a batch costs O(batch)
+and re-solving costs O(features³); old rows are never read again.
+
+Two differences from ``train.py`` keep the accumulators valid as data arrives:
+
+* categories seen for the first time get the next free code instead of a re-sorted one, so
+  earlier rows never change encoding;
+* feature scales are fixed when the state is created (they only condition the solve).
+
+With ``--half-life-days`` the accumulators are multiplied by ``0.5 ** (age / half_life)``
+before each batch, so a listing's weight halves every half-life after it arrived. The
+half-life is stored in the state; passing a different one for an existing state is an error
+unless ``--change-half-life`` is given, which applies it from now on (weights already decayed
+keep their value).
+
+    python incremental.py new_listings.csv [--at 2026-10-18] [--half-life-days 180] [--output regression_model.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import data_store
+import feature_schema
+import model_artifact
+import train
+
+BASE_DIR = Path(__file__).resolve().parent
+STATE_PATH = data_store.CACHE_DIR / "incremental.npz"
+
+SECONDS_PER_DAY = 86_400.0
+
+
+class IncrementalTrainer:
+    def __init__(self, encoders: dict[str, list[str]], scales: np.ndarray, degree: int = train.DEGREE,
+                 half_life_days: float | None = None) -> None:
+        self.encoders = {column: list(values) for column, values in encoders.items()}
+        self.scales = np.asarray(scales, dtype=float)
+        self.powers = train.polynomial_powers(len(train.FEATURE_COLUMNS), degree)
+        self.half_life_days = half_life_days
+        self.gram = np.zeros((len(self.powers), len(self.powers)))
+        self.moment = np.zeros(len(self.powers))
+        self.target_squares = 0.0
+        self.weight = 0.0
+        self.category_counts: dict[str, dict[str, float]] = {column: {} for column in self.encoders}
+        self.rows = 0
+        self.updated_at: float | None = None
+        self._expand = model_artifact.PolynomialStep(self.powers).transform
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, degree: int = train.DEGREE, half_life_days: float | None = None,
+                   at: float | None = None) -> "IncrementalTrainer":
+        """Start from a listing table: category lists and scales as ``train.fit_schema`` builds them."""
+        encoders = {column: sorted(map(str, frame[column].dropna().unique())) for column in train.ENCODED_COLUMNS}
+        numeric = [column for column in train.FEATURE_COLUMNS if column not in encoders]
+        peaks = frame[numeric].abs().max()
+        scales = np.array([max(len(encoders[column]) - 1, 1) if column in encoders else peaks[column]
+                           for column in train.FEATURE_COLUMNS], dtype=float)
+        trainer = cls(encoders, np.where(scales > 0, scales, 1.0), degree, half_life_days)
+        trainer.fold_in(frame, at)
+        return trainer
+
+    def fold_in(self, frame: pd.DataFrame, at: float | None = None) -> int:
+        """Add a batch of listings observed at ``at`` (epoch seconds, default now); return rows used."""
+        at = time.time() if at is None else at
+        for column in train.ENCODED_COLUMNS:
+            known = set(self.encoders[column])
+            fresh = sorted({str(value) for value in frame[column].dropna().unique()} - known)
+            self.encoders[column].extend(fresh)
+        if self.half_life_days and self.updated_at is not None:
+            self._decay(0.5 ** (max(at - self.updated_at, 0.0) / (self.half_life_days * SECONDS_PER_DAY)))
+        self.updated_at = at if self.updated_at is None else max(at, self.updated_at)
+
+        features = train.encode(frame, self.encoders)
+        target = frame[train.TARGET_COLUMN].to_numpy(dtype=float)
+        valid = np.isfinite(features).all(axis=1) & np.isfinite(target)
+        for column in train.ENCODED_COLUMNS:
+            counts = self.category_counts.setdefault(column, {})
+            for value, count in frame.loc[valid, column].value_counts().items():
+                if count:
+                    counts[str(value)] = counts.get(str(value), 0.0) + float(count)
+        expanded = self._expand(features[valid] / self.scales)
+        self.gram += expanded.T @ expanded
+        self.moment += expanded.T @ target[valid]
+        self.target_squares += float(target[valid] @ target[valid])
+        self.weight += float(valid.sum())
+        self.rows += int(valid.sum())
+        return int(valid.sum())
+
+    def _decay(self, factor: float) -> None:
+        self.gram *= factor
+        self.moment *= factor
+        self.target_squares *= factor
+        self.weight *= factor
+        for counts in self.category_counts.values():
+            for value in counts:
+                counts[value] *= factor
+
+    def solve(self) -> np.ndarray:
+        return train.solve(self.gram, self.moment, self.scales, self.powers)
+
+    def fit_rmse(self, coef: np.ndarray) -> float:
+        """Weighted in-sample RMSE of ``coef``, straight from the accumulators."""
+        scaled = coef * np.prod(self.scales ** self.powers, axis=1)
+        squares = self.target_squares - 2 * scaled @ self.moment + scaled @ self.gram @ scaled
+        return float(np.sqrt(max(squares, 0.0) / self.weight)) if self.weight else float("nan")
+
+    def schema(self) -> feature_schema.FeatureSchema:
+        """Feature schema with weighted defaults: most frequent category, numeric means."""
+        defaults: dict[str, float | str] = {column: max(counts, key=counts.get)
+                                            for column, counts in self.category_counts.items() if counts}
+        if self.weight:
+            # The bias row of XᵀX holds the weighted sum of every linear term.
+            for position, column in enumerate(train.FEATURE_COLUMNS):
+                if column not in self.encoders:
+                    term = int(np.flatnonzero((self.powers.sum(axis=1) == 1) & (self.powers[:, position] == 1))[0])
+                    defaults[column] = float(self.gram[0, term] * self.scales[position] / self.weight)
+        return feature_schema.FeatureSchema.from_encoders(train.FEATURE_COLUMNS, self.encoders, defaults)
+
+    def write_model(self, output: Path = model_artifact.ARTIFACT_PATH) -> dict:
+        coef = self.solve()
+        residual = train.residual_stats(self.gram, self.moment, self.target_squares, self.weight,
+                                        self.scales, self.powers, coef)
+        return train.write_model(self.powers, coef, self.schema(), output,
+                                 source=f"incremental.py over {self.rows:,} listings", residual=residual)
+
+    def save(self, path: Path = STATE_PATH) -> None:
+        meta = {
+            "encoders": self.encoders,
+            "half_life_days": self.half_life_days,
+            "target_squares": self.target_squares,
+            "weight": self.weight,
+            "category_counts": self.category_counts,
+            "rows": self.rows,
+            "updated_at": self.updated_at,
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp.npz")
+        np.savez(tmp_path, gram=self.gram, moment=self.moment, scales=self.scales, powers=self.powers,
+                 meta=np.array(json.dumps(meta)))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path = STATE_PATH) -> "IncrementalTrainer":
+        with np.load(path, allow_pickle=False) as state:
+            meta = json.loads(str(state["meta"]))
+            trainer = cls(meta["encoders"], state["scales"], int(state["powers"].sum(axis=1).max()),
+                          meta["half_life_days"])
+            if not np.array_equal(trainer.powers, state["powers"]):
+                raise ValueError(f"{path} was written with a different feature expansion")
+            trainer.gram = state["gram"].copy()
+            trainer.moment = state["moment"].copy()
+        trainer.target_squares = meta["target_squares"]
+        trainer.weight = meta["weight"]
+        trainer.category_counts.update(meta.get("category_counts", {}))
+        trainer.rows = meta["rows"]
+        trainer.updated_at = meta["updated_at"]
+        return trainer
+
+
+def _epoch(value: str | None) -> float | None:
+    return None if value is None else datetime.fromisoformat(value).timestamp()
+
+
+def _describe_half_life(half_life_days: float | None) -> str:
+    return "none (no decay)" if not half_life_days else f"{half_life_days:g} days"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("listings", type=Path, nargs="*", help="CSV batches with the Final_Project.csv columns")
+    parser.add_argument("--at", help="ISO date the batches were observed (default now)")
+    parser.add_argument("--state", type=Path, default=STATE_PATH)
+    parser.add_argument("--base", type=Path, default=train.DATA_PATH, help="Table to start from when --state is missing")
+    parser.add_argument("--half-life-days", type=float, help="Time decay for a new state")
+    parser.add_argument("--change-half-life", action="store_true",
+                        help="Let --half-life-days replace the decay of an existing state from now on")
+    parser.add_argument("--output", type=Path, help="Solve and write the model artifact here")
+    args = parser.parse_args()
+
+    at = _epoch(args.at)
+    if args.state.exists():
+        trainer = IncrementalTrainer.load(args.state)
+        if args.half_life_days is not None and args.half_life_days != trainer.half_life_days:
+            if not args.change_half_life:
+                raise SystemExit(
+                    f"{args.state} uses half-life {_describe_half_life(trainer.half_life_days)}, "
+                    f"not {args.half_life_days:g} days; pass --change-half-life to switch from now on"
+                )
+            print(f"Half-life changed from {_describe_half_life(trainer.half_life_days)} "
+                  f"to {args.half_life_days:g} days for later batches")
+            trainer.half_life_days = args.half_life_days
+    else:
+        trainer = IncrementalTrainer.from_frame(data_store.read_csv_typed(args.base),
+                                                half_life_days=args.half_life_days, at=at)
+        print(f"Started {args.state} from {args.base.name} ({trainer.rows:,} listings)")
+    for path in args.listings:
+        start = time.perf_counter()
+        added = trainer.fold_in(data_store.read_csv_typed(path), at)
+        print(f"Folded in {added:,} listings from {path.name} in {(time.perf_counter() - start) * 1e3:.1f} ms")
+    trainer.save(args.state)
+
+    start = time.perf_counter()
+    coef = trainer.solve()
+    print(f"Solved in {(time.perf_counter() - start) * 1e3:.2f} ms over {trainer.rows:,} listings "
+          f"(effective weight {trainer.weight:,.0f}); in-sample RMSE {trainer.fit_rmse(coef):.4f}")
+    if args.output:
+        manifest = trainer.write_model(args.output)
+        print(f"Wrote {args.output} (sha256 {manifest['sha256'][:12]})")
+
+
+if __name__ == "__main__":
+    main()
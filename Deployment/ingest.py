@@ -0,0 +1,249 @@
+"""Streaming, resumable 99acres listing ingestion.
+
+Importable replacement for ``get_all(start, stop)`` in ``99acres Web Scraping.ipynb``. Each
+search-results page is fetched through a pooled ``requests`` session, its listing pages are
+fetched with bounded concurrency, and the parsed rows are appended to the raw CSV store as
+soon as the page completes. A JSON checkpoint next to the store records finished pages and
+the store size after each one, so an interrupted run resumes where it stopped and never
+keeps a half-written page.
+
+    python ingest.py --start 101 --stop 151 --out ../Datasets/Prop_101to150.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "https://www.99acres.com"
+LISTING_PATH = "/property-in-mumbai-ffid-page-{page}"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.11 (KHTML, like Gecko) Chrome/23.0.1271.64 Safari/537.11",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Charset": "ISO-8859-1,utf-8;q=0.7,*;q=0.3",
+    "Accept-Language": "en-US,en;q=0.8",
+    "Connection": "keep-alive",
+}
+
+COLUMNS = ["Property_Name", "Location", "Price", "Rate_SqFt", "Area_Tpye",
+           "Bedroom", "Bathroom", "Floor_No", "Property_Age", "Availability"]
+
+# column -> (tag, attribute, value, whitespace-split token to keep or None for the full text)
+FIELD_SELECTORS = {
+    "Property_Name": ("span", "class", "undefined", None),
+    "Location": ("i", "id", "address", None),
+    "Price": ("span", "id", "pdPrice2", None),
+    "Rate_SqFt": ("div", "id", "pricePerUnitArea", 1),
+    "Area_Tpye": ("div", "id", "factArea", None),
+    "Bedroom": ("span", "id", "bedRoomNum", 0),
+    "Bathroom": ("span", "id", "bathroomNum", 0),
+    "Floor_No": ("span", "id", "floorNumLabel", 0),
+    "Property_Age": ("span", "id", "agePossessionLbl", None),
+    "Availability": ("span", "id", "Availability_Lbl", None),
+}
+LINK_CLASS = "body_med srpTuple__propertyName"
+
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class _FieldParser(HTMLParser):
+    """Collects the text of the first element matching each selector, like ``soup.find(...).text``.
+
+    Open elements are kept as a stack of tag names. An end tag closes everything opened after
+    its matching start tag (implicitly closed ``<p>`` and ``<li>``), and an end tag with no open
+    element of that name is ignored, so stray markup cannot end a selection early.
+    """
+
+    def __init__(self, selectors: dict[str, tuple[str, str, str, int | None]]) -> None:
+        super().__init__(convert_charrefs=True)
+        self.selectors = selectors
+        self.texts: dict[str, str] = {}
+        self.links: list[str] = []
+        self._open: list[tuple[str, int, list[str]]] = []
+        self._stack: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+        if tag == "a" and attributes.get("class") == LINK_CLASS and attributes.get("href"):
+            self.links.append(attributes["href"])
+        if tag in _VOID_TAGS:
+            return
+        self._stack.append(tag)
+        for name, (sel_tag, sel_attr, sel_value, _) in self.selectors.items():
+            if name in self.texts or tag != sel_tag or any(entry[0] == name for entry in self._open):
+                continue
+            value = attributes.get(sel_attr) or ""
+            if (sel_value in value.split()) if sel_attr == "class" else value == sel_value:
+                self._open.append((name, len(self._stack), []))
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _VOID_TAGS or tag not in self._stack:
+            return
+        # Pop back to the innermost open element of this name, closing whatever it still contains.
+        depth = len(self._stack) - self._stack[::-1].index(tag)
+        del self._stack[depth - 1:]
+        still_open = []
+        for name, opened_at, chunks in self._open:
+            if opened_at >= depth:
+                self.texts.setdefault(name, "".join(chunks))
+            else:
+                still_open.append((name, opened_at, chunks))
+        self._open = still_open
+
+    def handle_data(self, data: str) -> None:
+        for _, _, chunks in self._open:
+            chunks.append(data)
+
+
+def parse_listing(markup: str) -> dict[str, str | None]:
+    parser = _FieldParser(FIELD_SELECTORS)
+    parser.feed(markup)
+    parser.close()
+    row: dict[str, str | None] = {}
+    for name, (_, _, _, token) in FIELD_SELECTORS.items():
+        text = parser.texts.get(name)
+        if text is not None and token is not None:
+            parts = text.split(" ")
+            text = parts[token] if len(parts) > token else None
+        row[name] = text
+    return row
+
+
+def parse_search_page(markup: str) -> list[str]:
+    parser = _FieldParser({})
+    parser.feed(markup)
+    parser.close()
+    return parser.links
+
+
+def make_session(pool_size: int = 8, retries: int = 3) -> requests.Session:
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@dataclass
+class Checkpoint:
+    path: Path
+    completed_pages: set[int] = field(default_factory=set)
+    store_bytes: int = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint":
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        return cls(path, set(state["completed_pages"]), int(state["store_bytes"]))
+
+    def save(self) -> None:
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({
+            "completed_pages": sorted(self.completed_pages),
+            "store_bytes": self.store_bytes,
+        }), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+@dataclass
+class IngestReport:
+    pages_done: list[int] = field(default_factory=list)
+    pages_skipped: list[int] = field(default_factory=list)
+    pages_failed: dict[int, str] = field(default_factory=dict)
+    rows_written: int = 0
+    seconds: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return len(self.pages_done) / self.seconds if self.seconds else 0.0
+
+
+def checkpoint_path_for(store: Path) -> Path:
+    return store.with_name(store.name + ".checkpoint.json")
+
+
+def _append_rows(store: Path, checkpoint: Checkpoint, rows: list[dict]) -> None:
+    # Drop anything written after the last checkpointed page, e.g. by a crashed run.
+    if store.exists() and store.stat().st_size != checkpoint.store_bytes:
+        with store.open("r+b") as handle:
+            handle.truncate(checkpoint.store_bytes)
+    with store.open("a", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=COLUMNS)
+        if checkpoint.store_bytes == 0:
+            writer.writeheader()
+        writer.writerows(rows)
+    checkpoint.store_bytes = store.stat().st_size
+
+
+def ingest(start: int, stop: int, store: Path, *, base_url: str = BASE_URL, concurrency: int = 8,
+           session: requests.Session | None = None, timeout: float = 30.0) -> IngestReport:
+    """Scrape search pages ``start``..``stop - 1`` into ``store``, resuming from its checkpoint."""
+    store = Path(store)
+    checkpoint_path = checkpoint_path_for(store)
+    if store.exists() and not checkpoint_path.exists():
+        raise FileExistsError(f"{store} exists but was not written by ingest; pick a new --out path")
+    checkpoint = Checkpoint.load(checkpoint_path)
+    session = session or make_session(pool_size=concurrency)
+    report = IngestReport()
+    began = time.perf_counter()
+
+    def fetch(url: str) -> str:
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for page in range(start, stop):
+            if page in checkpoint.completed_pages:
+                report.pages_skipped.append(page)
+                continue
+            try:
+                links = parse_search_page(fetch(base_url + LISTING_PATH.format(page=page)))
+                rows = [parse_listing(markup) for markup in pool.map(fetch, (base_url + link for link in links))]
+            except requests.RequestException as exc:
+                report.pages_failed[page] = str(exc)
+                continue
+            _append_rows(store, checkpoint, rows)
+            checkpoint.completed_pages.add(page)
+            checkpoint.save()
+            report.pages_done.append(page)
+            report.rows_written += len(rows)
+
+    report.seconds = time.perf_counter() - began
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scrape 99acres Mumbai listings into a raw CSV store")
+    parser.add_argument("--start", type=int, required=True)
+    parser.add_argument("--stop", type=int, required=True, help="Exclusive, as in range(start, stop)")
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--base-url", default=BASE_URL)
+    args = parser.parse_args()
+
+    report = ingest(args.start, args.stop, args.out, base_url=args.base_url, concurrency=args.concurrency)
+    print(f"Pages scraped: {len(report.pages_done)} ({report.pages_per_second:.2f}/s), "
+          f"resumed past: {len(report.pages_skipped)}, rows written: {report.rows_written}")
+    for page, error in report.pages_failed.items():
+        print(f"Page {page} failed and will be retried on the next run: {error}")
+
+
+if __name__ == "__main__":
+    main()
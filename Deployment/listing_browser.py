@@ -0,0 +1,373 @@
+"""Server-side filtered, sorted and paginated view of the listing table.
+
+The data analysis page used to show ``df.head(30)`` and nothing else. ``ListingBrowser`` keeps
+the listing table as one numpy array per column (dictionary codes for the text columns from
+``category_dictionary``) and answers a ``ListingQuery`` in three steps:
+
+1. the predicates (regions, availability, bedrooms, price range) are evaluated as vectorized
+   comparisons on the integer codes and numbers. Once the matches are sparse, the remaining
+   predicates only test the surviving positions;
+2. the match count comes from the mask. Each sort column and direction has a stable sort
+   permutation and its inverse (every row's rank), built when the browser is warmed, so no page
+   request sorts the table. The permutations are stored next to the Parquet cache for the
+   dataset version and the ranks derived from them in one pass. Like ``sort_values(kind="stable")``, ties keep
+   table order and missing values come last in either direction. Up to
+   a quarter of the table, the matches' ranks are sorted and mapped back through the
+   permutation. Denser match sets scan the permutation in growing chunks, only until the
+   requested page is covered;
+3. only that page of positions is materialised as a DataFrame.
+
+Recent queries keep their scan position in a small LRU, so paging on through a result
+continues the scan rather than repeating it. One browser is built and warmed per dataset
+version.
+
+    python listing_browser.py [--region NAME ...] [--price MIN MAX] [--bedrooms 2 3]
+                              [--availability LABEL ...] [--sort Price_Lakh] [--descending] [--page 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+import category_dictionary
+import data_store
+
+PAGE_SIZE = 50
+PAGE_SIZES = (25, 50, 100, 250)
+SORT_COLUMNS = ("Price_Lakh", "Area_SqFt", "Rate_SqFt", "Bedroom", "Bathroom", "Floor_No", "Region", "Location")
+RESULT_CACHE_SIZE = 32
+# Match sets up to this share of the table are kept as positions and ordered by sorting their
+# ranks; denser ones stay a mask and are found by scanning the sort permutation, where a page
+# fills after a short scan.
+RANK_SORT_SHARE = 0.25
+# Rows of the display order examined by the first scan for a page; later scans double.
+SCAN_CHUNK = 65_536
+# Value sets up to this size are matched with equality tests rather than np.isin.
+EQUALITY_TERMS = 8
+
+_lock = threading.Lock()
+_memo: dict[str, "ListingBrowser"] = {}
+
+
+@dataclass(frozen=True)
+class ListingQuery:
+    regions: tuple[str, ...] = ()
+    price_min: float | None = None
+    price_max: float | None = None
+    bedrooms: tuple[int, ...] = ()
+    availability: tuple[str, ...] = ()
+    sort_by: str | None = None
+    descending: bool = False
+
+
+@dataclass(frozen=True)
+class Page:
+    rows: pd.DataFrame
+    number: int
+    page_size: int
+    total_rows: int
+    seconds: float
+
+    @property
+    def pages(self) -> int:
+        return max(-(-self.total_rows // self.page_size), 1)
+
+    @property
+    def first_row(self) -> int:
+        """1-based number of the first row on the page within the matches (0 when there are none)."""
+        return (self.number - 1) * self.page_size + 1 if self.total_rows else 0
+
+
+def _column_array(values: pd.Series) -> np.ndarray:
+    """Compact array a predicate or sort runs over: category codes, integers in their narrowest type."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy()
+    if values.dtype.kind in "iu":
+        # Bedroom, Bathroom and Floor_No fit in int8, which makes each comparison pass 8x cheaper.
+        return pd.to_numeric(values, downcast="integer").to_numpy()
+    return values.to_numpy()
+
+
+class _Matches:
+    """Matching positions of one query in display order, found only as far as pages ask for."""
+
+    def __init__(self, mask: np.ndarray | None, order: np.ndarray | None, total: int) -> None:
+        self.mask = mask
+        self.order = order
+        self.total = total
+        self._found = np.empty(0, dtype=np.int64)
+        self._cursor = 0
+        self._lock = threading.Lock()
+
+    def slice(self, start: int, stop: int) -> np.ndarray:
+        if self.mask is None:
+            return self.order[start:stop] if self.order is not None else np.arange(start, min(stop, self.total))
+        with self._lock:
+            # Scan the display order in doubling chunks until the page is covered.
+            rows, chunks = len(self.mask), [self._found]
+            found = len(self._found)
+            while found < stop and self._cursor < rows:
+                end = min(self._cursor + max(SCAN_CHUNK, self._cursor), rows)
+                if self.order is None:
+                    hits = np.flatnonzero(self.mask[self._cursor:end]) + self._cursor
+                else:
+                    chunk = self.order[self._cursor:end]
+                    hits = chunk[self.mask[chunk]]
+                chunks.append(hits)
+                found += len(hits)
+                self._cursor = end
+            if len(chunks) > 1:
+                self._found = np.concatenate(chunks)
+            return self._found[start:stop]
+
+
+class ListingBrowser:
+    def __init__(self, df: pd.DataFrame, dictionary: category_dictionary.CategoryDictionary,
+                 version: str = "") -> None:
+        self.version = version
+        self.table = df
+        self._dictionary = dictionary
+        self._columns = {column: _column_array(df[column]) for column in SORT_COLUMNS + ("Availability",)}
+        self._orders: dict[tuple[str, bool], np.ndarray] = {}
+        self._ranks: dict[tuple[str, bool], np.ndarray] = {}
+        self._results: OrderedDict[ListingQuery, _Matches] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def warm(self, directory: Path | None = None) -> "ListingBrowser":
+        """Build every sort permutation and rank up front, reusing (and saving) the permutations in ``directory``.
+
+        Saved permutations are tagged with the dataset version and memory-mapped on load; those
+        of other versions are removed when a new one is saved.
+        """
+        for column in SORT_COLUMNS:
+            for descending in (False, True):
+                key = (column, descending)
+                with self._lock:
+                    if key in self._ranks:
+                        continue
+                stem = f"{column}.{'desc' if descending else 'asc'}"
+                path = Path(directory) / f"{stem}.{self.version[:16]}.npy" if directory and self.version else None
+                order = _load_order(path, len(self)) if path is not None else None
+                if order is None:
+                    order = self._sort(column, descending)
+                    if path is not None:
+                        _save_order(order, path, stale=f"{stem}.*.npy")
+                with self._lock:
+                    self._orders[key] = order
+                self._rank(column, descending)
+        return self
+
+    def page(self, query: ListingQuery, number: int = 1, page_size: int = PAGE_SIZE) -> Page:
+        """Rows of page ``number`` (1-based, clamped to the last page) of the query's matches."""
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        start = time.perf_counter()
+        matches = self._matches(query)
+        number = min(max(int(number), 1), max(-(-matches.total // page_size), 1))
+        rows = self.table.iloc[matches.slice((number - 1) * page_size, number * page_size)]
+        return Page(rows, number, page_size, matches.total, time.perf_counter() - start)
+
+    def _matches(self, query: ListingQuery) -> _Matches:
+        if query.sort_by is not None and query.sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort by {query.sort_by!r}; choose one of {', '.join(SORT_COLUMNS)}")
+        with self._lock:
+            matches = self._results.get(query)
+            if matches is not None:
+                self._results.move_to_end(query)
+                return matches
+        matches = self._plan(query, *self._select(query))
+        with self._lock:
+            self._results[query] = matches
+            while len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return matches
+
+    def _predicates(self, query: ListingQuery) -> list[tuple[str, Callable[[np.ndarray], np.ndarray]]]:
+        """(column, test) pairs for the query's filters, the usually more selective ones first."""
+        predicates = []
+        for column, labels in (("Region", query.regions), ("Availability", query.availability)):
+            if labels:
+                predicates.append((column, self._one_of(column, self._dictionary.encode(column, list(labels)))))
+        if query.bedrooms:
+            predicates.append(("Bedroom", self._one_of("Bedroom", np.asarray(query.bedrooms))))
+        if query.price_min is not None or query.price_max is not None:
+            low = -np.inf if query.price_min is None else query.price_min
+            high = np.inf if query.price_max is None else query.price_max
+            predicates.append(("Price_Lakh", lambda values: (values >= low) & (values <= high)))
+        return predicates
+
+    def _one_of(self, column: str, wanted: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+        dtype = self._columns[column].dtype
+        wanted = np.unique(wanted[wanted >= 0]) if column in data_store.CATEGORICAL_COLUMNS else np.unique(wanted)
+        if dtype.kind in "iu":
+            # Compare in the column's own narrow type; values it cannot hold cannot match.
+            narrowed = wanted.astype(dtype)
+            wanted = narrowed[narrowed == wanted]
+        if len(wanted) > EQUALITY_TERMS:
+            return lambda values: np.isin(values, wanted)
+
+        def test(values: np.ndarray) -> np.ndarray:
+            # A few equality tests beat np.isin's sort and a code-indexed gather on narrow integer codes.
+            selected = np.zeros(len(values), dtype=bool)
+            for value in wanted:
+                selected |= values == value
+            return selected
+
+        return test
+
+    def _select(self, query: ListingQuery) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """(mask, positions) of the matching rows; (None, None) when the query has no filters.
+
+        Predicates run over whole columns while the matches are dense. Once they fit in
+        ``RANK_SORT_SHARE`` of the table, the rest only test the surviving positions.
+        """
+        mask = positions = None
+        for column, test in self._predicates(query):
+            if positions is not None:
+                positions = positions[test(self._columns[column][positions])]
+                continue
+            selected = test(self._columns[column])
+            mask = selected if mask is None else np.logical_and(mask, selected, out=mask)
+            if np.count_nonzero(mask) <= RANK_SORT_SHARE * len(self):
+                positions, mask = np.flatnonzero(mask), None
+        return mask, positions
+
+    def _plan(self, query: ListingQuery, mask: np.ndarray | None, positions: np.ndarray | None) -> _Matches:
+        if positions is not None:
+            if query.sort_by is not None:
+                # Every read here is in increasing position order; only the (integer) ranks are sorted.
+                order = self._order(query.sort_by, query.descending)
+                positions = order[np.sort(self._rank(query.sort_by, query.descending)[positions])]
+            return _Matches(None, positions, len(positions))
+        total = len(self) if mask is None else int(np.count_nonzero(mask))
+        if query.sort_by is None:
+            return _Matches(mask, None, total)
+        return _Matches(mask, self._order(query.sort_by, query.descending), total)
+
+    def _order(self, column: str, descending: bool = False) -> np.ndarray:
+        """Stable sort permutation of ``column``."""
+        key = (column, descending)
+        with self._lock:
+            order = self._orders.get(key)
+        if order is None:
+            # Only an unwarmed browser gets here.
+            order = self._sort(column, descending)
+            with self._lock:
+                self._orders[key] = order
+        return order
+
+    def _rank(self, column: str, descending: bool = False) -> np.ndarray:
+        """Inverse of the sort permutation: each row's position in the display order."""
+        key = (column, descending)
+        with self._lock:
+            rank = self._ranks.get(key)
+        if rank is None:
+            order = self._order(column, descending)
+            rank = np.empty(len(order), dtype=order.dtype)
+            rank[order] = np.arange(len(order), dtype=order.dtype)
+            with self._lock:
+                self._ranks[key] = rank
+        return rank
+
+    def _sort(self, column: str, descending: bool) -> np.ndarray:
+        """Stable sort permutation of ``column``, missing values last.
+
+        Descending is a stable sort of reversed keys rather than the ascending permutation read
+        backwards, which would put ties in reverse table order and missing values first.
+        """
+        values = self._columns[column]
+        if column in data_store.CATEGORICAL_COLUMNS:
+            # Codes follow the order labels joined the dictionary; sort by alphabetical rank, missing last.
+            label_rank = self._dictionary.rank(column)
+            if descending:
+                # ~rank = -rank - 1 reverses the labels without overflow; missing stays above all of them.
+                values = np.append(~label_rank, 0)[values]
+            else:
+                values = np.append(label_rank, len(label_rank))[values]
+        elif descending:
+            # NaN stays NaN under negation, so it still sorts last; ~ cannot overflow a narrow integer.
+            values = -values if values.dtype.kind == "f" else ~values
+        dtype = np.int32 if len(self) < 2**31 else np.int64
+        return np.argsort(values, kind="stable").astype(dtype, copy=False)
+
+
+def _load_order(path: Path, rows: int) -> np.ndarray | None:
+    try:
+        order = np.load(path, mmap_mode="r")
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+    return order if order.shape == (rows,) else None
+
+
+def _save_order(order: np.ndarray, path: Path, stale: str) -> None:
+    """Atomically write ``order`` to ``path`` and drop the files matching ``stale`` it supersedes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for old in path.parent.glob(stale):
+        if old != path:
+            old.unlink(missing_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    with tmp_path.open("wb") as handle:
+        np.save(handle, order)
+    os.replace(tmp_path, path)
+
+
+def _orders_dir(csv_path: Path) -> Path:
+    return data_store.CACHE_DIR / f"{Path(csv_path).stem}.orders"
+
+
+def load_browser(csv_path: Path = data_store.DATA_PATH) -> ListingBrowser:
+    """Return the browser for the current dataset version, building it if needed."""
+    df = data_store.load_listings(csv_path)
+    version = df.attrs["dataset_version"]
+    with _lock:
+        browser = _memo.get(version)
+        if browser is None:
+            browser = ListingBrowser(df, data_store.load_dictionary(), version).warm(_orders_dir(csv_path))
+            _memo.clear()
+            _memo[version] = browser
+        return browser
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", type=Path, default=data_store.DATA_PATH, help="Listing CSV to browse")
+    parser.add_argument("--region", nargs="+", default=[])
+    parser.add_argument("--price", type=float, nargs=2, metavar=("MIN", "MAX"))
+    parser.add_argument("--bedrooms", type=int, nargs="+", default=[])
+    parser.add_argument("--availability", nargs="+", default=[])
+    parser.add_argument("--sort", choices=SORT_COLUMNS)
+    parser.add_argument("--descending", action="store_true")
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    args = parser.parse_args()
+
+    query = ListingQuery(
+        regions=tuple(args.region),
+        price_min=args.price[0] if args.price else None,
+        price_max=args.price[1] if args.price else None,
+        bedrooms=tuple(args.bedrooms),
+        availability=tuple(args.availability),
+        sort_by=args.sort,
+        descending=args.descending,
+    )
+    page = load_browser(args.data).page(query, args.page, args.page_size)
+    print(page.rows.to_string())
+    print(f"\nrows {page.first_row:,}-{page.first_row + len(page.rows) - 1:,} of {page.total_rows:,} "
+          f"(page {page.number} of {page.pages}) in {page.seconds * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
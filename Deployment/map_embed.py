@@ -0,0 +1,113 @@
+"""Cached, compacted delivery of the folium map embedded on the About page.
+
+The exported ``mumbai_property.html`` declares every listing as its own ``L.marker`` with an
+eagerly built popup iframe carrying base64 HTML, which makes the file 1.3 MB and forces the
+browser to create ~3,000 objects before the map is usable. ``map_html`` splits the file into
+the map shell and a compact JSON marker table, then adds the markers through a clustered,
+chunk-loaded layer whose popups are only rendered when opened. The result is minified once
+and cached in memory keyed by the source file's mtime and size.
+
+Files that do not match the folium layout are served minified but otherwise unchanged.
+"""
+
+from __future__ import annotations
+
+import base64
+import html
+import json
+import re
+import threading
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+MAP_PATH = BASE_DIR / "IMG" / "mumbai_property.html"
+
+CLUSTER_ASSETS = (
+    '<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.5.3/dist/MarkerCluster.css"/>'
+    '<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.5.3/dist/MarkerCluster.Default.css"/>'
+    '<script src="https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.5.3/dist/leaflet.markercluster.js"></script>'
+)
+
+_MAP_VAR = re.compile(r"var (map_\w+) = L\.map\(")
+_MARKER = re.compile(r"L\.marker\(\s*\[([-\d.]+),\s*([-\d.]+)\]")
+_POPUP_BODY = re.compile(r"base64,([A-Za-z0-9+/=]+)")
+_POPUP_FIELD = re.compile(r'<p style="color:(\w+)" >\s*([^:<]+?)\s*:\s*(.*?)\s*<p/>', re.S)
+
+_MARKER_SCRIPT = """(function () {
+var data = %(data)s, fields = data.fields;
+function popup(row) {
+return fields.map(function (field, i) {
+return '<p style="color:' + field[0] + '">' + field[1] + ' : ' + row[i + 2] + '</p>';
+}).join('');
+}
+var cluster = L.markerClusterGroup({chunkedLoading: true});
+cluster.addLayers(data.rows.map(function (row) {
+return L.marker([row[0], row[1]]).bindPopup(function () { return popup(row); }, {maxWidth: 300});
+}));
+%(map)s.addLayer(cluster);
+})();"""
+
+_PLACEHOLDER = "/* markers */"
+
+_lock = threading.Lock()
+_memo: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def minify(markup: str) -> str:
+    """Strip indentation and blank lines; line breaks are kept so inline JS stays valid."""
+    lines = (line.strip() for line in markup.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def extract_markers(markup: str) -> tuple[str, dict] | None:
+    """Split a folium export into its map shell and a compact marker table.
+
+    Returns ``None`` when the markup does not follow the expected one-popup-per-marker layout.
+    """
+    map_match = _MAP_VAR.search(markup)
+    first_marker = markup.find("var marker_")
+    script_end = markup.rfind("</script>")
+    if map_match is None or first_marker < 0 or script_end < first_marker:
+        return None
+
+    marker_block = markup[first_marker:script_end]
+    coordinates = _MARKER.findall(marker_block)
+    popups = [base64.b64decode(body).decode("utf-8") for body in _POPUP_BODY.findall(marker_block)]
+    if not coordinates or len(coordinates) != len(popups):
+        return None
+
+    parsed = [_POPUP_FIELD.findall(popup) for popup in popups]
+    fields = [(colour, label) for colour, label, _ in parsed[0]]
+    rows = []
+    for (lat, lng), popup_fields in zip(coordinates, parsed):
+        if [(colour, label) for colour, label, _ in popup_fields] != fields:
+            return None
+        rows.append([float(lat), float(lng)] + [html.escape(value) for _, _, value in popup_fields])
+
+    shell = markup[:first_marker] + f"\n{_PLACEHOLDER}\n" + markup[script_end:]
+    return shell, {"map": map_match.group(1), "fields": fields, "rows": rows}
+
+
+def build_map_html(markup: str) -> str:
+    extracted = extract_markers(markup)
+    if extracted is None:
+        return minify(markup)
+
+    shell, markers = extracted
+    data = json.dumps({"fields": markers["fields"], "rows": markers["rows"]}, separators=(",", ":"))
+    script = _MARKER_SCRIPT % {"data": data.replace("</", "<\\/"), "map": markers["map"]}
+    shell = shell.replace("</head>", CLUSTER_ASSETS + "</head>", 1)
+    return minify(shell).replace(_PLACEHOLDER, script)
+
+
+def map_html(path: Path = MAP_PATH) -> str:
+    """Return the compacted map page for ``path``, rebuilding it only when the file changes."""
+    path = Path(path)
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _memo.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, build_map_html(path.read_text(encoding="utf-8")))
+            _memo[path] = cached
+        return cached[1]
@@ -1,35 +1,132 @@
-import pickle
 from pathlib import Path
-import numpy as np
+import altair as alt
 import pandas as pd
 import streamlit as st
 
+import comparables
+import data_store
+import form_metadata
+import model_registry
+import prediction_cache
+import predictor
+import region_stats
+import what_if
+
 BASE_DIR = Path(__file__).resolve().parent
-DATA_PATH = BASE_DIR / "Final_Project.csv"
-MODEL_PATH = BASE_DIR / "regression_model.pkl"
+DATA_PATH = data_store.DATA_PATH
+MODEL_PATH = predictor.MODEL_PATH
+
+SWEEP_MAX_AREA_POINTS = 1000
+SURFACE_MAX_AREAS = 80
 
 
-@st.cache_data(show_spinner=False)
 def load_dataset() -> pd.DataFrame:
-    return pd.read_csv(DATA_PATH)
+    return data_store.load_listings(DATA_PATH)
+
+
+def load_form_metadata() -> form_metadata.FormMetadata:
+    # Option lists and slider bounds are computed once per dataset version, not per rerun.
+    return form_metadata.load_metadata(DATA_PATH)
+
+
+def load_model() -> predictor.LoadedModel:
+    # Shared by every session; a validated new artifact is swapped in without a restart.
+    return model_registry.get_registry(MODEL_PATH).current()
+
+
+def scenario_context(location: str, property_age: str, area_type: str) -> dict:
+    """Model inputs the form fixes for every scenario; the rate is the locality's median."""
+    context = {"Region": location, "Property_Age": property_age, "Area_Tpye": area_type}
+    region = region_stats.load_stats(DATA_PATH).region(location)
+    if region is not None:
+        context["Rate_SqFt"] = region.median_rate_sqft
+    return context
+
+
+def predict_price(area_sqft: float, floor_no: float, bedroom: float, context: dict | None = None) -> float:
+    return float(prediction_cache.predict([[area_sqft, floor_no, bedroom]], load_model(), fixed=context)[0])
+
+
+def predict_prices(scenarios: predictor.Scenarios, context: dict | None = None):
+    """Vectorized counterpart of ``predict_price`` for portfolios of scenarios."""
+    return prediction_cache.predict(scenarios, load_model(), fixed=context)
+
+
+def predict_price_interval(area_sqft: float, floor_no: float, bedroom: float, context: dict | None = None,
+                           level: float = predictor.INTERVAL_LEVEL) -> tuple[float, float, float] | None:
+    """(estimate, lower, upper) in Lakh, or None when the loaded model carries no covariance."""
+    loaded = load_model()
+    if not predictor.supports_intervals(loaded.model):
+        return None
+    # Estimate and bounds come from one expansion of the row, so the point cache has nothing to add here.
+    estimate, lower, upper = predictor.predict_interval_batch(loaded.model, [[area_sqft, floor_no, bedroom]],
+                                                              level, fixed=context)[0]
+    return float(estimate), float(lower), float(upper)
 
 
-@st.cache_resource(show_spinner=False)
-def load_model():
-    with MODEL_PATH.open('rb') as pickle_in:
-        return pickle.load(pickle_in)
+def sweep_prices(areas, floors, bedrooms, context: dict | None = None) -> what_if.SweepResult:
+    """Price the whole Area x Floor x Bedroom grid in one batched call (bypasses the row cache)."""
+    return what_if.sweep(load_model().model, areas, floors, bedrooms, fixed=context)
 
 
-df = load_dataset()
-reg = load_model()
+def render_sweep(meta: form_metadata.FormMetadata, area_sqft: float, floor_no: float, bedroom: float,
+                 context: dict) -> None:
+    st.markdown("#### Sensitivity sweep")
+    floors = list(meta.floors)
+    bedrooms = list(meta.bedrooms)
+    with st.form("sweep-form"):
+        col1, col2 = st.columns(2, gap="large")
+        with col1:
+            area_range = st.slider("Area range (SqFt)", 100, meta.area_max, step=100, value=(500, meta.area_max))
+            area_points = st.slider("Area steps", 10, SWEEP_MAX_AREA_POINTS, value=what_if.AREA_POINTS, step=10)
+        with col2:
+            floor_range = st.slider("Floor range", int(min(floors)), int(max(floors)), value=(int(min(floors)), int(max(floors))))
+            swept_bedrooms = st.multiselect("Bedrooms", bedrooms, default=bedrooms)
+        st.markdown(
+            "<span class='form-hint'>Every combination is priced in one model call; the curves pass through the scenario above.</span>",
+            unsafe_allow_html=True,
+        )
+        submitted = st.form_submit_button("Run sweep")
+
+    if not submitted:
+        return
+    if not swept_bedrooms:
+        st.warning("Pick at least one bedroom count to sweep.")
+        return
+    try:
+        result = sweep_prices(
+            what_if.area_axis(*area_range, area_points),
+            range(floor_range[0], floor_range[1] + 1),
+            swept_bedrooms,
+            context,
+        )
+    except ValueError as exc:
+        st.error(f"The model cannot price this sweep: {exc}")
+        return
+    st.markdown(
+        f"<p class='stat-note'>Priced {result.size:,} scenarios in {result.seconds * 1e3:,.0f} ms.</p>",
+        unsafe_allow_html=True,
+    )
 
+    surface = result.surface(bedroom, SURFACE_MAX_AREAS)
+    layer = result.bedrooms[result.nearest(area_sqft, floor_no, bedroom)[2]]
+    cells = surface.stack().rename("Price_Lakh").reset_index()
+    st.altair_chart(
+        alt.Chart(cells, title=f"Price surface at {layer:g} bedrooms (Lakh)").mark_rect().encode(
+            x=alt.X("Floor_No:O", title="Floor"),
+            y=alt.Y("Area_SqFt:O", title="Area (SqFt)", sort="descending", axis=alt.Axis(format=",.0f")),
+            color=alt.Color("Price_Lakh:Q", title="Lakh"),
+            tooltip=[alt.Tooltip("Area_SqFt:Q", format=",.0f"), "Floor_No:O", alt.Tooltip("Price_Lakh:Q", format=",.1f")],
+        ),
+        use_container_width=True,
+    )
 
-def predict_price(area_sqft: float, floor_no: float, bedroom: float) -> float:
-    x = np.zeros(7)
-    x[0] = area_sqft
-    x[1] = floor_no
-    x[2] = bedroom
-    return float(reg.predict([x])[0])
+    curves = result.curves(area_sqft, floor_no, bedroom)
+    curve_cols = st.columns(3, gap="large")
+    for col, (axis, curve) in zip(curve_cols, curves.items()):
+        with col:
+            st.caption(f"Price vs {axis}")
+            st.line_chart(curve)
 
 
 def run_ml_app() -> None:
@@ -39,32 +136,54 @@ def run_ml_app() -> None:
         unsafe_allow_html=True,
     )
 
+    meta = load_form_metadata()
     with st.form("prediction-form"):
         st.markdown("#### Scenario builder")
         col1, col2 = st.columns(2, gap="large")
         with col1:
-            location = st.selectbox('Select location', sorted(df['Region'].unique()))
-            area_sqft = st.slider("Total area (SqFt)", 500, int(df['Area_SqFt'].max()), step=100, value=int(df['Area_SqFt'].median()))
-            floor_no = st.selectbox("Floor number", sorted(df['Floor_No'].unique()))
+            location = st.selectbox('Select location', meta.regions)
+            area_sqft = st.slider("Total area (SqFt)", 500, meta.area_max, step=100, value=meta.area_median)
+            floor_no = st.selectbox("Floor number", meta.floors)
         with col2:
-            bathroom = st.selectbox("Bathrooms", sorted(df['Bathroom'].unique()))
-            bedroom = st.selectbox("Bedrooms", sorted(df['Bedroom'].unique()))
-            property_age = st.selectbox('Property age', df['Property_Age'].sort_values().unique())
+            bathroom = st.selectbox("Bathrooms", meta.bathrooms)
+            bedroom = st.selectbox("Bedrooms", meta.bedrooms)
+            property_age = st.selectbox('Property age', meta.property_ages)
+            area_type = st.selectbox('Area type', meta.area_types)
         st.markdown(
-            "<span class='form-hint'>The baseline model currently uses area, floor, and bedroom features—additional selections contextualize the recommendation.</span>",
+            "<span class='form-hint'>The model prices locality, property age, area type, area, floor and bedrooms at the locality's median rate per sqft—bathrooms contextualize the recommendation.</span>",
             unsafe_allow_html=True,
         )
         submitted = st.form_submit_button("Estimate price")
 
+    context = scenario_context(location, property_age, area_type)
     if submitted:
-        prediction = predict_price(area_sqft, float(floor_no), float(bedroom))
-        region_median = df.loc[df['Region'] == location, 'Price_Lakh'].median()
+        try:
+            interval = predict_price_interval(area_sqft, float(floor_no), float(bedroom), context)
+            prediction = interval[0] if interval else predict_price(area_sqft, float(floor_no), float(bedroom), context)
+        except ValueError as exc:
+            st.error(f"The model cannot price this scenario: {exc}")
+            return
+        interval_note = (
+            f"<p class='result-footnote'>{predictor.INTERVAL_LEVEL:.0%} prediction interval: "
+            f"{max(interval[1], 0.0):,.0f}–{interval[2]:,.0f} Lakh</p>"
+            if interval else ""
+        )
+        region_median = region_stats.load_stats(DATA_PATH).region(location).median_price
+        index = comparables.load_index()
+        nearby = index.nearest_to(location) if index is not None else None
+        nearby_note = (
+            f"<p class='result-footnote'>{nearby.count} nearest geocoded listings (within {nearby.radius_km:,.1f} km): "
+            f"median {nearby.median_price:,.0f} Lakh, middle half {nearby.price_q25:,.0f}–{nearby.price_q75:,.0f} Lakh</p>"
+            if nearby is not None else ""
+        )
         st.markdown(
             f"""
             <div class="neobrutalist-card result-card">
                 <h3>Estimated market value</h3>
                 <p class="price-highlight">{prediction:,.2f} Lakh</p>
+                {interval_note}
                 <p class="result-footnote">Regional median for {location}: {region_median:,.0f} Lakh</p>
+                {nearby_note}
             </div>
             """,
             unsafe_allow_html=True,
@@ -97,6 +216,8 @@ def run_ml_app() -> None:
             unsafe_allow_html=True,
         )
 
+    render_sweep(meta, float(area_sqft), float(floor_no), float(bedroom), context)
+
     st.markdown(
         "<p class='stat-note'>Model version: Polynomial regression baseline (scikit-learn).</p>",
         unsafe_allow_html=True,
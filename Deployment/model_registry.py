@@ -0,0 +1,257 @@
+"""Hot-reloading model registry: watch the artifact, validate candidates, swap atomically.
+
+``predictor.current_model`` reloads whatever lands on disk, good or bad. The registry instead
+loads a changed artifact off to the side, scores it on a fixed holdout sample of listings and
+only then swaps it in by replacing a single reference, so requests in flight keep the model
+they started with and none wait on the load. A candidate that fails to load, produces
+non-finite prices or is clearly worse than the active model on the holdout (mean absolute
+error above ``MAX_ERROR_RATIO`` times the active one) is rejected and the active model keeps
+serving. A candidate that did not load is retried on the next poll, and a manifest counts as
+changed when its ``.bin`` does, so a manifest published ahead of its array file is picked up
+once the array file lands. The previous model stays in memory so ``rollback`` is a reference
+swap as well.
+
+Every load attempt is recorded with its load, validation and swap timings.
+
+    python model_registry.py --candidate /path/to/regression_model.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+import warnings
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import data_store
+import feature_schema
+import model_artifact
+import predictor
+
+BASE_DIR = Path(__file__).resolve().parent
+MODEL_PATH = predictor.MODEL_PATH
+
+POLL_SECONDS = 2.0
+HOLDOUT_ROWS = 2_000
+MAX_ERROR_RATIO = 1.25
+HISTORY_LENGTH = 20
+
+
+@dataclass(frozen=True)
+class ReloadEvent:
+    version: str | None
+    accepted: bool
+    detail: str
+    load_ms: float
+    validate_ms: float
+    swap_us: float
+    holdout_mae: float | None
+    at: float
+
+
+def holdout_sample(table: pd.DataFrame, rows: int = HOLDOUT_ROWS, seed: int = 0) -> tuple[pd.DataFrame, np.ndarray]:
+    """Deterministic sample of listings (every raw column) and their prices used to vet new models."""
+    sample = table.dropna(subset=[*predictor.SCENARIO_COLUMNS, "Price_Lakh"])
+    sample = sample.sample(n=min(rows, len(sample)), random_state=seed)
+    return sample.drop(columns="Price_Lakh"), sample["Price_Lakh"].to_numpy(dtype=float)
+
+
+class ModelRegistry:
+    def __init__(self, path: Path = MODEL_PATH, poll_seconds: float = POLL_SECONDS,
+                 max_error_ratio: float = MAX_ERROR_RATIO,
+                 holdout: tuple[pd.DataFrame, np.ndarray] | None = None) -> None:
+        self.path = Path(path).resolve()
+        self.poll_seconds = poll_seconds
+        self.max_error_ratio = max_error_ratio
+        self._holdout = holdout
+        self._holdout_features: dict[feature_schema.FeatureSchema, np.ndarray] = {}
+        self._active: predictor.LoadedModel | None = None
+        self._previous: predictor.LoadedModel | None = None
+        self._active_mae: float | None = None
+        self._previous_mae: float | None = None
+        self._seen_stamp: tuple | None = None
+        self._reload_lock = threading.Lock()
+        self._history: deque[ReloadEvent] = deque(maxlen=HISTORY_LENGTH)
+        self._stop = threading.Event()
+        self._watcher: threading.Thread | None = None
+
+    def current(self) -> predictor.LoadedModel:
+        """The model serving right now; loads the artifact on first use."""
+        active = self._active
+        if active is None:
+            self.refresh()
+            active = self._active
+            if active is None:
+                detail = self._history[-1].detail if self._history else "file not found"
+                raise RuntimeError(f"No usable model at {self.path}: {detail}")
+        return active
+
+    def refresh(self, force: bool = False) -> ReloadEvent | None:
+        """Load, validate and swap in the artifact if it changed since the last attempt (or ``force``)."""
+        with self._reload_lock:
+            stamp = self._stamp()
+            if stamp is None:
+                return None
+            if stamp == self._seen_stamp and not force:
+                return None
+            event = self._try_swap()
+            # A candidate that did not load (its .bin not published yet, or a file still being
+            # written) is retried on the next poll; one that loaded and was judged is not.
+            if event.version is not None:
+                self._seen_stamp = stamp
+            return event
+
+    def _stamp(self) -> tuple | None:
+        """(mtime, size) of the artifact and, for a manifest, of the array file it points at."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self.path.suffix == ".json":
+            try:
+                data = os.stat(model_artifact.data_path_for(self.path))
+                stamp += (data.st_mtime_ns, data.st_size)
+            except FileNotFoundError:
+                stamp += (None, None)
+        return stamp
+
+    def rollback(self) -> predictor.LoadedModel:
+        """Swap the previous model back in. The artifact on disk is not reloaded until it changes."""
+        with self._reload_lock:
+            if self._previous is None:
+                raise RuntimeError("No previous model to roll back to")
+            start = time.perf_counter()
+            self._active, self._previous = self._previous, self._active
+            swap_us = (time.perf_counter() - start) * 1e6
+            self._active_mae, self._previous_mae = self._previous_mae, self._active_mae
+            self._history.append(ReloadEvent(self._active.version, True, "rolled back", 0.0, 0.0,
+                                             swap_us, self._active_mae, time.time()))
+            return self._active
+
+    def _try_swap(self) -> ReloadEvent:
+        start = time.perf_counter()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                candidate = predictor.read_model(self.path)
+        except Exception as exc:  # a half-written or incompatible file must not take serving down
+            event = ReloadEvent(None, False, f"load failed: {exc}", (time.perf_counter() - start) * 1e3,
+                                0.0, 0.0, None, time.time())
+            self._history.append(event)
+            return event
+        load_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        mae, problem = self._validate(candidate)
+        validate_ms = (time.perf_counter() - start) * 1e3
+        if problem is not None:
+            event = ReloadEvent(candidate.version, False, problem, load_ms, validate_ms, 0.0, mae, time.time())
+            self._history.append(event)
+            return event
+
+        start = time.perf_counter()
+        self._previous, self._active = self._active, candidate
+        swap_us = (time.perf_counter() - start) * 1e6
+        self._previous_mae, self._active_mae = self._active_mae, mae
+        event = ReloadEvent(candidate.version, True, "active", load_ms, validate_ms, swap_us, mae, time.time())
+        self._history.append(event)
+        return event
+
+    def _validate(self, candidate: predictor.LoadedModel) -> tuple[float | None, str | None]:
+        # The first model has nothing to fall back on, so it is served as soon as it loads.
+        if self._active is None:
+            return None, None
+        if candidate.version == self._active.version:
+            return self._active_mae, None
+        mae, problem = self._score(candidate)
+        if problem is not None:
+            return mae, problem
+        if self._active_mae is None:
+            self._active_mae = self._score(self._active)[0]
+        if self._active_mae is not None and mae > self._active_mae * self.max_error_ratio:
+            return mae, f"holdout MAE {mae:.1f} exceeds {self.max_error_ratio:g}x the active model's {self._active_mae:.1f}"
+        return mae, None
+
+    def _score(self, loaded: predictor.LoadedModel) -> tuple[float | None, str | None]:
+        if self._holdout is None:
+            self._holdout = holdout_sample(data_store.load_listings())
+        scenarios, prices = self._holdout
+        try:
+            # Successive models usually share a schema, so the holdout is encoded once per schema.
+            schema = predictor.model_schema(loaded.model)
+            if schema not in self._holdout_features:
+                self._holdout_features = {schema: predictor.build_feature_matrix(schema, scenarios)}
+            predicted = np.asarray(loaded.model.predict(self._holdout_features[schema]), dtype=float)
+        except Exception as exc:
+            return None, f"prediction failed: {exc}"
+        if predicted.shape != prices.shape or not np.isfinite(predicted).all():
+            return None, "non-finite or misshaped predictions on the holdout sample"
+        return float(np.abs(predicted - prices).mean()), None
+
+    def start(self) -> "ModelRegistry":
+        """Poll the artifact every ``poll_seconds`` on a daemon thread (idempotent)."""
+        with self._reload_lock:
+            if self._watcher is None or not self._watcher.is_alive():
+                self._stop.clear()
+                self._watcher = threading.Thread(target=self._watch, name="model-registry", daemon=True)
+                self._watcher.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            self.refresh()
+
+    def status(self) -> dict:
+        return {
+            "active_version": None if self._active is None else self._active.version,
+            "previous_version": None if self._previous is None else self._previous.version,
+            "history": [asdict(event) for event in self._history],
+        }
+
+
+_registry: ModelRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_registry(path: Path = MODEL_PATH) -> ModelRegistry:
+    """Process-wide registry for the default artifact, started on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry(path).start()
+        return _registry
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--active", type=Path, default=MODEL_PATH, help="Model currently serving")
+    parser.add_argument("--candidate", type=Path, required=True, help="Model to vet against it")
+    args = parser.parse_args()
+
+    if not args.candidate.exists():
+        raise SystemExit(f"Model file not found: {args.candidate}")
+    registry = ModelRegistry(args.active)
+    registry.current()
+    registry.path = args.candidate.resolve()
+    registry.refresh(force=True)
+    for event in registry.status()["history"]:
+        print(f"{event['version'] or '-':>16}  {'accepted' if event['accepted'] else 'rejected':8}  "
+              f"load {event['load_ms']:7.1f} ms  validate {event['validate_ms']:7.1f} ms  "
+              f"swap {event['swap_us']:6.1f} us  MAE {event['holdout_mae'] or float('nan'):8.1f}  {event['detail']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Chunked, out-of-core run of the scraping and cleaning notebooks' dataset pipeline.
+
+The notebooks load every stage fully into memory and write a full intermediate CSV between
+stages (``Prop_*.csv`` -> ``Raw_Property.csv`` -> ``Property_Location.csv`` ->
+``Mumbai_Property.csv``). Here each stage is a generator over bounded-size chunks:
+
+    concat -> dedupe -> clean (incl. region extraction) -> projection -> CSV append
+
+so peak memory is set by ``chunk_rows``, not by the input size. Cross-chunk dedupe keeps a
+sorted array of 64-bit row hashes (8 bytes per distinct row) instead of the rows themselves.
+Column dtypes are pinned so every chunk is written exactly as the whole frame would be.
+
+    python pipeline.py --out ../Datasets/Mumbai_Property_Clean.csv [--chunk-rows 50000] [parts ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+import cleaning
+
+BASE_DIR = Path(__file__).resolve().parent
+DATASETS_DIR = BASE_DIR.parent / "Datasets"
+RAW_PARTS = tuple(DATASETS_DIR / name for name in ("Prop_001to050.csv", "Prop_051to100.csv", "Prop_101to150.csv"))
+
+CHUNK_ROWS = 50_000
+COUNT_COLUMNS = ("Bedroom", "Bathroom")
+FINAL_DTYPES = {
+    "Area_SqFt": "float64", "Rate_SqFt": "int64", "Floor_No": "int64",
+    "Bedroom": "int64", "Bathroom": "int64", "Price_Lakh": "float64",
+}
+PLACEHOLDER_NAME = "Toll Free 1800 41 99099"
+
+
+@dataclass
+class PipelineReport:
+    rows_read: int = 0
+    duplicates_dropped: int = 0
+    rows_written: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+
+class RowHashSet:
+    """Membership set of 64-bit row hashes kept as one sorted ``uint64`` array."""
+
+    def __init__(self) -> None:
+        self._keys = np.empty(0, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def first_seen(self, keys: np.ndarray) -> np.ndarray:
+        """Mask of keys never seen before, counting only the first occurrence within ``keys``."""
+        fresh = np.zeros(len(keys), dtype=bool)
+        fresh[np.unique(keys, return_index=True)[1]] = True
+        if len(self._keys):
+            positions = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+            fresh &= self._keys[positions] != keys
+        self._keys = np.union1d(self._keys, keys[fresh])
+        return fresh
+
+
+def read_chunks(paths: Iterable[Path], chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Concatenate the raw part files as a stream of chunks, as ``pd.concat`` did in memory."""
+    for path in paths:
+        yield from pd.read_csv(path, dtype=str, chunksize=chunk_rows)
+
+
+def raw_rows(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """The scraping notebook's tidy-up: placeholder names, incomplete rows, integer counts."""
+    for chunk in chunks:
+        chunk["Property_Name"] = chunk["Property_Name"].str.replace(PLACEHOLDER_NAME, "Unnamed Property", regex=False)
+        chunk = chunk.dropna()
+        yield chunk.assign(**{column: pd.to_numeric(chunk[column]).astype("int64") for column in COUNT_COLUMNS})
+
+
+def dedupe(chunks: Iterable[pd.DataFrame], report: PipelineReport | None = None) -> Iterator[pd.DataFrame]:
+    """Drop rows already seen in this or any earlier chunk, keeping the first occurrence."""
+    seen = RowHashSet()
+    for chunk in chunks:
+        fresh = seen.first_seen(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+        if report is not None:
+            report.duplicates_dropped += int((~fresh).sum())
+        yield chunk[fresh]
+
+
+def clean(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    for chunk in chunks:
+        yield cleaning.clean_raw(chunk)
+
+
+def project(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    for chunk in chunks:
+        yield cleaning.project(chunk).astype(FINAL_DTYPES)
+
+
+def run(paths: Iterable[Path], out_path: Path, chunk_rows: int = CHUNK_ROWS) -> PipelineReport:
+    """Stream ``paths`` through every stage into ``out_path``, replacing it atomically."""
+    report = PipelineReport()
+    began = time.perf_counter()
+
+    def counted(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        for chunk in chunks:
+            report.rows_read += len(chunk)
+            report.chunks += 1
+            yield chunk
+
+    stages = project(clean(dedupe(raw_rows(counted(read_chunks(paths, chunk_rows))), report)))
+    out_path = Path(out_path)
+    tmp_path = out_path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_path.open("w", newline="", encoding="utf-8") as handle:
+        header = True
+        for chunk in stages:
+            chunk.to_csv(handle, header=header, index=False)
+            header = False
+            report.rows_written += len(chunk)
+        if header:
+            handle.write(",".join(cleaning.FINAL_COLUMNS) + "\n")
+    os.replace(tmp_path, out_path)
+
+    report.seconds = time.perf_counter() - began
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the raw-to-clean listing pipeline in bounded memory")
+    parser.add_argument("parts", type=Path, nargs="*", default=list(RAW_PARTS))
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    report = run(args.parts, args.out, args.chunk_rows)
+    print(f"Read {report.rows_read:,} rows in {report.chunks} chunks, dropped {report.duplicates_dropped:,} "
+          f"duplicates, wrote {report.rows_written:,} listings to {args.out} in {report.seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Bounded LRU/TTL cache of model outputs, shared by every session and batch caller.
+
+The prediction lab sees the same few scenarios over and over (area in 100 sqft steps, a
+handful of floors and bedroom counts). Each model input row is normalised (rounded, with
+``-0.0`` folded into ``0.0``) and cached under the model's content hash, so loading a new
+model file invalidates every entry. Hit, miss, eviction, expiry and invalidation counters
+are kept for monitoring.
+
+Repeated rows within a batch are computed once. The degree-2 model prices a row in well
+under a microsecond once its features are assembled, so per-row key building and lookups
+only pay off for a handful of rows: batches above ``max_batch_rows`` (``MAX_BATCH_ROWS`` by
+default) go straight to the model and are counted as bypassed, as are batches larger than the
+cache, which would otherwise flush it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Mapping, Union
+
+import numpy as np
+import pandas as pd
+
+import predictor
+
+MAX_ENTRIES = 10_000
+TTL_SECONDS = 3600.0
+KEY_DECIMALS = 6
+# Above this many rows, keying every row costs more than pricing the batch (benchmarks/cached_predict).
+MAX_BATCH_ROWS = 8
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+    bypassed: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PredictionCache:
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl_seconds: float = TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic, max_batch_rows: int = MAX_BATCH_ROWS) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_batch_rows = max_batch_rows
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[float, float]] = OrderedDict()
+        self._version: str | None = None
+        self._hits = self._misses = self._evictions = self._expirations = self._invalidations = 0
+        self._bypassed = 0
+
+    def predict(self, loaded: predictor.LoadedModel, features: np.ndarray) -> np.ndarray:
+        """Model outputs for the rows of ``features``, computing only the rows not cached."""
+        features = np.asarray(features, dtype=float)
+        if len(features) > min(self.max_batch_rows, self.max_entries):
+            with self._lock:
+                self._bypassed += len(features)
+            return loaded.model.predict(features)
+
+        normalised = np.round(features, KEY_DECIMALS) + 0.0
+        keys = [row.tobytes() for row in normalised]
+        values = np.empty(len(keys))
+        missing: dict[bytes, list[int]] = {}
+        now = self._clock()
+        with self._lock:
+            self._check_version(loaded.version)
+            for position, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] <= now:
+                    del self._entries[key]
+                    self._expirations += 1
+                    entry = None
+                if entry is None:
+                    missing.setdefault(key, []).append(position)
+                else:
+                    self._entries.move_to_end(key)
+                    values[position] = entry[0]
+            missed = sum(len(positions) for positions in missing.values())
+            self._misses += missed
+            self._hits += len(keys) - missed
+
+        if missing:
+            first_rows = [positions[0] for positions in missing.values()]
+            computed = loaded.model.predict(normalised[first_rows])
+            for price, positions in zip(computed, missing.values()):
+                values[positions] = price
+            expires = self._clock() + self.ttl_seconds
+            with self._lock:
+                # Skip the store if another thread loaded a newer model meanwhile.
+                if self._version == loaded.version:
+                    for key, price in zip(missing, computed):
+                        self._entries[key] = (float(price), expires)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                        self._evictions += 1
+        return values
+
+    def _check_version(self, version: str) -> None:
+        if version != self._version:
+            if self._version is not None:
+                self._invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._expirations,
+                              self._invalidations, len(self._entries), self._bypassed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+CACHE = PredictionCache()
+
+
+def predict(scenarios: predictor.Scenarios, loaded: predictor.LoadedModel | None = None,
+            cache: PredictionCache = CACHE, fixed: Mapping[str, object] | None = None) -> Union[pd.Series, np.ndarray]:
+    """Cached ``predictor.predict_batch`` against the current model file."""
+    loaded = loaded or predictor.current_model()
+    features = predictor.build_feature_matrix(predictor.model_schema(loaded.model), scenarios, fixed)
+    return predictor.shape_predictions(scenarios, cache.predict(loaded, features))
@@ -0,0 +1,161 @@
+"""Streamlit-free prediction helpers shared by the prediction lab and batch valuation jobs.
+
+Model inputs are assembled by the ``feature_schema`` shipped in the model artifact. Scenarios
+give raw values (region name, property age, area type, area, rate, floor, bedrooms); a
+column they leave out takes its value from ``fixed`` or else the schema default. Arrays are
+read as ``SCENARIO_COLUMNS``. ``read_model`` refuses a model without a usable schema, so a
+model that would be fed the wrong columns never gets served.
+
+The app loads the pickle-free artifact (``regression_model.json`` + ``.bin``, see
+``model_artifact``); ``load_model`` still reads a pickled pipeline when given a ``.pkl`` path.
+``current_model`` keeps one loaded copy per model file, tagged with a content hash, and
+reloads it when the file changes on disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping, Union
+
+import numpy as np
+import pandas as pd
+
+import feature_schema
+import model_artifact
+
+BASE_DIR = Path(__file__).resolve().parent
+MODEL_PATH = model_artifact.ARTIFACT_PATH
+PICKLE_PATH = BASE_DIR / "regression_model.pkl"
+
+SCENARIO_COLUMNS = ("Area_SqFt", "Floor_No", "Bedroom")
+INTERVAL_LEVEL = 0.9
+INTERVAL_COLUMNS = ("Predicted_Price_Lakh", "Lower_Price_Lakh", "Upper_Price_Lakh")
+
+Scenarios = Union[pd.DataFrame, np.ndarray]
+
+_lock = threading.Lock()
+_memo: dict[Path, tuple[tuple[int, int], "LoadedModel"]] = {}
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    model: object
+    version: str
+
+
+def load_model(path: Path = MODEL_PATH):
+    if Path(path).suffix == ".json":
+        return model_artifact.load_artifact(path)
+    with Path(path).open("rb") as pickle_in:
+        return pickle.load(pickle_in)
+
+
+def read_model(path: Path = MODEL_PATH) -> LoadedModel:
+    """Load the model at ``path`` tagged with the first 16 hex digits of its SHA-256.
+
+    Raises ValueError when the model carries no feature schema the scenarios can be mapped to.
+    """
+    version = hashlib.sha256(Path(path).read_bytes()).hexdigest()[:16]
+    model = load_model(path)
+    try:
+        model_schema(model)
+    except ValueError as exc:
+        raise ValueError(f"{Path(path).name}: {exc}") from exc
+    return LoadedModel(model, version)
+
+
+def model_schema(model) -> feature_schema.FeatureSchema:
+    """The model's feature schema; ValueError if it has none or lacks the numeric scenario columns."""
+    schema = getattr(model, "schema", None)
+    if schema is None:
+        raise ValueError(
+            "the model has no feature schema; retrain it with train.py or convert it with update_model_pickle.py"
+        )
+    unusable = [column for column in SCENARIO_COLUMNS
+                if column not in schema.names or schema.feature(column).is_categorical]
+    if unusable:
+        raise ValueError(f"the model's feature schema has no numeric {', '.join(unusable)} column")
+    return schema
+
+
+def current_model(path: Path = MODEL_PATH) -> LoadedModel:
+    """Return the model at ``path`` with its content hash, reloading it when the file changes."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _memo.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, read_model(path))
+            _memo[path] = cached
+        return cached[1]
+
+
+def build_feature_matrix(schema: feature_schema.FeatureSchema, scenarios: Scenarios,
+                         fixed: Mapping[str, object] | None = None) -> np.ndarray:
+    """Assemble the model input for every scenario row, one vectorized pass per column.
+
+    Accepts a DataFrame of raw values carrying at least the ``SCENARIO_COLUMNS`` or a 2-D
+    array whose columns follow that order. ``fixed`` holds scalar values (e.g. the selected
+    region) for columns the scenarios do not carry.
+    """
+    if isinstance(scenarios, pd.DataFrame):
+        missing = [column for column in SCENARIO_COLUMNS if column not in scenarios.columns]
+        if missing:
+            raise ValueError(f"Scenario frame is missing columns: {', '.join(missing)}")
+        return schema.matrix(scenarios, fixed)
+
+    values = np.asarray(scenarios, dtype=float)
+    if values.ndim != 2 or values.shape[1] != len(SCENARIO_COLUMNS):
+        raise ValueError(
+            f"Expected a 2-D array with {len(SCENARIO_COLUMNS)} columns "
+            f"({', '.join(SCENARIO_COLUMNS)}), got shape {values.shape}"
+        )
+    return schema.matrix(dict(zip(SCENARIO_COLUMNS, values.T)), fixed, rows=len(values))
+
+
+def predict_batch(model, scenarios: Scenarios,
+                  fixed: Mapping[str, object] | None = None) -> Union[pd.Series, np.ndarray]:
+    """Price every scenario with a single ``predict`` call.
+
+    DataFrame input returns a Series aligned to the frame's index; array input returns an
+    array in row order.
+    """
+    features = build_feature_matrix(model_schema(model), scenarios, fixed)
+    return shape_predictions(scenarios, model.predict(features) if len(features) else np.empty(0))
+
+
+def shape_predictions(scenarios: Scenarios, predictions: np.ndarray) -> Union[pd.Series, np.ndarray]:
+    if isinstance(scenarios, pd.DataFrame):
+        return pd.Series(predictions, index=scenarios.index, name="Predicted_Price_Lakh")
+    return predictions
+
+
+def supports_intervals(model) -> bool:
+    """True for model artifacts written by ``train.py``/``incremental.py`` (they keep the covariance)."""
+    return getattr(model, "has_intervals", False)
+
+
+def predict_interval_batch(model, scenarios: Scenarios, level: float = INTERVAL_LEVEL,
+                           fixed: Mapping[str, object] | None = None) -> Union[pd.DataFrame, np.ndarray]:
+    """Point estimate plus ``level`` prediction-interval bounds for every scenario in one pass.
+
+    DataFrame input returns ``INTERVAL_COLUMNS`` aligned to the frame's index; array input
+    returns an (n, 3) array in the same column order.
+    """
+    if not supports_intervals(model):
+        raise ValueError("The loaded model has no residual covariance; retrain it with train.py")
+    features = build_feature_matrix(model_schema(model), scenarios, fixed)
+    return shape_intervals(scenarios, *model.predict_interval(features, level))
+
+
+def shape_intervals(scenarios: Scenarios, estimate: np.ndarray, lower: np.ndarray,
+                    upper: np.ndarray) -> Union[pd.DataFrame, np.ndarray]:
+    stacked = np.column_stack([estimate, lower, upper])
+    if isinstance(scenarios, pd.DataFrame):
+        return pd.DataFrame(stacked, index=scenarios.index, columns=list(INTERVAL_COLUMNS))
+    return stacked
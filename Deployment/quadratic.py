@@ -0,0 +1,132 @@
+"""Closed-form evaluator for the degree-2 polynomial regression pipeline.
+
+``PolynomialFeatures(degree=2)`` followed by ``LinearRegression`` is a fixed quadratic form
+over the raw inputs, so a prediction is ``x·Q·x + b·x + c``. Exporting ``Q``, ``b`` and ``c``
+once lets inference skip sklearn and never materialise the 36-column expanded matrix.
+
+``export_quadratic`` folds either a fitted pipeline or the deployed model artifact. From the
+artifact the form keeps its ``feature_schema``, so ``predictor.predict_batch`` can price
+scenarios with it like any other model.
+
+    python quadratic.py [--model regression_model.json] [--output regression_quadratic.npz]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+import feature_schema
+import model_artifact
+import predictor
+
+BASE_DIR = Path(__file__).resolve().parent
+QUADRATIC_PATH = BASE_DIR / "regression_quadratic.npz"
+
+
+@dataclass(frozen=True)
+class QuadraticForm:
+    quadratic: np.ndarray
+    linear: np.ndarray
+    constant: float
+    feature_names: tuple[str, ...] = ()
+    schema: feature_schema.FeatureSchema | None = None
+
+    @property
+    def n_features_in_(self) -> int:
+        return self.linear.shape[0]
+
+    def predict(self, X) -> np.ndarray:
+        """Evaluate every row of ``X`` with the same call shape as ``Pipeline.predict``."""
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Expected a 2-D array with {self.n_features_in_} columns, got shape {X.shape}")
+        # Row-wise x·(Q·x + b) keeps the only temporary at (n, 7).
+        projected = X @ self.quadratic
+        projected += self.linear
+        return np.einsum("ij,ij->i", projected, X) + self.constant
+
+    def save(self, path: Path = QUADRATIC_PATH) -> None:
+        np.savez(
+            path,
+            quadratic=self.quadratic,
+            linear=self.linear,
+            constant=np.float64(self.constant),
+            feature_names=np.array(self.feature_names, dtype=str),
+            schema=np.array(json.dumps(self.schema.to_dict()) if self.schema is not None else ""),
+        )
+
+    @classmethod
+    def load(cls, path: Path = QUADRATIC_PATH) -> "QuadraticForm":
+        with np.load(path) as arrays:
+            schema = str(arrays["schema"]) if "schema" in arrays.files else ""
+            return cls(
+                quadratic=arrays["quadratic"],
+                linear=arrays["linear"],
+                constant=float(arrays["constant"]),
+                feature_names=tuple(arrays["feature_names"].tolist()),
+                schema=feature_schema.FeatureSchema.from_dict(json.loads(schema)) if schema else None,
+            )
+
+
+def export_quadratic(model) -> QuadraticForm:
+    """Fold a fitted ``poly`` + ``linear`` pipeline or a model artifact into its symmetric quadratic form."""
+    if isinstance(model, model_artifact.ArtifactModel):
+        parameters = model.parameters
+        return _fold(parameters.powers, parameters.coef, parameters.intercept,
+                     tuple(map(str, model.feature_names_in_)), model.schema)
+    poly = model.named_steps["poly"]
+    linear = model.named_steps["linear"]
+    return _fold(poly.powers_, np.ravel(linear.coef_), float(np.ravel(linear.intercept_)[0]),
+                 tuple(getattr(poly, "feature_names_in_", ())))
+
+
+def _fold(powers: np.ndarray, coef: np.ndarray, intercept: float, names: tuple[str, ...],
+          schema: feature_schema.FeatureSchema | None = None) -> QuadraticForm:
+    degree = int(powers.sum(axis=1).max())
+    if degree > 2:
+        raise ValueError(f"Only polynomial models up to degree 2 can be exported, got degree {degree}")
+
+    n_features = powers.shape[1]
+    quadratic = np.zeros((n_features, n_features))
+    linear_terms = np.zeros(n_features)
+    constant = float(intercept)
+
+    for exponents, weight in zip(powers, coef):
+        active = np.flatnonzero(exponents)
+        degree = int(exponents.sum())
+        if degree == 0:
+            constant += weight
+        elif degree == 1:
+            linear_terms[active[0]] += weight
+        elif len(active) == 1:
+            quadratic[active[0], active[0]] += weight
+        else:
+            i, j = active
+            quadratic[i, j] += weight / 2
+            quadratic[j, i] += weight / 2
+
+    return QuadraticForm(quadratic, linear_terms, constant, names, schema)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the regression pipeline as a quadratic form")
+    parser.add_argument("--model", type=Path, default=predictor.MODEL_PATH,
+                        help="Model artifact (or a pickled pipeline, which carries no feature schema)")
+    parser.add_argument("--output", type=Path, default=QUADRATIC_PATH)
+    args = parser.parse_args()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        form = export_quadratic(predictor.load_model(args.model))
+    form.save(args.output)
+    print(f"Quadratic form with {form.n_features_in_} inputs written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Precomputed aggregate index over the listing table, keyed by ``Region``.
+
+Built once per dataset version (the CSV content hash from ``data_store``) and persisted as
+Parquet next to the listing cache, so page reruns answer regional and headline questions
+with dictionary lookups instead of scanning the frame.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import data_store
+
+_META_VERSION = b"dataset_version"
+_META_OVERALL = b"overall"
+
+_lock = threading.Lock()
+_memo: dict[str, "StatsIndex"] = {}
+
+
+@dataclass(frozen=True)
+class RegionStats:
+    count: int
+    median_price: float
+    price_q25: float
+    price_q75: float
+    median_rate_sqft: float
+    mean_rate_sqft: float
+
+
+@dataclass(frozen=True)
+class StatsIndex:
+    version: str
+    regions: pd.DataFrame
+    overall: dict
+    describe: pd.DataFrame
+    _lookup: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        records = {
+            region: RegionStats(int(row.pop("count")), **row)
+            for region, row in self.regions.to_dict(orient="index").items()
+        }
+        object.__setattr__(self, "_lookup", records)
+
+    def region(self, name: str) -> RegionStats | None:
+        return self._lookup.get(name)
+
+    def top_regions(self, n: int = 12) -> pd.Series:
+        counts = self.regions["count"].sort_values(ascending=False, kind="stable")
+        return counts.head(n).rename("count")
+
+
+def build_stats(df: pd.DataFrame, version: str = "") -> StatsIndex:
+    grouped = df.groupby("Region", observed=True, sort=True)
+    price_quantiles = grouped["Price_Lakh"].quantile([0.25, 0.75]).unstack()
+    regions = pd.DataFrame({
+        "count": grouped.size().astype("int64"),
+        "median_price": grouped["Price_Lakh"].median(),
+        "price_q25": price_quantiles[0.25],
+        "price_q75": price_quantiles[0.75],
+        "median_rate_sqft": grouped["Rate_SqFt"].median().astype(float),
+        "mean_rate_sqft": grouped["Rate_SqFt"].mean(),
+    })
+    regions.index = regions.index.astype(str)
+    overall = {
+        "listings": int(len(df)),
+        "median_price": float(df["Price_Lakh"].median()),
+        "median_area": float(df["Area_SqFt"].median()),
+        "median_rate_sqft": float(df["Rate_SqFt"].median()),
+        "ready_to_move_share": float((df["Availability"] == "Ready To Move").mean()),
+    }
+    return StatsIndex(version, regions, overall, df.describe().T)
+
+
+def _paths(csv_path: Path) -> tuple[Path, Path]:
+    stem = Path(csv_path).stem
+    return (
+        data_store.CACHE_DIR / f"{stem}.region_stats.parquet",
+        data_store.CACHE_DIR / f"{stem}.describe.parquet",
+    )
+
+
+def _save(index: StatsIndex, csv_path: Path) -> None:
+    regions_path, describe_path = _paths(csv_path)
+    data_store.write_parquet(pa.Table.from_pandas(index.describe), describe_path, {_META_VERSION: index.version.encode()})
+    data_store.write_parquet(pa.Table.from_pandas(index.regions), regions_path, {
+        _META_VERSION: index.version.encode(),
+        _META_OVERALL: json.dumps(index.overall).encode(),
+    })
+
+
+def _load_persisted(csv_path: Path, version: str) -> StatsIndex | None:
+    regions_path, describe_path = _paths(csv_path)
+    metadata = data_store.read_metadata(regions_path)
+    if metadata.get(_META_VERSION, b"").decode() != version:
+        return None
+    if data_store.read_metadata(describe_path).get(_META_VERSION, b"").decode() != version:
+        return None
+    return StatsIndex(
+        version,
+        pq.read_table(regions_path).to_pandas(),
+        json.loads(metadata[_META_OVERALL]),
+        pq.read_table(describe_path).to_pandas(),
+    )
+
+
+def load_stats(csv_path: Path = data_store.DATA_PATH) -> StatsIndex:
+    """Return the stats index for the current dataset version, building it if needed."""
+    _, version = data_store.ensure_cache(csv_path)
+    with _lock:
+        index = _memo.get(version)
+        if index is None:
+            index = _load_persisted(csv_path, version)
+            if index is None:
+                index = build_stats(data_store.load_listings(csv_path), version)
+                _save(index, csv_path)
+            _memo[version] = index
+        return index
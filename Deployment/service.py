@@ -0,0 +1,205 @@
+"""Headless JSON prediction service around the regression model artifact.
+
+Runs on the standard library HTTP server so it never imports Streamlit. The model comes
+from a ``model_registry.ModelRegistry`` shared by every request thread, so a validated new
+artifact is swapped in without a restart. Each request assembles its feature matrix once;
+a model with a residual covariance prices it and its interval from one polynomial expansion,
+and point-only models go through a ``prediction_cache`` for batches of up to
+``--cache-max-rows`` rows unless started with ``--no-cache``.
+
+    python service.py --port 8600
+
+Endpoints:
+    GET  /health          -> {"status": "ok"}
+    GET  /stats           -> {"model_version": "...", "cache": {"hits": ..., ...}, "registry": {...}}
+    POST /predict         {"Area_SqFt": 1200, "Floor_No": 5, "Bedroom": 2}
+                          -> {"price_lakh": 668.87, "interval": {"level": 0.9, "lower_lakh": ..., "upper_lakh": ...}}
+    POST /predict/batch   {"scenarios": [{...}, {...}], "level": 0.9}
+                          -> {"price_lakh": [668.87, ...], "interval": {"level": 0.9, "lower_lakh": [...], ...}}
+    POST /model/rollback  -> {"model_version": "..."}
+
+Scenarios may also set the model's other inputs (``Region``, ``Property_Age``, ``Area_Tpye``,
+``Rate_SqFt``); those left out take the defaults in the model's feature schema, and unknown
+categories are rejected with 400. ``interval`` is null when the served model carries no
+residual covariance (e.g. converted from a pickle); ``level`` is optional on both predict
+endpoints and defaults to 0.9.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import asdict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+import prediction_cache
+import predictor
+
+MAX_BATCH_ROWS = 100_000
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY keep-alive
+    # clients stall ~40 ms per request on delayed ACKs.
+    disable_nagle_algorithm = True
+    server: "PredictionServer"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        elif self.path == "/stats":
+            stats = None if self.server.cache is None else self.server.cache.stats()
+            self._send_json(HTTPStatus.OK, {
+                "model_version": self.server.registry.current().version,
+                "cache": None if stats is None else {**asdict(stats), "hit_rate": stats.hit_rate},
+                "registry": self.server.registry.status(),
+            })
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:
+        try:
+            payload = self._read_json()
+            if self.path == "/predict":
+                scenarios = _scenarios([payload])
+                prices, interval = self.server.predict(scenarios, _interval_level(payload))
+                if interval is not None:
+                    interval = {**interval, "lower_lakh": interval["lower_lakh"][0], "upper_lakh": interval["upper_lakh"][0]}
+                self._send_json(HTTPStatus.OK, {"price_lakh": float(prices[0]), "interval": interval})
+            elif self.path == "/predict/batch":
+                rows = payload.get("scenarios") if isinstance(payload, dict) else None
+                if not isinstance(rows, list):
+                    raise ValueError("Body must be an object with a 'scenarios' list")
+                if len(rows) > MAX_BATCH_ROWS:
+                    raise ValueError(f"Batch exceeds {MAX_BATCH_ROWS:,} scenarios")
+                prices, interval = self.server.predict(_scenarios(rows), _interval_level(payload))
+                self._send_json(HTTPStatus.OK, {"price_lakh": prices.tolist(), "interval": interval})
+            elif self.path == "/model/rollback":
+                try:
+                    loaded = self.server.registry.rollback()
+                except RuntimeError as exc:
+                    self._send_json(HTTPStatus.CONFLICT, {"error": str(exc)})
+                else:
+                    self._send_json(HTTPStatus.OK, {"model_version": loaded.version})
+            else:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+        except ValueError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"null")
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSON body: {exc}") from exc
+
+    def _send_json(self, status: HTTPStatus, body: dict) -> None:
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+class PredictionServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], registry: model_registry.ModelRegistry, verbose: bool = False,
+                 cache: prediction_cache.PredictionCache | None = None) -> None:
+        super().__init__(address, PredictionHandler)
+        self.registry = registry
+        self.verbose = verbose
+        self.cache = cache
+
+    def predict(self, scenarios: predictor.Scenarios, level: float) -> tuple[np.ndarray, dict | None]:
+        """Prices plus, when the model supports it, the ``level`` interval bounds."""
+        # One snapshot per request: a concurrent swap never mixes two models in a batch.
+        loaded = self.registry.current()
+        features = predictor.build_feature_matrix(predictor.model_schema(loaded.model), scenarios)
+        if predictor.supports_intervals(loaded.model):
+            # Estimate and bounds share one polynomial expansion; the cache would only save its final dot product.
+            prices, lower, upper = loaded.model.predict_interval(features, level)
+            return prices, {"level": level, "lower_lakh": lower.tolist(), "upper_lakh": upper.tolist()}
+        if self.cache is None:
+            prices = loaded.model.predict(features) if len(features) else np.empty(0)
+        else:
+            prices = self.cache.predict(loaded, features)
+        return np.asarray(prices, dtype=float), None
+
+    def server_close(self) -> None:
+        self.registry.stop()
+        super().server_close()
+
+
+def _interval_level(payload: dict) -> float:
+    level = payload.get("level", predictor.INTERVAL_LEVEL)
+    if isinstance(level, bool) or not isinstance(level, (int, float)) or not 0 < level < 1:
+        raise ValueError("'level' must be a number between 0 and 1")
+    return float(level)
+
+
+def _scenarios(rows: list) -> predictor.Scenarios:
+    """Scenario matrix, or a frame when any row also sets other model inputs (e.g. ``Region``)."""
+    try:
+        values = np.array(
+            [[float(row[column]) for column in predictor.SCENARIO_COLUMNS] for row in rows],
+            dtype=float,
+        ).reshape(len(rows), len(predictor.SCENARIO_COLUMNS))
+    except (KeyError, TypeError) as exc:
+        raise ValueError(
+            f"Each scenario needs numeric {', '.join(predictor.SCENARIO_COLUMNS)} fields"
+        ) from exc
+    extra = sorted({key for row in rows for key in row} - {*predictor.SCENARIO_COLUMNS, "level"})
+    if not extra:
+        return values
+    frame = pd.DataFrame(values, columns=list(predictor.SCENARIO_COLUMNS))
+    for column in extra:
+        frame[column] = [row.get(column) for row in rows]
+    return frame
+
+
+def create_server(host: str = "127.0.0.1", port: int = 8600, model_path: Path = predictor.MODEL_PATH,
+                  verbose: bool = False, cache: bool = True,
+                  cache_max_rows: int = prediction_cache.MAX_BATCH_ROWS) -> PredictionServer:
+    registry = model_registry.ModelRegistry(model_path)
+    registry.current()
+    return PredictionServer((host, port), registry.start(), verbose=verbose,
+                            cache=prediction_cache.PredictionCache(max_batch_rows=cache_max_rows) if cache else None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--model", type=Path, default=predictor.MODEL_PATH)
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the model")
+    parser.add_argument("--cache-max-rows", type=int, default=prediction_cache.MAX_BATCH_ROWS,
+                        help="Larger batches skip the prediction cache and go straight to the model")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.model, args.verbose, cache=not args.no_cache,
+                           cache_max_rows=args.cache_max_rows)
+    print(f"Serving predictions on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""K-fold sweep over model families and polynomial degrees, with a latency/size leaderboard.
+
+``Project Model Building.ipynb`` compares a linear model, a decision tree, a 1000-tree random
+forest and two polynomial pipelines one cell at a time on a single split. Here every
+(configuration, fold) pair is an independent job run across a joblib process pool. Each job
+stores its fold score, single-row inference latency and shipped artifact size as JSON under
+``.cache/sweep/``, keyed by dataset version, configuration and fold, so a rerun only fits
+what is new or changed.
+
+Features and encoders come from ``train`` so the sweep scores exactly what ``train.py``
+would ship. Artifact size is the ``model_artifact`` files for exportable pipelines and the
+pickle otherwise.
+
+    python sweep.py [--folds 5] [--jobs -1] [--latency-budget-ms 1.0] [--only linear poly2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from joblib import Parallel, delayed
+
+import data_store
+import model_artifact
+import train
+
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_DIR = data_store.CACHE_DIR / "sweep"
+
+FOLDS = 5
+SEED = 12
+LATENCY_REPEATS = 200
+
+
+@dataclass(frozen=True)
+class Config:
+    name: str
+    family: str
+    params: dict
+    degree: int = 0
+
+    def key(self) -> str:
+        return json.dumps({"family": self.family, "params": self.params, "degree": self.degree}, sort_keys=True)
+
+    def build(self):
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.linear_model import LinearRegression
+        from sklearn.pipeline import Pipeline
+        from sklearn.preprocessing import PolynomialFeatures
+        from sklearn.tree import DecisionTreeRegressor
+
+        families = {
+            "linear": LinearRegression,
+            "tree": DecisionTreeRegressor,
+            "forest": RandomForestRegressor,
+        }
+        estimator = families[self.family](**self.params)
+        if not self.degree:
+            return estimator
+        return Pipeline([("poly", PolynomialFeatures(degree=self.degree)), (self.family, estimator)])
+
+
+# The notebook's five models first, then the degrees it did not try.
+CONFIGS = (
+    Config("linear", "linear", {}),
+    Config("tree", "tree", {"min_samples_split": 2, "random_state": SEED}),
+    Config("forest1000_d5", "forest", {"n_estimators": 1000, "max_depth": 5, "random_state": SEED}),
+    Config("poly2_forest1000_d5", "forest", {"n_estimators": 1000, "max_depth": 5, "random_state": SEED}, degree=2),
+    Config("poly2", "linear", {"fit_intercept": False}, degree=2),
+    Config("poly3", "linear", {"fit_intercept": False}, degree=3),
+    Config("forest100_d8", "forest", {"n_estimators": 100, "max_depth": 8, "random_state": SEED}),
+)
+
+
+def load_features(csv_path: Path = train.DATA_PATH) -> tuple[np.ndarray, np.ndarray, str]:
+    """Encoded feature matrix, target and dataset version, as ``train`` builds them."""
+    parquet_path, version = data_store.ensure_cache(csv_path)
+    schema, _ = train.fit_schema(parquet_path)
+    frame = pq.read_table(parquet_path, columns=[*train.FEATURE_COLUMNS, train.TARGET_COLUMN]).to_pandas()
+    features = train.encode(frame, schema.encoders)
+    target = frame[train.TARGET_COLUMN].to_numpy(dtype=float)
+    valid = np.isfinite(features).all(axis=1) & np.isfinite(target)
+    return features[valid], target[valid], version
+
+
+def fold_indices(n_rows: int, folds: int = FOLDS, seed: int = SEED) -> list[tuple[np.ndarray, np.ndarray]]:
+    from sklearn.model_selection import KFold
+
+    return list(KFold(n_splits=folds, shuffle=True, random_state=seed).split(np.zeros((n_rows, 1))))
+
+
+def _cache_path(dataset_version: str, config: Config, fold: int, folds: int) -> Path:
+    digest = hashlib.sha256(f"{dataset_version}|{config.key()}|{fold}/{folds}|{SEED}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{config.name}.{digest[:16]}.json"
+
+
+def _artifact_bytes(model) -> int:
+    with tempfile.TemporaryDirectory() as scratch:
+        manifest_path = Path(scratch) / "model.json"
+        try:
+            model_artifact.export_artifact(model, manifest_path)
+        except ValueError:
+            return len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+        return manifest_path.stat().st_size + model_artifact.data_path_for(manifest_path).stat().st_size
+
+
+def run_fold(config: Config, fold: int, train_rows: np.ndarray, test_rows: np.ndarray,
+             features: np.ndarray, target: np.ndarray, cache_path: Path) -> dict:
+    """Fit one fold, score it and record latency and size; reuses ``cache_path`` if present."""
+    if cache_path.exists():
+        return {**json.loads(cache_path.read_text(encoding="utf-8")), "cached": True}
+
+    model = config.build()
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        model.fit(features[train_rows], target[train_rows])
+    fit_seconds = time.perf_counter() - start
+
+    predicted = model.predict(features[test_rows])
+    residual = predicted - target[test_rows]
+    total = ((target[test_rows] - target[test_rows].mean()) ** 2).sum()
+
+    row = features[test_rows[:1]]
+    timings = []
+    for _ in range(LATENCY_REPEATS):
+        start = time.perf_counter()
+        model.predict(row)
+        timings.append(time.perf_counter() - start)
+
+    result = {
+        "config": config.name,
+        "fold": fold,
+        "r2": float(1 - (residual @ residual) / total),
+        "mae": float(np.abs(residual).mean()),
+        "fit_seconds": fit_seconds,
+        "latency_ms": float(np.median(timings) * 1e3),
+        "artifact_bytes": _artifact_bytes(model),
+    }
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(result), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+    return {**result, "cached": False}
+
+
+def sweep(configs: tuple[Config, ...] = CONFIGS, folds: int = FOLDS, jobs: int = -1,
+          csv_path: Path = train.DATA_PATH) -> pd.DataFrame:
+    """One row per (configuration, fold); cached folds are read back instead of refitted."""
+    features, target, version = load_features(csv_path)
+    splits = fold_indices(len(target), folds)
+    tasks = [(config, fold, *splits[fold], _cache_path(version, config, fold, folds))
+             for config in configs for fold in range(folds)]
+    pending = [task for task in tasks if not task[-1].exists()]
+    results = {}
+    if pending:
+        # Largest jobs first so the pool does not end on a lone 1000-tree forest.
+        pending.sort(key=lambda task: task[0].params.get("n_estimators", 1), reverse=True)
+        for task, result in zip(pending, Parallel(n_jobs=jobs)(
+                delayed(run_fold)(config, fold, train_rows, test_rows, features, target, path)
+                for config, fold, train_rows, test_rows, path in pending)):
+            results[task[-1]] = result
+    return pd.DataFrame([results.get(task[-1]) or run_fold(*task[:4], features, target, task[-1]) for task in tasks])
+
+
+def leaderboard(folds: pd.DataFrame, latency_budget_ms: float | None = None) -> pd.DataFrame:
+    board = folds.groupby("config", sort=False).agg(
+        r2=("r2", "mean"),
+        r2_std=("r2", "std"),
+        mae=("mae", "mean"),
+        latency_ms=("latency_ms", "median"),
+        artifact_kib=("artifact_bytes", lambda sizes: sizes.mean() / 1024),
+        fit_seconds=("fit_seconds", "mean"),
+        cached_folds=("cached", "sum"),
+    )
+    if latency_budget_ms is not None:
+        board["within_budget"] = board["latency_ms"] <= latency_budget_ms
+    return board.sort_values("r2", ascending=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", type=Path, default=train.DATA_PATH)
+    parser.add_argument("--folds", type=int, default=FOLDS)
+    parser.add_argument("--jobs", type=int, default=-1, help="joblib worker processes (-1 = all cores)")
+    parser.add_argument("--latency-budget-ms", type=float, help="Flag configurations slower than this per row")
+    parser.add_argument("--only", nargs="+", metavar="CONFIG", help="Subset of: " + ", ".join(c.name for c in CONFIGS))
+    parser.add_argument("--output", type=Path, help="Also write the leaderboard as CSV")
+    args = parser.parse_args()
+
+    configs = tuple(config for config in CONFIGS if not args.only or config.name in args.only)
+    if not configs:
+        raise SystemExit(f"No configurations match {args.only}")
+    start = time.perf_counter()
+    board = leaderboard(sweep(configs, args.folds, args.jobs, args.data), args.latency_budget_ms)
+    with pd.option_context("display.width", 160, "display.float_format", "{:,.4f}".format):
+        print(board.to_string())
+    print(f"\n{len(configs) * args.folds} folds in {time.perf_counter() - start:.1f} s "
+          f"({int(board['cached_folds'].sum())} from {CACHE_DIR})")
+    if args.output:
+        board.to_csv(args.output)
+
+
+if __name__ == "__main__":
+    main()
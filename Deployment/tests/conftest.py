@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The app modules are flat files in Deployment/, imported the way the pages and benchmarks import them.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
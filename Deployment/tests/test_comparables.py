@@ -0,0 +1,10 @@
+import comparables
+
+
+def test_shipped_table_builds_an_index():
+    assert comparables.MAP_LOCATION_PATH.parent == comparables.BASE_DIR
+    assert comparables.load_index() is not None
+
+
+def test_missing_table_skips_comparables(tmp_path):
+    assert comparables.load_index(tmp_path / "Map_Location.csv") is None
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import feature_schema
+
+SCHEMA = feature_schema.FeatureSchema.from_encoders(
+    ["Region", "Area_SqFt", "Floor_No"], {"Region": ["Andheri Mumbai", "Thane"]}, defaults={"Floor_No": 3})
+
+
+def test_missing_numbers_take_the_default_where_there_is_one():
+    matrix = SCHEMA.matrix(pd.DataFrame({"Region": ["Thane"], "Area_SqFt": [900.0], "Floor_No": [np.nan]}))
+    np.testing.assert_array_equal(matrix, [[1.0, 900.0, 3.0]])
+
+
+@pytest.mark.parametrize("columns, fixed", [
+    ({"Area_SqFt": np.array([900.0, np.nan])}, {"Region": "Thane"}),
+    ({"Area_SqFt": pd.Series([900.0, None], dtype=object)}, {"Region": "Thane"}),
+    ({"Region": np.array(["Thane", "Thane"])}, {"Area_SqFt": float("nan")}),
+    ({"Area_SqFt": np.array([900.0, np.inf])}, {"Region": "Thane"}),
+    ({"Area_SqFt": np.array([900.0, 650.0]), "Floor_No": np.array([2.0, -np.inf])}, {"Region": "Thane"}),
+])
+def test_non_finite_numbers_without_a_usable_default_are_rejected(columns, fixed):
+    with pytest.raises(ValueError, match="needs finite numbers"):
+        SCHEMA.matrix(columns, fixed, rows=2)
@@ -0,0 +1,24 @@
+import sys
+
+import pytest
+
+import incremental
+
+
+def _run(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["incremental.py", *map(str, args)])
+    incremental.main()
+
+
+def test_half_life_that_disagrees_with_the_state_is_rejected_unless_changed_explicitly(tmp_path, monkeypatch):
+    state = tmp_path / "incremental.npz"
+    _run(monkeypatch, "--state", state, "--half-life-days", 180)
+    assert incremental.IncrementalTrainer.load(state).half_life_days == 180
+
+    _run(monkeypatch, "--state", state, "--half-life-days", 180)
+    with pytest.raises(SystemExit, match="half-life 180 days, not 90 days"):
+        _run(monkeypatch, "--state", state, "--half-life-days", 90)
+    assert incremental.IncrementalTrainer.load(state).half_life_days == 180
+
+    _run(monkeypatch, "--state", state, "--half-life-days", 90, "--change-half-life")
+    assert incremental.IncrementalTrainer.load(state).half_life_days == 90
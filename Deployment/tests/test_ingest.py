@@ -0,0 +1,27 @@
+import ingest
+
+MALFORMED_LISTING = """
+<html><body>
+<div id="pricePerUnitArea"><p>Rate ₹ 12,500/sq.ft</div>
+<div id="factArea"><ul><li>Carpet Area<li>650 sq.ft</ul></div>
+<p>Contact the owner
+<span id="pdPrice2">₹ 81.25 Lac</b></span>
+<span id="bedRoomNum">2 Bedrooms</span>
+<i id="address">Kharghar, Navi Mumbai</i>
+</body></html>
+"""
+
+
+def test_implicitly_closed_and_stray_tags_do_not_leak_into_other_fields():
+    row = ingest.parse_listing(MALFORMED_LISTING)
+    assert row["Rate_SqFt"] == "₹"
+    assert row["Area_Tpye"] == "Carpet Area650 sq.ft"
+    assert row["Price"] == "₹ 81.25 Lac"
+    assert row["Bedroom"] == "2"
+    assert row["Location"] == "Kharghar, Navi Mumbai"
+    assert row["Floor_No"] is None
+
+
+def test_search_page_links():
+    markup = '<ul><li><a class="body_med srpTuple__propertyName" href="/flat-1">A</a><li>no link</ul>'
+    assert ingest.parse_search_page(markup) == ["/flat-1"]
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+import data_store
+import listing_browser
+
+PAGE_SIZE = 25
+
+
+@pytest.fixture(scope="module")
+def table():
+    df = data_store.load_listings().iloc[:400].reset_index(drop=True)
+    # Missing keys in a numeric and a dictionary-coded sort column.
+    df.loc[::7, "Price_Lakh"] = np.nan
+    df.loc[::11, "Region"] = np.nan
+    return df
+
+
+def _pandas_rows(df, query):
+    matches = df
+    if query.bedrooms:
+        matches = matches[matches["Bedroom"].isin(query.bedrooms)]
+    if query.sort_by is not None:
+        key = (lambda column: column.astype(object)) if query.sort_by in data_store.CATEGORICAL_COLUMNS else None
+        matches = matches.sort_values(query.sort_by, ascending=not query.descending, kind="stable", key=key)
+    return matches.index.tolist()
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("sort_by", ["Price_Lakh", "Bedroom", "Floor_No", "Region"])
+@pytest.mark.parametrize("bedrooms", [(), (4,)])
+def test_pages_follow_a_stable_pandas_sort_with_missing_values_last(table, sort_by, descending, bedrooms):
+    browser = listing_browser.ListingBrowser(table, data_store.load_dictionary())
+    query = listing_browser.ListingQuery(bedrooms=bedrooms, sort_by=sort_by, descending=descending)
+    expected = _pandas_rows(table, query)
+
+    first = browser.page(query, 1, PAGE_SIZE)
+    assert first.total_rows == len(expected)
+    rows = []
+    for number in range(1, first.pages + 1):
+        rows += browser.page(query, number, PAGE_SIZE).rows.index.tolist()
+    assert rows == expected
+
+
+def test_warm_browser_reuses_saved_permutations_of_its_dataset_version(table, tmp_path):
+    dictionary = data_store.load_dictionary()
+    (tmp_path / "Price_Lakh.desc.0123456789abcdef.npy").write_bytes(b"stale")
+    built = listing_browser.ListingBrowser(table, dictionary, version="f" * 64).warm(tmp_path)
+    saved = sorted(path.name for path in tmp_path.iterdir())
+    assert len(saved) == 2 * len(listing_browser.SORT_COLUMNS)
+    assert all(name.endswith(".ffffffffffffffff.npy") for name in saved)
+
+    loaded = listing_browser.ListingBrowser(table, dictionary, version="f" * 64).warm(tmp_path)
+    assert isinstance(loaded._order("Price_Lakh", True), np.memmap)
+    query = listing_browser.ListingQuery(bedrooms=(2, 3), sort_by="Price_Lakh", descending=True)
+    assert loaded.page(query, 2, PAGE_SIZE).rows.index.tolist() == built.page(query, 2, PAGE_SIZE).rows.index.tolist()
@@ -0,0 +1,43 @@
+import shutil
+
+import data_store
+import model_artifact
+import model_registry
+import predictor
+import train
+
+
+def _publish(source_dir, target_dir, suffix):
+    name = predictor.MODEL_PATH.with_suffix(suffix).name
+    shutil.copyfile(source_dir / name, target_dir / name)
+
+
+def test_manifest_published_before_its_array_file_is_picked_up_once_the_bin_arrives(tmp_path):
+    live, staging = tmp_path / "live", tmp_path / "staging"
+    live.mkdir()
+    staging.mkdir()
+    for suffix in (".json", ".bin"):
+        _publish(predictor.MODEL_PATH.parent, live, suffix)
+
+    current = model_artifact.load_artifact(predictor.MODEL_PATH)
+    parameters = current.parameters
+    train.write_model(parameters.powers, parameters.coef * 1.001, current.schema,
+                      staging / predictor.MODEL_PATH.name, source="registry test")
+
+    registry = model_registry.ModelRegistry(
+        live / predictor.MODEL_PATH.name,
+        holdout=model_registry.holdout_sample(data_store.load_listings(), rows=200),
+    )
+    first = registry.current().version
+
+    # The new manifest lands first and still points at the old array file: checksum mismatch.
+    _publish(staging, live, ".json")
+    event = registry.refresh()
+    assert event is not None and not event.accepted and "load failed" in event.detail
+    assert registry.current().version == first
+
+    _publish(staging, live, ".bin")
+    event = registry.refresh()
+    assert event is not None and event.accepted
+    assert registry.current().version != first
+    assert registry.refresh() is None
@@ -0,0 +1,20 @@
+import numpy as np
+
+import prediction_cache
+import predictor
+
+
+def test_small_batches_are_cached_and_larger_ones_bypass_the_cache():
+    loaded = predictor.current_model()
+    cache = prediction_cache.PredictionCache(max_batch_rows=4)
+    small = np.array([[1200.0, 5.0, 2.0], [650.0, 1.0, 1.0], [1200.0, 5.0, 2.0]])
+    large = np.column_stack([np.arange(500.0, 1500.0, 100.0), np.ones(10), np.full(10, 2.0)])
+
+    expected = predictor.predict_batch(loaded.model, small)
+    np.testing.assert_allclose(prediction_cache.predict(small, loaded, cache), expected)
+    np.testing.assert_allclose(prediction_cache.predict(small, loaded, cache), expected)
+    np.testing.assert_allclose(prediction_cache.predict(large, loaded, cache),
+                               predictor.predict_batch(loaded.model, large))
+
+    stats = cache.stats()
+    assert (stats.size, stats.misses, stats.hits, stats.bypassed) == (2, 3, 3, 10)
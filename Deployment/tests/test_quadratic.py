@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+import predictor
+import quadratic
+
+
+def test_quadratic_form_of_the_artifact_prices_scenarios_like_the_artifact(tmp_path):
+    model = predictor.load_model(predictor.MODEL_PATH)
+    form = quadratic.export_quadratic(model)
+    form.save(tmp_path / "form.npz")
+    form = quadratic.QuadraticForm.load(tmp_path / "form.npz")
+    assert form.schema == model.schema
+
+    scenarios = pd.DataFrame({"Area_SqFt": [650.0, 1200.0, 2400.0], "Floor_No": [2, 7, 15], "Bedroom": [1, 2, 4]},
+                             index=[10, 20, 30])
+    fixed = {"Region": model.schema.feature("Region").categories[0]}
+    expected = predictor.predict_batch(model, scenarios, fixed)
+    priced = predictor.predict_batch(form, scenarios, fixed)
+    assert priced.index.tolist() == [10, 20, 30]
+    np.testing.assert_allclose(priced.to_numpy(), expected.to_numpy(), rtol=1e-9)
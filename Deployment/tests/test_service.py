@@ -0,0 +1,37 @@
+import numpy as np
+
+import model_artifact
+import model_registry
+import prediction_cache
+import predictor
+import service
+
+
+def test_interval_request_builds_and_expands_its_features_once(monkeypatch):
+    calls = {"build": 0, "expand": 0}
+    build, expand = predictor.build_feature_matrix, model_artifact.PolynomialStep.transform
+
+    def counted_build(*args, **kwargs):
+        calls["build"] += 1
+        return build(*args, **kwargs)
+
+    def counted_expand(self, X):
+        calls["expand"] += 1
+        return expand(self, X)
+
+    server = service.PredictionServer(("127.0.0.1", 0), model_registry.ModelRegistry(predictor.MODEL_PATH),
+                                      cache=prediction_cache.PredictionCache())
+    try:
+        loaded = server.registry.current()
+        scenarios = np.array([[1200.0, 5.0, 2.0], [650.0, 1.0, 1.0]])
+        expected = predictor.predict_interval_batch(loaded.model, scenarios, 0.9)
+        monkeypatch.setattr(predictor, "build_feature_matrix", counted_build)
+        monkeypatch.setattr(model_artifact.PolynomialStep, "transform", counted_expand)
+        prices, interval = server.predict(scenarios, 0.9)
+    finally:
+        server.server_close()
+
+    assert calls == {"build": 1, "expand": 1}
+    np.testing.assert_allclose(prices, expected[:, 0])
+    np.testing.assert_allclose(interval["lower_lakh"], expected[:, 1])
+    np.testing.assert_allclose(interval["upper_lakh"], expected[:, 2])
@@ -0,0 +1,17 @@
+import importlib
+import sys
+
+import train
+
+
+def test_training_without_the_resource_module_leaves_out_peak_rss(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "resource", None)
+    try:
+        reloaded = importlib.reload(train)
+        assert reloaded.resource is None
+        report = reloaded.train(reloaded.DATA_PATH, tmp_path / "regression_model.json")
+    finally:
+        monkeypatch.undo()
+        importlib.reload(train)
+    assert report.peak_mib is None
+    assert report.rows_test > 0
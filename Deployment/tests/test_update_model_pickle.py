@@ -0,0 +1,37 @@
+import sys
+
+import pytest
+
+import model_artifact
+import update_model_pickle
+
+
+def _run(monkeypatch, output):
+    monkeypatch.setattr(sys, "argv", ["update_model_pickle.py", "--output", str(output)])
+    update_model_pickle.main()
+
+
+def test_conversion_that_fails_the_round_trip_leaves_the_live_artifact_alone(tmp_path, monkeypatch):
+    output = tmp_path / "regression_model.json"
+    output.write_text("live manifest")
+    real_load = model_artifact.load_artifact
+
+    class Skewed:
+        def __init__(self, path):
+            self.model = real_load(path)
+
+        def predict(self, X):
+            return self.model.predict(X) + 1.0
+
+    monkeypatch.setattr(model_artifact, "load_artifact", Skewed)
+    with pytest.raises(SystemExit, match="disagrees"):
+        _run(monkeypatch, output)
+    assert output.read_text() == "live manifest"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["regression_model.json"]
+
+
+def test_conversion_publishes_a_loadable_pair(tmp_path, monkeypatch):
+    output = tmp_path / "regression_model.json"
+    _run(monkeypatch, output)
+    assert model_artifact.load_artifact(output).schema is not None
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["regression_model.bin", "regression_model.json"]
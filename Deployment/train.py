@@ -0,0 +1,271 @@
+"""Reproducible retraining of the price model, extracted from ``Project Model Building.ipynb``.
+
+The notebook label-encodes ``Region``, ``Property_Age`` and ``Area_Tpye`` (sorted categories,
+as ``LabelEncoder`` does), holds out 20% of rows with ``train_test_split(random_state=12)``,
+fits ``PolynomialFeatures(degree=2)`` + ``LinearRegression(fit_intercept=False)`` and pickles
+the result, discarding the encoders. This script reads the same columns from the Parquet
+cache kept by ``data_store`` in record batches, so the whole table is never in memory:
+
+1. one pass collects the feature schema (category lists and defaults) and per-feature scales;
+2. one pass accumulates ``XᵀX`` and ``Xᵀy`` of the expanded training rows (inputs scaled to
+   [-1, 1] to keep the normal equations well conditioned) and solves them;
+3. one pass scores the held-out rows.
+
+The split reproduces the notebook's permutation exactly. The fitted model is written as a
+``model_artifact`` with the ``feature_schema`` and the residual covariance (for prediction
+intervals) in it, ready for ``model_registry`` to pick up.
+
+    python train.py [--output regression_model.json] [--batch-rows 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import math
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+import data_store
+import feature_schema
+import model_artifact
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, so the report leaves out the peak RSS.
+    resource = None
+
+BASE_DIR = Path(__file__).resolve().parent
+DATA_PATH = data_store.DATA_PATH
+
+FEATURE_COLUMNS = ("Region", "Property_Age", "Area_Tpye", "Area_SqFt", "Rate_SqFt", "Floor_No", "Bedroom")
+ENCODED_COLUMNS = ("Region", "Property_Age", "Area_Tpye")
+TARGET_COLUMN = "Price_Lakh"
+
+DEGREE = 2
+TEST_SIZE = 0.2
+SEED = 12
+BATCH_ROWS = 100_000
+
+
+@dataclass(frozen=True)
+class TrainingReport:
+    rows_train: int
+    rows_test: int
+    fit_seconds: float
+    peak_mib: float | None
+    mae: float
+    rmse: float
+    r2: float
+    manifest: dict
+
+
+def peak_rss_mib() -> float | None:
+    """Peak resident set size of this process so far, or None where the platform cannot tell."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def polynomial_powers(n_features: int, degree: int = DEGREE) -> np.ndarray:
+    """Exponent matrix in ``PolynomialFeatures(include_bias=True)`` output order."""
+    rows = []
+    for order in range(degree + 1):
+        for combination in itertools.combinations_with_replacement(range(n_features), order):
+            rows.append(np.bincount(combination, minlength=n_features))
+    return np.array(rows, dtype="<i8")
+
+
+def test_mask(n_rows: int, test_size: float = TEST_SIZE, seed: int = SEED) -> np.ndarray:
+    """Boolean mask of held-out rows, identical to ``train_test_split``'s shuffled split."""
+    n_test = math.ceil(test_size * n_rows)
+    mask = np.zeros(n_rows, dtype=bool)
+    mask[np.random.RandomState(seed).permutation(n_rows)[:n_test]] = True
+    return mask
+
+
+def _batches(parquet_path: Path, columns: list[str], batch_rows: int):
+    """Yield (first row number, frame) for consecutive record batches of ``columns``."""
+    start = 0
+    for batch in pq.ParquetFile(parquet_path).iter_batches(batch_size=batch_rows, columns=columns):
+        frame = batch.to_pandas()
+        yield start, frame
+        start += len(frame)
+
+
+def fit_schema(parquet_path: Path, batch_rows: int = BATCH_ROWS) -> tuple[feature_schema.FeatureSchema, np.ndarray]:
+    """Feature schema and the max |value| of every feature.
+
+    Encoded columns get their sorted categories and the most frequent one as default; numeric
+    columns default to their mean.
+    """
+    counts: dict[str, pd.Series] = {column: pd.Series(dtype=float) for column in ENCODED_COLUMNS}
+    numeric = [column for column in FEATURE_COLUMNS if column not in ENCODED_COLUMNS]
+    peaks = pd.Series(0.0, index=numeric)
+    sums = pd.Series(0.0, index=numeric)
+    observed = pd.Series(0.0, index=numeric)
+    for _, frame in _batches(parquet_path, list(FEATURE_COLUMNS), batch_rows):
+        for column in ENCODED_COLUMNS:
+            tally = frame[column].value_counts()
+            tally = tally[tally > 0].groupby(tally[tally > 0].index.astype(str)).sum()
+            counts[column] = counts[column].add(tally, fill_value=0)
+        peaks = np.maximum(peaks, frame[numeric].abs().max())
+        sums += frame[numeric].sum()
+        observed += frame[numeric].count()
+    encoders = {column: sorted(tally.index) for column, tally in counts.items()}
+    defaults = {column: tally.idxmax() for column, tally in counts.items() if len(tally)}
+    defaults.update((sums / observed.where(observed > 0)).dropna().to_dict())
+    scales = np.array([max(len(encoders[column]) - 1, 1) if column in encoders else peaks[column]
+                       for column in FEATURE_COLUMNS], dtype=float)
+    schema = feature_schema.FeatureSchema.from_encoders(FEATURE_COLUMNS, encoders, defaults)
+    return schema, np.where(scales > 0, scales, 1.0)
+
+
+def encode(frame: pd.DataFrame, encoders: dict[str, list[str]]) -> np.ndarray:
+    """Feature matrix in ``FEATURE_COLUMNS`` order with the label-encoded columns as codes."""
+    features = np.empty((len(frame), len(FEATURE_COLUMNS)))
+    for position, column in enumerate(FEATURE_COLUMNS):
+        if column in encoders:
+            features[:, position] = feature_schema.category_codes(frame[column], encoders[column])
+        else:
+            features[:, position] = frame[column].to_numpy(dtype=float)
+    return features
+
+
+def _labelled_batches(parquet_path: Path, encoders: dict[str, list[str]], batch_rows: int):
+    columns = [*FEATURE_COLUMNS, TARGET_COLUMN]
+    for start, frame in _batches(parquet_path, columns, batch_rows):
+        features = encode(frame, encoders)
+        target = frame[TARGET_COLUMN].to_numpy(dtype=float)
+        valid = np.isfinite(features).all(axis=1) & np.isfinite(target)
+        yield np.arange(start, start + len(frame))[valid], features[valid], target[valid]
+
+
+def solve(gram: np.ndarray, moment: np.ndarray, scales: np.ndarray, powers: np.ndarray) -> np.ndarray:
+    """Coefficients on the unscaled features from normal equations built on ``features / scales``."""
+    # Jacobi scaling before solving; lstsq copes with the rank deficiency a constant column causes.
+    diagonal = np.sqrt(np.where(np.diag(gram) > 0, np.diag(gram), 1.0))
+    solution = np.linalg.lstsq(gram / np.outer(diagonal, diagonal), moment / diagonal, rcond=None)[0] / diagonal
+    return solution / np.prod(scales ** powers, axis=1)
+
+
+def residual_stats(gram: np.ndarray, moment: np.ndarray, target_squares: float, weight: float,
+                   scales: np.ndarray, powers: np.ndarray, coef: np.ndarray) -> tuple[np.ndarray, np.ndarray, dict]:
+    """``(XᵀX)⁻¹`` in scaled-term coordinates, the term scales and the residual variance/dof.
+
+    Everything comes from the accumulators: ``SSE = yᵀy - 2βᵀXᵀy + βᵀXᵀXβ``.
+    """
+    term_scales = np.prod(scales ** powers, axis=1)
+    diagonal = np.sqrt(np.where(np.diag(gram) > 0, np.diag(gram), 1.0))
+    normalised = gram / np.outer(diagonal, diagonal)
+    covariance = np.linalg.pinv(normalised, hermitian=True) / np.outer(diagonal, diagonal)
+    scaled_coef = coef * term_scales
+    squares = max(target_squares - 2 * scaled_coef @ moment + scaled_coef @ gram @ scaled_coef, 0.0)
+    dof = weight - np.linalg.matrix_rank(normalised, hermitian=True)
+    variance = squares / dof if dof > 0 else float("nan")
+    return covariance, term_scales, {"variance": float(variance), "dof": float(dof)}
+
+
+def write_model(powers: np.ndarray, coef: np.ndarray, schema: feature_schema.FeatureSchema, output: Path,
+                source: str, residual: tuple[np.ndarray, np.ndarray, dict] | None = None) -> dict:
+    """Write the fitted polynomial model as a ``model_artifact`` and return its manifest.
+
+    ``residual`` is the output of ``residual_stats`` and enables prediction intervals.
+    """
+    arrays = {"poly.powers": powers, "linear.coef": coef.astype("<f8"), "linear.intercept": np.zeros(1, dtype="<f8")}
+    if residual is not None:
+        arrays["linear.covariance"] = np.ascontiguousarray(residual[0], dtype="<f8")
+        arrays["linear.term_scales"] = np.ascontiguousarray(residual[1], dtype="<f8")
+    return model_artifact.write_artifact(
+        [{"name": "poly", "kind": "PolynomialFeatures",
+          "params": {"degree": int(powers.sum(axis=1).max()), "interaction_only": False, "include_bias": True}},
+         {"name": "linear", "kind": "LinearRegression", "params": {"fit_intercept": False}}],
+        arrays, list(FEATURE_COLUMNS), output, source=source, schema=schema,
+        residual=None if residual is None else residual[2],
+    )
+
+
+def train(csv_path: Path = DATA_PATH, output: Path = model_artifact.ARTIFACT_PATH, degree: int = DEGREE,
+          test_size: float = TEST_SIZE, seed: int = SEED, batch_rows: int = BATCH_ROWS) -> TrainingReport:
+    start = time.perf_counter()
+    parquet_path, dataset_version = data_store.ensure_cache(csv_path)
+    schema, scales = fit_schema(parquet_path, batch_rows)
+    encoders = schema.encoders
+    is_test = test_mask(pq.ParquetFile(parquet_path).metadata.num_rows, test_size, seed)
+
+    powers = polynomial_powers(len(FEATURE_COLUMNS), degree)
+    expand = model_artifact.PolynomialStep(powers).transform
+    gram = np.zeros((len(powers), len(powers)))
+    moment = np.zeros(len(powers))
+    target_squares = 0.0
+    rows_train = 0
+    for rows, features, target in _labelled_batches(parquet_path, encoders, batch_rows):
+        train_rows = ~is_test[rows]
+        expanded = expand(features[train_rows] / scales)
+        gram += expanded.T @ expanded
+        moment += expanded.T @ target[train_rows]
+        target_squares += float(target[train_rows] @ target[train_rows])
+        rows_train += int(train_rows.sum())
+
+    coef = solve(gram, moment, scales, powers)
+    uncertainty = residual_stats(gram, moment, target_squares, rows_train, scales, powers, coef)
+    fit_seconds = time.perf_counter() - start
+
+    model = model_artifact.ArtifactModel(
+        {"feature_names": list(FEATURE_COLUMNS)}, [model_artifact.PolynomialStep(powers)],
+        model_artifact.LinearStep(coef, 0.0),
+    )
+    errors, squares, targets, target_squares, rows_test = 0.0, 0.0, 0.0, 0.0, 0
+    for rows, features, target in _labelled_batches(parquet_path, encoders, batch_rows):
+        test_rows = is_test[rows]
+        residual = model.predict(features[test_rows]) - target[test_rows]
+        errors += np.abs(residual).sum()
+        squares += residual @ residual
+        targets += target[test_rows].sum()
+        target_squares += target[test_rows] @ target[test_rows]
+        rows_test += int(test_rows.sum())
+    total = target_squares - targets ** 2 / rows_test if rows_test else 0.0
+
+    manifest = write_model(powers, coef, schema, output,
+                           source=f"train.py on {Path(csv_path).name} ({dataset_version[:12]})", residual=uncertainty)
+    return TrainingReport(
+        rows_train=rows_train,
+        rows_test=rows_test,
+        fit_seconds=fit_seconds,
+        peak_mib=peak_rss_mib(),
+        mae=errors / rows_test if rows_test else float("nan"),
+        rmse=math.sqrt(squares / rows_test) if rows_test else float("nan"),
+        r2=1 - squares / total if total else float("nan"),
+        manifest=manifest,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", type=Path, default=DATA_PATH)
+    parser.add_argument("--output", type=Path, default=model_artifact.ARTIFACT_PATH)
+    parser.add_argument("--degree", type=int, default=DEGREE)
+    parser.add_argument("--test-size", type=float, default=TEST_SIZE)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS)
+    args = parser.parse_args()
+
+    if not args.data.exists():
+        raise SystemExit(f"Dataset not found: {args.data}")
+    report = train(args.data, args.output, args.degree, args.test_size, args.seed, args.batch_rows)
+    peak = f" (peak RSS {report.peak_mib:,.0f} MiB)" if report.peak_mib is not None else ""
+    print(f"Trained on {report.rows_train:,} rows in {report.fit_seconds:.2f} s{peak}; "
+          f"wrote {args.output} (sha256 {report.manifest['sha256'][:12]})")
+    print(f"Holdout ({report.rows_test:,} rows): MAE {report.mae:.4f}  RMSE {report.rmse:.4f}  R² {report.r2:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,74 @@
-"""Utility to re-serialize the regression model with the currently installed scikit-learn version.
+"""Convert the pickled regression model into the pickle-free artifact the app loads.
 
-Run once whenever the environment upgrades scikit-learn to avoid InconsistentVersionWarning during app startup.
+Run once whenever ``regression_model.pkl`` is retrained. The pickle is read with the currently
+installed scikit-learn (``InconsistentVersionWarning`` suppressed) and written as
+``regression_model.json`` plus ``regression_model.bin``, which load without sklearn or
+unpickling. The pair is written to a staging directory next to the output first and only
+moved into place once it predicts like the pickle, so the hot-reload registry never sees a
+bad conversion. The pickle carries no
+encoders, so the feature schema is rebuilt from the dataset it was trained on (``--data``)
+the same way ``train.py`` builds it: sorted categories, as ``LabelEncoder`` assigns codes.
 """
 
 from __future__ import annotations
 
+import argparse
+import os
 import pickle
+import shutil
 import warnings
 from pathlib import Path
 
-from sklearn import __version__ as sklearn_version  # noqa: F401
+import numpy as np
+import pandas as pd
 from sklearn.exceptions import InconsistentVersionWarning
 
+import data_store
+import model_artifact
+import train
+
 BASE_DIR = Path(__file__).resolve().parent
 MODEL_PATH = BASE_DIR / "regression_model.pkl"
 
-if not MODEL_PATH.exists():
-    raise SystemExit(f"Model file not found: {MODEL_PATH}")
 
-with warnings.catch_warnings():
-    warnings.filterwarnings("ignore", category=InconsistentVersionWarning)
-    with MODEL_PATH.open("rb") as model_file:
-        pipeline = pickle.load(model_file)
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", type=Path, default=MODEL_PATH)
+    parser.add_argument("--output", type=Path, default=model_artifact.ARTIFACT_PATH)
+    parser.add_argument("--data", type=Path, default=train.DATA_PATH, help="Table the pickle was trained on")
+    args = parser.parse_args()
+
+    if not args.model.exists():
+        raise SystemExit(f"Model file not found: {args.model}")
+    schema, _ = train.fit_schema(data_store.ensure_cache(args.data)[0])
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=InconsistentVersionWarning)
+        with args.model.open("rb") as model_file:
+            pipeline = pickle.load(model_file)
+
+    # Same directory, so the final moves are renames on one filesystem.
+    staging = args.output.parent / f".{args.output.stem}.{os.getpid()}.staging"
+    staged = staging / args.output.name
+    try:
+        manifest = model_artifact.export_artifact(pipeline, staged, source=args.model.name, schema=schema)
+        # Check the round trip on random inputs before anyone can load the new files.
+        probe = np.random.default_rng(0).uniform(0, 5_000, (256, len(manifest["feature_names"])))
+        expected = pipeline.predict(pd.DataFrame(probe, columns=manifest["feature_names"]))
+        actual = model_artifact.load_artifact(staged).predict(probe)
+        if not np.allclose(actual, expected, rtol=1e-9, atol=1e-6):
+            raise SystemExit(
+                f"Exported artifact disagrees with {args.model.name}; max error {np.abs(actual - expected).max()}"
+            )
+        # The array file goes first so the live manifest never points at data it does not describe.
+        os.replace(model_artifact.data_path_for(staged), model_artifact.data_path_for(args.output))
+        os.replace(staged, args.output)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    print(f"Model exported with scikit-learn {manifest['sklearn_version']} to {args.output} "
+          f"and {model_artifact.data_path_for(args.output).name} (sha256 {manifest['sha256'][:12]})")
 
-with MODEL_PATH.open("wb") as model_file:
-    pickle.dump(pipeline, model_file)
 
-print(f"Model re-serialized with scikit-learn {sklearn_version}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""What-if sensitivity sweeps: a whole Area x Floor x Bedroom grid priced in one model call.
+
+The prediction lab's scenario builder prices one point per submit. ``sweep`` instead
+expands the three axes into their Cartesian product, prices it with a single
+``predictor.predict_batch`` call and keeps the result as a dense (areas, floors, bedrooms)
+cube. The price surface and the marginal curves through a baseline scenario are then
+plain slices of that cube, so exploring them never calls the model again.
+
+    python what_if.py [--area 500 5000 300] [--floors -1 55] [--bedrooms 1 2 3 4 5 6] [--at 1200 5 2]
+                      [--region NAME] [--rate RATE_SQFT]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+import predictor
+
+AREA_POINTS = 100
+MAX_GRID_POINTS = 2_000_000
+AXES = predictor.SCENARIO_COLUMNS
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    areas: np.ndarray
+    floors: np.ndarray
+    bedrooms: np.ndarray
+    prices: np.ndarray
+    seconds: float
+
+    @property
+    def size(self) -> int:
+        return self.prices.size
+
+    def nearest(self, area_sqft: float, floor_no: float, bedroom: float) -> tuple[int, int, int]:
+        """Grid indices of the point closest to the given scenario on every axis."""
+        return tuple(int(np.abs(axis - value).argmin())
+                     for axis, value in zip((self.areas, self.floors, self.bedrooms), (area_sqft, floor_no, bedroom)))
+
+    def surface(self, bedroom: float, max_areas: int | None = None) -> pd.DataFrame:
+        """Price by area (rows) and floor (columns) at the swept bedroom count nearest ``bedroom``.
+
+        ``max_areas`` strides the area axis down for display; the end points are kept.
+        """
+        layer = int(np.abs(self.bedrooms - bedroom).argmin())
+        rows = np.arange(len(self.areas))
+        if max_areas and len(rows) > max_areas:
+            rows = np.unique(np.linspace(0, len(rows) - 1, max_areas).round().astype(int))
+        return pd.DataFrame(self.prices[rows, :, layer],
+                            index=pd.Index(self.areas[rows], name=AXES[0]),
+                            columns=pd.Index(self.floors, name=AXES[1]))
+
+    def curves(self, area_sqft: float, floor_no: float, bedroom: float) -> dict[str, pd.Series]:
+        """Price along each axis with the other two held at the grid point nearest the scenario."""
+        a, f, b = self.nearest(area_sqft, floor_no, bedroom)
+        return {
+            AXES[0]: pd.Series(self.prices[:, f, b], index=pd.Index(self.areas, name=AXES[0]), name="Price_Lakh"),
+            AXES[1]: pd.Series(self.prices[a, :, b], index=pd.Index(self.floors, name=AXES[1]), name="Price_Lakh"),
+            AXES[2]: pd.Series(self.prices[a, f, :], index=pd.Index(self.bedrooms, name=AXES[2]), name="Price_Lakh"),
+        }
+
+    def frame(self) -> pd.DataFrame:
+        """Long format: one row per grid point with the ``SCENARIO_COLUMNS`` and its price."""
+        return pd.DataFrame(grid_scenarios(self.areas, self.floors, self.bedrooms),
+                            columns=list(AXES)).assign(Predicted_Price_Lakh=self.prices.ravel())
+
+
+def area_axis(low: float, high: float, points: int = AREA_POINTS) -> np.ndarray:
+    return np.linspace(float(low), float(high), max(int(points), 1))
+
+
+def grid_scenarios(areas, floors, bedrooms) -> np.ndarray:
+    """(n, 3) scenario matrix of the Cartesian product, area-major, in ``SCENARIO_COLUMNS`` order."""
+    axes = [np.asarray(axis, dtype=float).ravel() for axis in (areas, floors, bedrooms)]
+    grid = np.empty((len(axes[0]), len(axes[1]), len(axes[2]), 3))
+    for position, mesh in enumerate(np.meshgrid(*axes, indexing="ij", sparse=True)):
+        grid[..., position] = mesh
+    return grid.reshape(-1, 3)
+
+
+def sweep(model, areas, floors, bedrooms, fixed: Mapping[str, object] | None = None,
+          max_points: int = MAX_GRID_POINTS) -> SweepResult:
+    """Price every (area, floor, bedroom) combination with one ``predict_batch`` call.
+
+    ``fixed`` sets the model's other inputs (region, age, area type, rate) for the whole grid.
+    """
+    axes = [np.unique(np.asarray(axis, dtype=float).ravel()) for axis in (areas, floors, bedrooms)]
+    if any(not len(axis) for axis in axes):
+        raise ValueError("Every sweep axis needs at least one value")
+    points = int(np.prod([len(axis) for axis in axes]))
+    if points > max_points:
+        raise ValueError(f"Sweep of {points:,} points exceeds {max_points:,}")
+    start = time.perf_counter()
+    prices = np.asarray(predictor.predict_batch(model, grid_scenarios(*axes), fixed), dtype=float)
+    return SweepResult(*axes, prices.reshape([len(axis) for axis in axes]), time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--area", type=float, nargs=3, default=[500, 5000, 300], metavar=("LOW", "HIGH", "POINTS"))
+    parser.add_argument("--floors", type=int, nargs=2, default=[-1, 55], metavar=("LOW", "HIGH"))
+    parser.add_argument("--bedrooms", type=float, nargs="+", default=[1, 2, 3, 4, 5, 6])
+    parser.add_argument("--at", type=float, nargs=3, default=[1200, 5, 2], metavar=tuple(AXES),
+                        help="Scenario the marginal curves pass through")
+    parser.add_argument("--region", help="Region for the whole grid (default: the model's schema default)")
+    parser.add_argument("--rate", type=float, help="Rate_SqFt for the whole grid")
+    args = parser.parse_args()
+
+    result = sweep(predictor.current_model().model, area_axis(*args.area),
+                   np.arange(args.floors[0], args.floors[1] + 1), args.bedrooms,
+                   fixed={"Region": args.region, "Rate_SqFt": args.rate})
+    print(f"Priced {result.size:,} scenarios in {result.seconds * 1e3:.1f} ms")
+    with pd.option_context("display.float_format", "{:,.2f}".format):
+        for name, curve in result.curves(*args.at).items():
+            print(f"\n{name} (others at the grid point nearest {args.at}):")
+            print(curve.describe()[["min", "50%", "max"]].to_string())
+
+
+if __name__ == "__main__":
+    main()